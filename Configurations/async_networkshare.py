@@ -0,0 +1,147 @@
+import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from Configurations.networkshare import NetworkShare
+
+
+class AsyncNetworkShare():
+    """
+    Async facade over NetworkShare, so all machines can be read at once without one slow VM stalling the others.
+    The blocking SMB calls run on a shared pool of ASYNC_SHARE_WORKERS threads (default 16).
+
+    An operation first waits for a slot of its machine (MAX_CONNECTIONS_PER_HOST, default 4) and then for one of
+    the MAX_REMOTE_OPERATIONS global slots (default 16), both without holding a thread. The requests of a slow
+    machine queue up behind its own slots, the other machines keep the pool.
+
+    The semaphores belong to the event loop of the first operation, use one instance per loop.
+    """
+
+    # Shared by all instances, see getExecutor
+    executor = None
+    executorLock = threading.Lock()
+
+    def __init__(self, networkShare=None):
+        self.networkShare = networkShare if networkShare is not None else NetworkShare()
+        self.hostLimit = int(os.getenv("MAX_CONNECTIONS_PER_HOST", 4))
+        self.globalLimit = int(os.getenv("MAX_REMOTE_OPERATIONS", 16))
+        self.globalSemaphore = asyncio.Semaphore(self.globalLimit)
+        self.hostSemaphores = {}  # machine -> asyncio.Semaphore
+
+
+    @classmethod
+    def getExecutor(cls):
+        """
+        Returns:
+            ThreadPoolExecutor: The pool the blocking calls run on, shared by all instances.
+        """
+        with cls.executorLock:
+            if cls.executor is None:
+                cls.executor = ThreadPoolExecutor(max_workers=int(os.getenv("ASYNC_SHARE_WORKERS", 16)),
+                                                  thread_name_prefix="AsyncShare")
+            return cls.executor
+
+
+    def getHostSemaphore(self, machine):
+        """
+        Returns:
+            asyncio.Semaphore: The semaphore limiting the parallel operations on one machine.
+        """
+        semaphore = self.hostSemaphores.get(machine)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.hostLimit)
+            self.hostSemaphores[machine] = semaphore
+        return semaphore
+
+
+    async def run(self, machine, function, *args):
+        """
+        Runs a blocking function for a machine on the pool, within the slots of the machine and the global slots.
+
+        Args:
+            machine (str): The identifier of the virtual machine.
+            function (callable): The blocking function.
+            *args: The arguments of the function.
+
+        Returns:
+            The return value of the function.
+
+        Notes:
+            - The function is not wrapped in `NetworkShare.hostSlot`, it may take the slot itself (e.g. ReadFault).
+        """
+        async with self.getHostSemaphore(machine):
+            async with self.globalSemaphore:
+                return await asyncio.get_running_loop().run_in_executor(self.getExecutor(), function, *args)
+
+
+    async def runRemote(self, machine, function, *args):
+        """
+        Like `run`, but also holds `NetworkShare.hostSlot`, so the limit per machine is shared with the blocking readers.
+        Returns None at once, without a thread, if the machine is marked "Offline".
+        """
+        if self.networkShare.vmAccessManager.isOffline(machine):
+            return None
+
+        def call():
+            with self.networkShare.hostSlot(machine):
+                return function(*args)
+        return await self.run(machine, call)
+
+
+    async def readText(self, filepath, machine, encoding=None):
+        """
+        Reads a file of a virtual machine through the file cache of NetworkShare.
+
+        Args:
+            filepath (str): The path to the file.
+            machine (str): The identifier of the virtual machine.
+            encoding (str, optional): The encoding of the file. Defaults to the locale encoding.
+
+        Returns:
+            str: The content of the file, None if it could not be read.
+        """
+        def read():
+            content = self.networkShare.fileCache.read(filepath, lambda: self.networkShare.statFileVMUser(filepath, machine),
+                                                       lambda: self.networkShare.openFileVMUser(filepath, machine, 'rb'))
+            return None if content is None else content.decode(encoding or self.networkShare.fileCache.encoding)
+        return await self.runRemote(machine, read)
+
+
+    async def readRange(self, filepath, machine, offset, length):
+        """
+        Reads a byte range of a file of a virtual machine, e.g. the records of an overview file.
+
+        Args:
+            filepath (str): The path to the file.
+            machine (str): The identifier of the virtual machine.
+            offset (int): The first byte.
+            length (int): The number of bytes, fewer are returned at the end of the file.
+
+        Returns:
+            bytes: The bytes of the range, None if the file could not be opened.
+        """
+        def read():
+            file = self.networkShare.openFileVMUser(filepath, machine, 'rb')
+            if file is None:
+                return None
+            with file:
+                file.seek(offset)
+                return file.read(length)
+        return await self.runRemote(machine, read)
+
+
+    async def stat(self, filepath, machine):
+        """
+        Returns:
+            SMBStatResult: The metadata of a file of a virtual machine, None if it could not be retrieved.
+        """
+        return await self.runRemote(machine, self.networkShare.statFileVMUser, filepath, machine)
+
+
+    async def listdir(self, path, machine):
+        """
+        Returns:
+            list: The names of the entries of a directory of a virtual machine, None if it could not be listed.
+        """
+        return await self.runRemote(machine, self.networkShare.listdirVMUser, path, machine)
@@ -23,6 +23,16 @@ class Change():
         self.praefixControllingStatus = None
 
 
+    def isMachineOffline(self, masch):
+        """
+        Returns:
+            bool: True if the machine is marked "Offline" in the shared health registry, its files are not touched.
+        """
+        if self.share.vmAccessManager.isOffline(masch):
+            print(f"VM {masch} is offline.")
+            return True
+        return False
+
     
     def changePraefix(self, data, masch, praefix):
         """
@@ -41,6 +51,9 @@ class Change():
 
         """
         changeline = []
+        if self.isMachineOffline(masch):
+            self.praefixStatus = False
+            return self.praefixStatus
         try:
             # Check whether Config exists, if not, one should be created.
             with self.share.openFileVMUser(data,masch,"r") as file:
@@ -80,6 +93,9 @@ class Change():
             bool: True if the build version was successfully updated, False if the file was not found.
         """
         changeline = []
+        if self.isMachineOffline(masch):
+            self.buildStatus = False
+            return self.buildStatus
         try:
             # Check whether Config exists, if not, one should be created.
             with self.share.openFileVMUser(data,masch,"r") as file:
@@ -119,6 +135,9 @@ class Change():
             - All lines, whether modified or not, are written back to the file.
         """
         changeline = []
+        if self.isMachineOffline(masch):
+            self.ddStatus = False
+            return self.ddStatus
         try:
             with self.share.openFileVMUser(data,masch,"r") as file:
                 for line in file:
@@ -159,6 +178,9 @@ class Change():
             Exception: If an error occurs during file operations, it prints an error message and returns False.
         """
         changeline = []
+        if self.isMachineOffline(masch):
+            self.mmStatus = False
+            return self.mmStatus
         try:
             with self.share.openFileVMUser(data,masch, "r") as file:
                 for line in file:
@@ -210,6 +232,9 @@ class Change():
             - 'vbdatum      = ': Searches for a date pattern 'dd.mm.yyyy' and replaces the year part.
         """
         changeline = []
+        if self.isMachineOffline(masch):
+            self.yyyyStatus = False
+            return self.yyyyStatus
         try:
             with self.share.openFileVMUser(data,masch, "r") as file:
                 for line in file:
@@ -272,6 +297,9 @@ class Change():
             Exception: If there is an error while reading or writing the file, an exception is caught and an error message is printed.
         """
         changeline = []
+        if self.isMachineOffline(masch):
+            self.categoryStatus = False
+            return self.categoryStatus
         try:
             dataunconverted = data.replace("\\", r"\\")
             with self.share.openFileVMUser(dataunconverted,masch, "r") as file:
@@ -0,0 +1,125 @@
+import os
+import socket
+import threading
+import time
+from smbprotocol.exceptions import SMBConnectionClosed, SMBException, SMBOSError
+
+
+class CircuitBreaker():
+    """
+    Process-wide circuit breaker of one virtual machine, see `get`. After CIRCUIT_FAILURE_THRESHOLD (default 3)
+    connection failures in a row the circuit opens and every call to the machine fails at once. After
+    CIRCUIT_RESET_TIMEOUT seconds (default 30) one call is let through as probe (half open): if it reaches the
+    machine the circuit closes, otherwise it opens again for the next timeout.
+
+    Only failures of the connection count (machine not reachable, connection closed, timeout). Errors the machine
+    answered with (file in use, not found, access denied) show that it is reachable.
+    """
+
+    CLOSED = "Closed"
+    OPEN = "Open"
+    HALF_OPEN = "HalfOpen"
+
+    # Shared by all NetworkShare instances, see get
+    breakers = {}
+    breakersLock = threading.Lock()
+
+    def __init__(self, machine, failureThreshold=None, resetTimeout=None):
+        self.machine = machine
+        self.failureThreshold = failureThreshold or int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", 3))
+        self.resetTimeout = resetTimeout if resetTimeout is not None else float(os.getenv("CIRCUIT_RESET_TIMEOUT", 30))
+        self.state = CircuitBreaker.CLOSED
+        self.failures = 0
+        self.openedAt = 0.0
+        self.lock = threading.Lock()
+
+
+    @classmethod
+    def get(cls, machine):
+        """
+        Args:
+            machine (str): The identifier of the virtual machine.
+
+        Returns:
+            CircuitBreaker: The breaker of the machine, shared by all threads.
+        """
+        with cls.breakersLock:
+            breaker = cls.breakers.get(machine)
+            if breaker is None:
+                breaker = cls(machine)
+                cls.breakers[machine] = breaker
+            return breaker
+
+
+    @staticmethod
+    def isConnectionFailure(error):
+        """
+        Args:
+            error (Exception): The error of a remote call.
+
+        Returns:
+            bool: True if the machine could not be reached, False if the machine answered with the error.
+        """
+        if isinstance(error, (SMBOSError, FileNotFoundError, PermissionError, IsADirectoryError)):
+            return False
+        if isinstance(error, (SMBConnectionClosed, ConnectionError, TimeoutError, socket.timeout)):
+            return True
+        # smbprotocol reports a failed connect as ValueError
+        if isinstance(error, ValueError):
+            return "Failed to connect" in str(error)
+        return isinstance(error, OSError) and not isinstance(error, SMBException)
+
+
+    def allowRequest(self):
+        """
+        Returns:
+            bool: True if the call may go to the machine. In the open state False, except for the one probe after
+            the reset timeout.
+        """
+        with self.lock:
+            if self.state == CircuitBreaker.CLOSED:
+                return True
+            if self.state == CircuitBreaker.OPEN and time.monotonic() - self.openedAt >= self.resetTimeout:
+                # Only this caller probes, the others keep failing fast until it is recorded
+                self.state = CircuitBreaker.HALF_OPEN
+                return True
+            return False
+
+
+    def recordSuccess(self):
+        """The machine answered, closes the circuit."""
+        with self.lock:
+            if self.state != CircuitBreaker.CLOSED:
+                print(f"VM {self.machine} is reachable again.")
+            self.state = CircuitBreaker.CLOSED
+            self.failures = 0
+
+
+    def recordFailure(self):
+        """The machine could not be reached, opens the circuit after `failureThreshold` failures or a failed probe."""
+        with self.lock:
+            self.failures += 1
+            if self.state == CircuitBreaker.HALF_OPEN or self.failures >= self.failureThreshold:
+                if self.state == CircuitBreaker.CLOSED:
+                    print(f"VM {self.machine} is not reachable. Calls fail fast for {self.resetTimeout}s.")
+                self.state = CircuitBreaker.OPEN
+                self.openedAt = time.monotonic()
+
+
+    def record(self, error):
+        """
+        Records the outcome of a call that raised `error`, see `isConnectionFailure`.
+        """
+        if self.isConnectionFailure(error):
+            self.recordFailure()
+        else:
+            self.recordSuccess()
+
+
+    def getState(self):
+        """
+        Returns:
+            str: "Closed", "Open" or "HalfOpen".
+        """
+        with self.lock:
+            return self.state
@@ -0,0 +1,67 @@
+import re
+
+
+class ErrorMatcher():
+    """Finds all error patterns of a line in one scan, using a single regex built once from the pattern list."""
+
+    def __init__(self, patterns):
+        # Keep the order of ERROR_LIST, duplicates are matched only once
+        self.patterns = list(dict.fromkeys(patterns))
+        self.regex = None
+        if self.patterns:
+            self.regex = re.compile(self.buildTrieRegex(self.patterns))
+        # The regex reports the longest pattern at a position, shorter patterns it starts with match as well
+        self.impliedPatterns = {pattern: [other for other in self.patterns if pattern.startswith(other)] for pattern in self.patterns}
+
+
+    @staticmethod
+    def buildTrieRegex(patterns):
+        """
+        Builds a regex from a prefix tree of the patterns, e.g. `\\.(?:\\*|\\+|F|H)\\.` for the four markers.
+        Patterns with a common prefix share one branch, so the cost per position stays flat as the list grows.
+
+        Args:
+            patterns (list): The literal patterns.
+
+        Returns:
+            str: The regex source, preferring the longest pattern at a position.
+        """
+        trie = {}
+        for pattern in patterns:
+            node = trie
+            for char in pattern:
+                node = node.setdefault(char, {})
+            node[''] = True
+
+        def toRegex(node):
+            branches = [re.escape(char) + toRegex(child) for char, child in sorted(node.items()) if char != '']
+            if not branches:
+                return ''
+            if len(branches) == 1 and '' not in node:
+                return branches[0]
+            return '(?:' + '|'.join(branches) + ')' + ('?' if '' in node else '')
+
+        return toRegex(trie)
+
+
+    def match(self, line):
+        """
+        Classifies a line against all error patterns at once.
+
+        Args:
+            line (str): The line to classify.
+
+        Returns:
+            list: The error patterns found in the line, in the order of the pattern list. Empty if none matched.
+        """
+        if self.regex is None:
+            return []
+        match = self.regex.search(line)
+        if match is None:
+            return []
+        found = set()
+        while match is not None:
+            found.update(self.impliedPatterns[match.group()])
+            # Search again one character further, so overlapping patterns are found as well (e.g. ".*.F.")
+            match = self.regex.search(line, match.start() + 1)
+        return [pattern for pattern in self.patterns if pattern in found]
@@ -0,0 +1,38 @@
+from array import array
+
+
+class ErrorRecord():
+    """One failed test case for one error pattern, stored as byte offsets into the uebersicht.txt instead of HTML."""
+
+    __slots__ = ("testCase", "patternId", "start", "end", "lineOffsets")
+
+    def __init__(self, testCase, patternId, start, end, lineOffsets):
+        self.testCase = testCase          # running number of the "Start TF" block in the file
+        self.patternId = patternId        # index of the pattern in ErrorMatcher.patterns
+        self.start = start                # byte offset of the "Start TF" line
+        self.end = end                    # byte offset behind the last matching line
+        self.lineOffsets = array('I', lineOffsets)  # offsets of the matching lines, relative to start
+
+
+    def toHTML(self, blockData, encoding):
+        """
+        Renders the record the way the error pages show it: the "Start TF" line followed by the matching lines.
+
+        Args:
+            blockData (bytes): The bytes of the file from `start` to `end`.
+            encoding (str): The encoding of the file.
+
+        Returns:
+            str: The HTML message, None if the bytes do not start with the "Start TF" line (file was replaced).
+        """
+        if not blockData.startswith(b"Start TF"):
+            return None
+
+        headerEnd = blockData.find(b"\n")
+        parts = [blockData[:headerEnd].decode(encoding, errors="replace").strip() + "<br>"]
+        for offset in self.lineOffsets:
+            lineEnd = blockData.find(b"\n", offset)
+            line = blockData[offset:lineEnd if lineEnd != -1 else len(blockData)]
+            parts.append(line.decode(encoding, errors="replace").strip() + "<br><br>")
+
+        return ''.join(parts).replace("'", "").replace("[", "").replace("]", "")
@@ -1,14 +1,25 @@
 import os
 import subprocess
+import threading
 import time
-import smbclient
 from smbprotocol.exceptions import SMBAuthenticationError, SMBException
 
+from Configurations.circuit_breaker import CircuitBreaker
+from Configurations.remote_file_cache import RemoteFileCache
+from Configurations.smb_session_manager import SMBSessionManager
 from Logic.vm_access_manager import VMAccessManager
 
 class NetworkShare():
+    # Shared by all instances: one semaphore per virtual machine, see hostSlot
+    hostSlots = {}
+    hostSlotsLock = threading.Lock()
+
     def __init__(self):
         self.vmAccessManager = VMAccessManager()
+        # One pooled session per server and user, shared by all instances
+        self.sessionManager = SMBSessionManager.shared()
+        # Small files that are read again and again, validated by size and mtime
+        self.fileCache = RemoteFileCache.shared()
         # Drive letter for the network share
         self.usernameNetwork = os.getenv("NETWORK_USERNAME")
         self.passwordNetwork = os.getenv("Network_PASSWORD")
@@ -19,6 +30,8 @@ class NetworkShare():
         self.maschLogin = {}
         self.netDrive = os.getenv("NET_DRIVE")
         self.retry_attemptsListOfVMs = {}
+        # Total time one call may spend retrying a file that is used by another process
+        self.callDeadline = float(os.getenv("VM_CALL_DEADLINE", 30))
 
     def openFileVMUser(self, filepath, machine, mode):
         """
@@ -34,47 +47,154 @@ class NetworkShare():
         SMBException: Raised for other SMB-related errors.
         Exception: Raised for any other exceptions.
         Notes:
-        - The function will retry opening the file up to `max_retry` times with exponential backoff.
-        - If the virtual machine is offline, the function will print a message and return None.
-        - If the file is being used by another process, the function will retry opening the file.
+        - If the virtual machine is offline or its circuit breaker is open, the function returns None at once.
+        - If the file is being used by another process, the function retries with exponential backoff until
+          `self.callDeadline` seconds (VM_CALL_DEADLINE, default 30) have passed since the call.
+        - Every outcome is recorded in the circuit breaker of the machine, see CircuitBreaker.
         - The retry attempts are recorded in `self.retry_attemptsListOfVMs`.
         """
-        max_retry = 10
         wait_time = 1  # in seconds
+        deadline = time.monotonic() + self.callDeadline
+        self.invalidateCachedFile(filepath, mode)
         
-        if self.vmAccessManager.getStatus(machine) == "Offline":
+        if self.vmAccessManager.isOffline(machine):
             print(f"VM {machine} is offline.")
             return None
 
-        for attempt in range(max_retry):
+        breaker = CircuitBreaker.get(machine)
+        attempt = 0
+        while breaker.allowRequest():
+            start = time.monotonic()
             try:
-                smbclient.ClientConfig(username=self.usernameVM, password=self.passwordVM)
-                file = smbclient.open_file(filepath, mode=mode)
+                file = self.sessionManager.openFile(filepath, mode, self.usernameVM, self.passwordVM)
+                self.recordCall(machine, breaker, start)
                 self.retry_attemptsListOfVMs[filepath] = attempt
                 return file
             
-            except SMBAuthenticationError:
+            except SMBAuthenticationError as e:
+                self.recordCall(machine, breaker, start, e)
                 print(f"Failed to open file - SMBAuthenticationError {filepath}: Authentication error.")
                 print(f"{filepath} not accessible. Password or username may be incorrect.")
-                break  
+                return None
 
             except SMBException as e:
+                self.recordCall(machine, breaker, start, e)
                 print(f"Failed to open file - SMBException {filepath}: {e}")
                 if "used by another process" in str(e):
                     print(f"{filepath} being used by another process. Retrying...")
                 else:
-                    break
+                    return None
 
             except Exception as e:
+                self.recordCall(machine, breaker, start, e)
                 print(f"Failed to open file - Exception {filepath}: {e}")
                 if "used by another process" in str(e):
                     print(f"{filepath} being used by another process. Retrying...")
                 else:
-                    break
+                    return None
 
-            # Wait: exponential backoff
-            time.sleep(wait_time)
+            # Wait: exponential backoff within the deadline of the call
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                print(f"{filepath} still being used by another process after {self.callDeadline}s. Giving up.")
+                return None
+            time.sleep(min(wait_time, remaining))
             wait_time *= 2  # double the wait time for each retry
+            attempt += 1
+
+        print(f"VM {machine} is not reachable. Skipping {filepath}.")
+        return None
+
+    def recordCall(self, machine, breaker, start, error=None):
+        """
+        Records the outcome of a remote call in the circuit breaker and the health registry of the machine.
+
+        Args:
+            machine (str): The identifier of the virtual machine.
+            breaker (CircuitBreaker): The breaker of the machine.
+            start (float): time.monotonic() before the call.
+            error (Exception, optional): The error the call raised. Defaults to None (success).
+        """
+        if error is None:
+            breaker.recordSuccess()
+            self.vmAccessManager.recordCall(machine, time.monotonic() - start)
+        else:
+            breaker.record(error)
+            self.vmAccessManager.recordCall(machine, failed=CircuitBreaker.isConnectionFailure(error))
+
+    def hostSlot(self, machine):
+        """
+        Returns the semaphore that limits the parallel remote operations on one virtual machine.
+
+        Args:
+            machine (str): The identifier of the virtual machine.
+
+        Returns:
+            threading.BoundedSemaphore: Use it as context manager around the remote access. The limit is taken from
+            the MAX_CONNECTIONS_PER_HOST environment variable (default 4) and shared by all NetworkShare instances.
+        """
+        with NetworkShare.hostSlotsLock:
+            slot = NetworkShare.hostSlots.get(machine)
+            if slot is None:
+                slot = threading.BoundedSemaphore(int(os.getenv("MAX_CONNECTIONS_PER_HOST", 4)))
+                NetworkShare.hostSlots[machine] = slot
+            return slot
+
+    def statFileVMUser(self, filepath, machine):
+        """
+        Retrieves the metadata of a file on a virtual machine without opening it.
+
+        Args:
+            filepath (str): The path to the file.
+            machine (str): The identifier of the virtual machine.
+
+        Returns:
+            SMBStatResult: The stat result (st_size, st_mtime, st_ino, st_ctime, ...), None if it could not be retrieved.
+        """
+        if self.vmAccessManager.isOffline(machine):
+            print(f"VM {machine} is offline.")
+            return None
+
+        breaker = CircuitBreaker.get(machine)
+        if not breaker.allowRequest():
+            return None
+        start = time.monotonic()
+        try:
+            fileStat = self.sessionManager.stat(filepath, self.usernameVM, self.passwordVM)
+            self.recordCall(machine, breaker, start)
+            return fileStat
+        except Exception as e:
+            self.recordCall(machine, breaker, start, e)
+            print(f"Failed to stat file {filepath}: {e}")
+            return None
+
+    def listdirVMUser(self, path, machine):
+        """
+        Lists a directory on a virtual machine.
+
+        Args:
+            path (str): The path to the directory.
+            machine (str): The identifier of the virtual machine.
+
+        Returns:
+            list: The names of the entries, None if the directory could not be listed.
+        """
+        if self.vmAccessManager.isOffline(machine):
+            print(f"VM {machine} is offline.")
+            return None
+
+        breaker = CircuitBreaker.get(machine)
+        if not breaker.allowRequest():
+            return None
+        start = time.monotonic()
+        try:
+            entries = self.sessionManager.listdir(path, self.usernameVM, self.passwordVM)
+            self.recordCall(machine, breaker, start)
+            return entries
+        except Exception as e:
+            self.recordCall(machine, breaker, start, e)
+            print(f"Failed to list directory {path}: {e}")
+            return None
 
     def openFileNetworkUser(self, filepath, mode):
         """
@@ -90,9 +210,9 @@ class NetworkShare():
         Raises:
             Exception: If there is an error opening the file, an exception is raised with an error message.
         """
+        self.invalidateCachedFile(filepath, mode)
         try:
-            smbclient.ClientConfig(username=self.usernameNetwork, password=self.passwordNetwork)
-            return smbclient.open_file(filepath, mode=mode)
+            return self.sessionManager.openFile(filepath, mode, self.usernameNetwork, self.passwordNetwork)
         except Exception as e:
             print(f"Failed to open file {filepath}: {e}")
         
@@ -100,8 +220,8 @@ class NetworkShare():
     def openFileRegisterSession(self, filepath, mode):
         """
         Opens a file on a network share using SMB protocol and returns the file object.
-        This method configures the SMB client with the provided network credentials and 
-        opens the specified file in the given mode.
+        This method opens the specified file in the given mode over the pooled session of the
+        network user (see SMBSessionManager).
         Args:
             filepath (str): The path to the file on the network share.
             mode (str): The mode in which to open the file (e.g., 'r' for read, 'w' for write).
@@ -110,8 +230,62 @@ class NetworkShare():
         Raises:
             SMBException: If there is an error opening the file.
         """
-        smbclient.ClientConfig(username=self.usernameNetwork, password=self.passwordNetwork)
-        return smbclient.open_file(filepath, mode=mode)
+        self.invalidateCachedFile(filepath, mode)
+        return self.sessionManager.openFile(filepath, mode, self.usernameNetwork, self.passwordNetwork)
+
+
+    def openCachedFileVMUser(self, filepath, machine):
+        """
+        Reads a small file of a virtual machine through the file cache, see RemoteFileCache.
+
+        Args:
+            filepath (str): The path to the file.
+            machine (str): The identifier of the virtual machine.
+
+        Returns:
+            io.StringIO: The content in text mode, use it like a file opened with 'r'. None if it could not be read.
+        """
+        return self.fileCache.readText(filepath, lambda: self.statFileVMUser(filepath, machine),
+                                       lambda: self.openFileVMUser(filepath, machine, 'rb'))
+
+
+    def openCachedFileRegisterSession(self, filepath):
+        """
+        Reads a small file of the network share through the file cache, see `openFileRegisterSession`.
+
+        Returns:
+            io.StringIO: The content in text mode, use it like a file opened with 'r'.
+
+        Raises:
+            SMBException: If there is an error opening the file.
+        """
+        return self.fileCache.readText(filepath, lambda: self.sessionManager.stat(filepath, self.usernameNetwork, self.passwordNetwork),
+                                       lambda: self.openFileRegisterSession(filepath, 'rb'))
+
+
+    def openCachedFile(self, filepath, encoding=None):
+        """
+        Reads a small file that is opened by the operating system (mapped drive or local resource) through the file cache.
+
+        Args:
+            filepath (str): The path to the file.
+            encoding (str, optional): The encoding of the file. Defaults to the locale encoding.
+
+        Returns:
+            io.StringIO: The content in text mode, use it like a file opened with 'r'.
+
+        Raises:
+            OSError: If the file does not exist or cannot be read.
+        """
+        return self.fileCache.readText(filepath, lambda: os.stat(filepath), lambda: open(filepath, 'rb'), encoding)
+
+
+    def invalidateCachedFile(self, filepath, mode):
+        """
+        Removes a file from the file cache if it is opened for writing.
+        """
+        if any(flag in mode for flag in "wax+"):
+            self.fileCache.invalidate(filepath)
 
 
     def checkExistingConnection(self):
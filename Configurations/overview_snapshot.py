@@ -0,0 +1,35 @@
+class OverviewSnapshot():
+    """
+    The state of one uebersicht.txt after a single refresh, taken once per change of the file. Every step that
+    updates the report for this change reads from the snapshot instead of opening the file again.
+    """
+
+    def __init__(self, masch, category, path, expectedTotal, lastTestCaseNumber, startedTests, errors, generation=0):
+        self.masch = masch
+        self.category = category
+        self.path = path
+        self.expectedTotal = expectedTotal            # number of test cases of the category (JSON / QTP_Test.ini)
+        self.lastTestCaseNumber = lastTestCaseNumber  # highest X of "(X von expectedTotal)", 0 if none was started
+        self.startedTests = startedTests              # number of "Start TF" lines in the file
+        self.errors = errors                          # error pattern -> list of ErrorRecord
+        self.counts = {pattern: len(records) for pattern, records in errors.items()}
+        # Changes when a pattern got new records or the file was read again from the start, see RenderTracker
+        self.versions = {pattern: (generation, count) for pattern, count in self.counts.items()}
+        self.messages = {}                            # (error pattern, start, stop) -> rendered HTML messages, see ReadFault.renderErrorMessages
+
+
+    @property
+    def completed(self):
+        """True if the last test case of the category was started, like `ReadCountedTestcase.allTestCasesCompleted`."""
+        return self.lastTestCaseNumber == self.expectedTotal
+
+
+    def hasErrors(self, errorPattern):
+        """
+        Args:
+            errorPattern (str): The error pattern.
+
+        Returns:
+            bool: True if at least one test case failed with the pattern.
+        """
+        return bool(self.errors.get(errorPattern))
@@ -0,0 +1,154 @@
+import locale
+import re
+
+
+# "Start TF: <name> (<number> von <total>)". The name is greedy, so the last "(X von Y)" of the line counts,
+# a name that contains one itself does not change the numbers (as the former 'Start TF: .+ \((\d+) von Y\)')
+START_PATTERN = re.compile(r"Start TF:\s*(.*)\((\d+) von (\d+)\)")
+
+# Bytes fetched from the share per read, the memory used by a scan does not grow with the file
+CHUNK_SIZE = 64 * 1024
+
+
+class TestCaseBlock():
+    """One "Start TF" block of an uebersicht.txt, from its "Start TF" line up to the "Ende  TF" line."""
+
+    __slots__ = ("index", "number", "total", "name", "startLine", "endLine", "start", "end", "matches", "matchEnds", "complete")
+
+    def __init__(self, index, number, total, name, startLine, start):
+        self.index = index                # running number of the "Start TF" line in the file, starting at 1
+        self.number = number              # X of "(X von Y)", None if the line has no such part
+        self.total = total                # Y of "(X von Y)", None if the line has no such part
+        self.name = name                  # the test case name between "Start TF:" and "(X von Y)"
+        self.startLine = startLine        # line number of the "Start TF" line, starting at 1
+        self.endLine = startLine          # line number of the last line of the block
+        self.start = start                # byte offset of the "Start TF" line
+        self.end = start                  # byte offset behind the last line of the block
+        self.matches = {}                 # error pattern -> offsets of the matching lines, relative to start
+        self.matchEnds = {}               # error pattern -> byte offset behind the last matching line
+        self.complete = False             # True once the "Ende  TF" line was read
+
+
+    @property
+    def patterns(self):
+        """The error patterns found in the block, in the order they were first matched."""
+        return list(self.matches)
+
+
+class TestCaseBlockParser():
+    """
+    Splits the lines of an uebersicht.txt into TestCaseBlock objects. The parser keeps the open block and the position
+    between the calls, so it can continue with the bytes appended to the file later on.
+    """
+
+    def __init__(self, errorMatcher=None, counter=0, offset=0, lineNumber=0):
+        self.errorMatcher = errorMatcher
+        self.counter = counter            # number of "Start TF" lines seen so far
+        self.offset = offset              # byte offset behind the last line fed in
+        self.lineNumber = lineNumber      # number of lines fed in, counted from where the parser started
+        self.current = None               # the block that is still open
+
+
+    def feed(self, line, lineStart, lineEnd):
+        """
+        Feeds one line into the block that is currently open.
+
+        Args:
+            line (str): One line of the uebersicht.txt.
+            lineStart (int): The byte offset of the line in the file.
+            lineEnd (int): The byte offset behind the line (including the line break).
+
+        Returns:
+            TestCaseBlock: The block finished by this line, None if no block was finished. A block followed by
+            another "Start TF" line without "Ende  TF" is returned with `complete` False.
+        """
+        self.lineNumber += 1
+        self.offset = lineEnd
+        finished = None
+
+        if line.startswith("Start TF"):
+            finished = self.current
+            self.counter += 1
+            match = START_PATTERN.search(line)
+            if match:
+                self.current = TestCaseBlock(self.counter, int(match.group(2)), int(match.group(3)), match.group(1).strip(), self.lineNumber, lineStart)
+            else:
+                self.current = TestCaseBlock(self.counter, None, None, line[len("Start TF"):].lstrip(":").strip(), self.lineNumber, lineStart)
+            self.current.end = lineEnd
+        elif self.current is not None:
+            block = self.current
+            block.endLine = self.lineNumber
+            block.end = lineEnd
+            if line.startswith("Ende  TF"):
+                block.complete = True
+                finished = block
+                self.current = None
+            elif self.errorMatcher is not None:
+                for errorPattern in self.errorMatcher.match(line):
+                    block.matches.setdefault(errorPattern, []).append(lineStart - block.start)
+                    block.matchEnds[errorPattern] = lineEnd
+        return finished
+
+
+    def flush(self):
+        """
+        Closes the block that is still open, e.g. at the end of the file.
+
+        Returns:
+            TestCaseBlock: The open block with `complete` False, None if no block is open.
+        """
+        block = self.current
+        self.current = None
+        return block
+
+
+def iterTestCaseBlocks(file, errorMatcher=None, parser=None, chunkSize=CHUNK_SIZE, encoding=None, untilEnd=True):
+    """
+    Yields the test case blocks of an uebersicht.txt while reading it chunk by chunk.
+
+    Args:
+        file: The overview file opened in binary mode, read from its current position.
+        errorMatcher (ErrorMatcher, optional): Matches the error patterns of each line. Defaults to None (no matching).
+        parser (TestCaseBlockParser, optional): Continues the state of an earlier scan. Defaults to a new parser
+            starting at byte 0.
+        chunkSize (int, optional): The bytes read per call. Defaults to CHUNK_SIZE.
+        encoding (str, optional): The encoding of the file. Defaults to the locale encoding, like text mode on the share.
+        untilEnd (bool, optional): If True, a last line without line break is parsed and the block still open at the
+            end of the file is yielded with `complete` False. If False, both are left to a later scan with the same
+            parser. Defaults to True.
+
+    Yields:
+        TestCaseBlock: The blocks in file order. Only the current chunk and the open block are held in memory.
+    """
+    if parser is None:
+        parser = TestCaseBlockParser(errorMatcher)
+    if encoding is None:
+        encoding = locale.getpreferredencoding(False)
+
+    rest = b""
+    lineStart = parser.offset
+    while True:
+        chunk = file.read(chunkSize)
+        if not chunk:
+            break
+        data = rest + chunk
+        lastNewline = data.rfind(b"\n")
+        if lastNewline == -1:
+            rest = data
+            continue
+        rest = data[lastNewline + 1:]
+        for rawLine in data[:lastNewline].split(b"\n"):
+            lineEnd = lineStart + len(rawLine) + 1
+            block = parser.feed(rawLine.decode(encoding, errors="replace"), lineStart, lineEnd)
+            lineStart = lineEnd
+            if block is not None:
+                yield block
+
+    if untilEnd:
+        if rest:
+            block = parser.feed(rest.decode(encoding, errors="replace"), lineStart, lineStart + len(rest))
+            if block is not None:
+                yield block
+        block = parser.flush()
+        if block is not None:
+            yield block
@@ -0,0 +1,264 @@
+import locale
+import threading
+
+from Configurations.error_matcher import ErrorMatcher
+from Configurations.error_record import ErrorRecord
+from Configurations.overview_snapshot import OverviewSnapshot
+from Configurations.overview_stream import TestCaseBlockParser, iterTestCaseBlocks
+from Configurations.progress_tracker import ProgressTracker
+
+
+class OverviewTailReader():
+
+    def __init__(self, networkShare, errorList, errorMatcher=None, resultsIndex=None, indexKey=None, progress=None):
+        self.networkShare = networkShare
+        self.resultsIndex = resultsIndex if indexKey is not None else None
+        self.indexKey = indexKey
+        self.errorList = errorList or []
+        self.errorMatcher = errorMatcher if errorMatcher is not None else ErrorMatcher(errorList)
+        self.patternIds = {pattern: patternId for patternId, pattern in enumerate(self.errorMatcher.patterns)}
+        # Text mode on the share decodes with the locale encoding, the raw bytes are decoded the same way
+        self.encoding = locale.getpreferredencoding(False)
+        # Records read close to each other are fetched with one read when rendering
+        self.maxRenderRead = 1024 * 1024
+        # The watcher, status and report threads may refresh the same category at the same time
+        self.lock = threading.Lock()
+        # Counts the resets, records of an earlier generation may be gone although the counts are equal
+        self.generation = 0
+        # Highest test case number per announced total ("X von Y"), shared with the waiting threads. Only reset
+        # when the file was replaced, see `discard`
+        self.progress = progress if progress is not None else ProgressTracker(None, None)
+        self.reset()
+        if self.resultsIndex is not None:
+            self.restore()
+
+
+    def reset(self, filepath=None):
+        """
+        Forgets everything that was parsed so far, the next refresh reads the file from byte 0.
+
+        Args:
+            filepath (str, optional): The path of the overview file the reader is bound to. Defaults to None.
+        """
+        self.filepath = filepath
+        self.identity = None
+        self.generation += 1
+        self.parser = TestCaseBlockParser(self.errorMatcher)
+        self.newRecords = []
+        self.progressChanged = False
+        self.errors = {pattern: [] for pattern in self.errorList}
+        self.counts = {pattern: 0 for pattern in self.errorList}
+
+
+    def restore(self):
+        """
+        Continues from the read position and the error records stored in the results index (warm start).
+        A half-finished block was stored without its errors, the stored position points before it.
+        """
+        loaded = self.resultsIndex.loadCategory(self.indexKey)
+        if loaded is None:
+            return
+        (self.filepath, offset, self.identity, testCaseCounter), records = loaded
+        self.parser = TestCaseBlockParser(self.errorMatcher, testCaseCounter, offset)
+        self.progress.restore(self.resultsIndex.loadProgress(self.indexKey))
+        for testCase, start, end, errorPattern, lineOffsets in records:
+            if errorPattern in self.errors and errorPattern in self.patternIds:
+                self.errors[errorPattern].append(ErrorRecord(testCase, self.patternIds[errorPattern], start, end, lineOffsets))
+                self.counts[errorPattern] += 1
+
+
+    def discard(self, filepath):
+        """
+        Resets the reader and its progress and removes what the results index stored for it, used when the file
+        was replaced.
+
+        Args:
+            filepath (str): The path of the overview file the reader is bound to.
+        """
+        self.reset(filepath)
+        self.progress.reset()
+        if self.resultsIndex is not None:
+            self.resultsIndex.clearCategory(self.indexKey)
+
+
+    def save(self):
+        """
+        Writes the read position and the records parsed since the last save to the results index.
+        """
+        if self.resultsIndex is None:
+            return
+        if self.parser.current is not None:
+            # Read the half-finished block again after a restart
+            state = (self.filepath, self.parser.current.start, self.identity, self.parser.counter - 1)
+        else:
+            state = (self.filepath, self.parser.offset, self.identity, self.parser.counter)
+        progress = self.progress.getLastNumbers() if self.progressChanged else None
+        self.resultsIndex.saveCategory(self.indexKey, state, self.newRecords, self.errorMatcher.patterns, progress)
+        self.newRecords = []
+        self.progressChanged = False
+
+
+    def refresh(self, filepath, masch):
+        """
+        Parses the bytes appended to an uebersicht.txt since the last refresh and merges them into `self.errors`.
+        Args:
+            filepath (str): The path to the uebersicht.txt of one category.
+            masch (str): The machine identifier.
+        Returns:
+            dict: The errors of the category, one list of ErrorRecord per error pattern.
+        Notes:
+            - The byte offset, the identity of the file (file id and creation time) and a half-finished
+              "Start TF" block are kept between the calls.
+            - If the file was replaced or truncated, the state is reset and the file is read again from byte 0.
+            - With a results index, the new records and the read position are stored after each refresh.
+            - Only complete lines are consumed, a partly written last line is read again on the next refresh.
+        """
+        with self.lock:
+            return self.readAppended(filepath, masch)
+
+
+    def takeSnapshot(self, filepath, masch, category, expectedTotal):
+        """
+        Refreshes the reader and captures the result, so the rest of a change event does not read the file again.
+        Args:
+            filepath (str): The path to the uebersicht.txt of the category.
+            masch (str): The machine identifier.
+            category (str): The category of the file.
+            expectedTotal (int): The number of test cases of the category.
+        Returns:
+            OverviewSnapshot: The last test case number, the started tests and the error records after the refresh.
+        """
+        with self.lock:
+            self.readAppended(filepath, masch)
+            return OverviewSnapshot(masch, category, filepath, expectedTotal, self.getLastTestCaseNumber(expectedTotal),
+                                    self.parser.counter, {pattern: list(records) for pattern, records in self.errors.items()},
+                                    self.generation)
+
+
+    def getLastTestCaseNumber(self, total):
+        """
+        Returns the highest X of the "Start TF: ... (X von Y)" lines read so far, including the running test case.
+        Args:
+            total (int): Y, the number of test cases of the category.
+        Returns:
+            int: The highest X, 0 if no test case with this total was started.
+        """
+        return self.progress.getLastTestCaseNumber(total)
+
+
+    def readAppended(self, filepath, masch):
+        """
+        Reads and parses the appended bytes, see `refresh`. The caller holds `self.lock`.
+        """
+        if self.filepath is None:
+            # First refresh of a reader without stored state, the rows of the results index are kept
+            self.reset(filepath)
+        elif filepath != self.filepath:
+            self.discard(filepath)
+
+        fileStat = self.networkShare.statFileVMUser(filepath, masch)
+        if fileStat is not None:
+            identity = (fileStat.st_ino, fileStat.st_ctime)
+            if self.identity is not None and (identity != self.identity or fileStat.st_size < self.parser.offset):
+                print(f"{filepath} was replaced or truncated. Reading it again.")
+                self.discard(filepath)
+            self.identity = identity
+
+            # Nothing appended since the last refresh
+            if fileStat.st_size == self.parser.offset:
+                return self.errors
+
+        file = self.networkShare.openFileVMUser(filepath, masch, 'rb')
+        if file is None:
+            return self.errors
+
+        with file:
+            file.seek(0, 2)
+            if file.tell() < self.parser.offset:
+                print(f"{filepath} was truncated. Reading it again.")
+                identity = self.identity
+                self.discard(filepath)
+                self.identity = identity
+            file.seek(self.parser.offset)
+            lastNumbers = {}
+            # A partly written last line and the open block are continued on the next refresh
+            for block in iterTestCaseBlocks(file, parser=self.parser, encoding=self.encoding, untilEnd=False):
+                if block.total is not None and block.number > lastNumbers.get(block.total, 0):
+                    lastNumbers[block.total] = block.number
+                if block.complete:
+                    self.addBlock(block)
+
+        # One update per read, the waiting threads are woken once
+        current = self.parser.current
+        running = (current.total, current.number) if current is not None and current.total is not None else None
+        if self.progress.update(lastNumbers, running):
+            self.progressChanged = True
+
+        self.save()
+        return self.errors
+
+
+    def addBlock(self, block):
+        """
+        Turns the matched lines of a finished test case block into error records, one per pattern.
+
+        Args:
+            block (TestCaseBlock): A block closed by its "Ende  TF" line.
+        """
+        for errorPattern, lineOffsets in block.matches.items():
+            record = ErrorRecord(block.index, self.patternIds[errorPattern], block.start, block.matchEnds[errorPattern], lineOffsets)
+            self.errors[errorPattern].append(record)
+            self.counts[errorPattern] += 1
+            self.newRecords.append(record)
+
+
+    def renderErrors(self, masch, errorPattern, records=None, filepath=None):
+        """
+        Renders the error records of one pattern to HTML, reading the needed byte ranges from the overview file.
+        Args:
+            masch (str): The machine identifier.
+            errorPattern (str): The error pattern whose records are rendered.
+            records (list, optional): The records to render, e.g. those of an OverviewSnapshot. Defaults to all
+                records of the pattern.
+            filepath (str, optional): The overview file the records were read from, e.g. the path of the snapshot.
+                Defaults to the file the reader is bound to.
+        Returns:
+            list: One HTML message per failed test case. Empty if the file could not be opened.
+        Notes:
+            - Records that lie close to each other are fetched with a single read of at most `maxRenderRead` bytes.
+            - Records whose bytes no longer start with "Start TF" (file replaced since the last refresh) are skipped.
+            - The records and the path are taken under `self.lock`, the file is read without it, so a refresh
+              does not wait for the rendering.
+        """
+        if records is None or filepath is None:
+            with self.lock:
+                if records is None:
+                    records = list(self.errors.get(errorPattern, []))
+                if filepath is None:
+                    filepath = self.filepath
+        if not records or filepath is None:
+            return []
+
+        file = self.networkShare.openFileVMUser(filepath, masch, 'rb')
+        if file is None:
+            return []
+
+        messages = []
+        with file:
+            index = 0
+            while index < len(records):
+                # Group the following records into one read
+                groupStart = records[index].start
+                groupEnd = index
+                while groupEnd + 1 < len(records) and records[groupEnd + 1].end - groupStart <= self.maxRenderRead:
+                    groupEnd += 1
+                group = records[index:groupEnd + 1]
+
+                file.seek(groupStart)
+                data = file.read(max(record.end for record in group) - groupStart)
+                for record in group:
+                    message = record.toHTML(data[record.start - groupStart:record.end - groupStart], self.encoding)
+                    if message is not None:
+                        messages.append(message)
+                index = groupEnd + 1
+        return messages
@@ -0,0 +1,116 @@
+import threading
+
+
+class ProgressTracker():
+    """
+    Progress of one category: the highest X of the "Start TF: ... (X von Y)" lines per total Y. It is fed by the
+    OverviewTailReader of the category with the blocks appended since its last read, so a query never reads the file.
+    Threads can wait for the next change instead of reading the file in a loop.
+    """
+
+    def __init__(self, masch, category):
+        self.masch = masch
+        self.category = category
+        self.condition = threading.Condition()
+        self.lastNumbers = {}  # Y -> highest X of the finished blocks
+        self.running = None    # (Y, X) of the block that is still being written
+        self.version = 0       # incremented with every change
+
+
+    def update(self, lastNumbers, running=None):
+        """
+        Merges the blocks of one read and wakes the waiting threads if the progress changed.
+
+        Args:
+            lastNumbers (dict): The highest X per Y of the blocks finished by the read.
+            running (tuple, optional): (Y, X) of the block still open after the read. Defaults to None.
+
+        Returns:
+            bool: True if the highest number of a finished block changed (it has to be stored again).
+        """
+        with self.condition:
+            if running is not None and self.running is not None and running[0] == self.running[0] and running[1] < self.running[1]:
+                # A read that is behind does not move the running test case back
+                running = self.running
+            changed = False
+            for total, number in lastNumbers.items():
+                if number > self.lastNumbers.get(total, 0):
+                    self.lastNumbers[total] = number
+                    changed = True
+            if changed or running != self.running:
+                self.running = running
+                self.version += 1
+                self.condition.notify_all()
+            return changed
+
+
+    def restore(self, lastNumbers):
+        """
+        Args:
+            lastNumbers (dict): The highest X per Y stored in the results index.
+        """
+        with self.condition:
+            self.lastNumbers = dict(lastNumbers)
+            self.version += 1
+            self.condition.notify_all()
+
+
+    def reset(self):
+        """Forgets the progress, e.g. when the overview file was replaced."""
+        with self.condition:
+            self.lastNumbers = {}
+            self.running = None
+            self.version += 1
+            self.condition.notify_all()
+
+
+    def getLastNumbers(self):
+        """
+        Returns:
+            dict: A copy of the highest X per Y of the finished blocks.
+        """
+        with self.condition:
+            return dict(self.lastNumbers)
+
+
+    def getLastTestCaseNumber(self, total):
+        """
+        Returns the highest X of the "Start TF: ... (X von Y)" lines read so far, including the running test case.
+        Args:
+            total (int): Y, the number of test cases of the category.
+        Returns:
+            int: The highest X, 0 if no test case with this total was started.
+        """
+        try:
+            total = int(total)
+        except (TypeError, ValueError):
+            return 0
+        with self.condition:
+            lastNumber = self.lastNumbers.get(total, 0)
+            if self.running is not None and self.running[0] == total and self.running[1] > lastNumber:
+                lastNumber = self.running[1]
+            return lastNumber
+
+
+    def isCompleted(self, total):
+        """
+        Returns:
+            bool: True if the last test case of the total was started, see `getLastTestCaseNumber`.
+        """
+        return self.getLastTestCaseNumber(total) == total
+
+
+    def waitForChange(self, version, timeout=None):
+        """
+        Blocks until the progress changed since `version` was read.
+
+        Args:
+            version (int): The `version` the caller knows.
+            timeout (float, optional): Seconds to wait at most. Defaults to None (no limit).
+
+        Returns:
+            int: The current version, equal to `version` if the timeout expired without a change.
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: self.version != version, timeout)
+            return self.version
@@ -41,7 +41,7 @@ class ReadCategories():
 
         fullPath = os.path.join(basepath, matched_dir, "Test", )
         try:
-            with self.networkShare.openFileVMUser(fullPath,masch, "r") as file:
+            with self.networkShare.openCachedFileVMUser(fullPath, masch) as file:
                 for line in file:
                     if "'public Kategorie:    Kategorie" in line:
                         continue
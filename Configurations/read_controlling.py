@@ -88,7 +88,7 @@ class ReadControlling():
         """ reads the tag from the Controlling.txt from the first line. """
         day = ""
         try:
-            file = self.networkShare.openFileRegisterSession(os.getenv("CONTROLLING_PATH"), "r")
+            file = self.networkShare.openCachedFileRegisterSession(os.getenv("CONTROLLING_PATH"))
             if not file:
                 raise TypeError("Returned file object is None")
 
@@ -118,7 +118,7 @@ class ReadControlling():
         """ reads the month from the first line of Controlling.txt. """
         month = ""
         try:
-            with self.networkShare.openFileRegisterSession(os.getenv("CONTROLLING_PATH"), "r") as file:
+            with self.networkShare.openCachedFileRegisterSession(os.getenv("CONTROLLING_PATH")) as file:
                 firstLine = file.readline().strip()
                 findMonth = re.search(r"\d{2}\.(\d{2})\.\d{4}", firstLine)
                 if findMonth:
@@ -135,7 +135,7 @@ class ReadControlling():
         """ reads the year from the first line of Controlling.txt. """
         year = ""
         try:
-            with self.networkShare.openFileRegisterSession(os.getenv("CONTROLLING_PATH"), "r") as file:
+            with self.networkShare.openCachedFileRegisterSession(os.getenv("CONTROLLING_PATH")) as file:
                 firstLine = file.readline().strip()
                 findYear = re.search(r"\d{2}\.\d{2}\.(\d{4})", firstLine)
                 if findYear:
@@ -155,7 +155,7 @@ class ReadControlling():
         """ 
         run = ""
         try:
-            with self.networkShare.openFileRegisterSession(os.getenv("CONTROLLING_PATH"), "r") as file:
+            with self.networkShare.openCachedFileRegisterSession(os.getenv("CONTROLLING_PATH")) as file:
                 lines = file.readlines()
                 if len(lines) >= 2:
                     self.runStatusControlling = True
@@ -174,7 +174,7 @@ class ReadControlling():
         """ 
         update = ""
         try:
-            with self.networkShare.openFileRegisterSession(os.getenv("CONTROLLING_PATH"), "r") as file:
+            with self.networkShare.openCachedFileRegisterSession(os.getenv("CONTROLLING_PATH")) as file:
                 lines = file.readlines()
                 if len(lines) >= 3:
                     update += lines[2].strip()
@@ -193,7 +193,7 @@ class ReadControlling():
         """ 
         praefix = ""
         try:
-            with self.networkShare.openFileRegisterSession(os.getenv("CONTROLLING_PATH"), "r") as file:
+            with self.networkShare.openCachedFileRegisterSession(os.getenv("CONTROLLING_PATH")) as file:
                 lines = file.readlines()
                 if len(lines) >= 4:
                     self.praefixStatusControlling = True
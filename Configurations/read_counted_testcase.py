@@ -35,7 +35,7 @@ class ReadCountedTestcase:
 
             for attempt in range(retry_attempts):
                 try:
-                    with self.networkShare.openFileVMUser(systemLogPath,masch, 'r') as file:
+                    with self.networkShare.openCachedFileVMUser(systemLogPath, masch) as file:
                         for line in file:
                             match = re.search(r"Testanzahl:'([^']*)'",line)
                             if match:
@@ -64,42 +64,20 @@ class ReadCountedTestcase:
             masch (str): The machine identifier.
             category (str): The category directory containing the "uebersicht.txt" file.
         Returns:
-            int: The count of "Start TF:" occurrences in the file.
-        Raises:
-            FileNotFoundError: If the file is not found after the specified retry attempts.
-            IOError: If an I/O error occurs after the specified retry attempts.
-            Exception: For any other exceptions that occur after the specified retry attempts.
+            int: The count of "Start TF:" occurrences in the file, 0 if the file does not exist.
+        Notes:
+            - The count is taken from the shared reader of the category (`ReadFault.takeSnapshot`), only the bytes
+              appended since its last refresh are read.
+            - A "Start TF" line without line break yet is counted by the next call.
         """
         try:
-
             # Each uebersicht.txt from parameter category
             overviewPath = os.path.join(self.readFault.getVersionPath(masch), category, "uebersicht.txt")
+            if not os.path.exists(overviewPath):
+                return 0
             # for reading each Start TF in Kategorie/uebersicht.txt
-            counter = 0
-
-            retry_attempts = 5
-            retry_delay = 10  # in seconds
-
-            for attempt in range(retry_attempts):
-                try:
-                    with self.networkShare.openFileVMUser(overviewPath,masch, 'r') as file:
-                        for line in file:
-                            match = re.search(r"Start TF:",line)
-                            match
-                            if match:
-                                counter += 1
-                        return counter
-                except FileNotFoundError as fnf_error:
-                    if attempt == 4+1:
-                        print(f"Attempt {attempt + 1} failed: FileNotFoundError: {fnf_error}")
-                except IOError as io_error:
-                    if attempt == 4+1:
-                        print(f"Attempt {attempt + 1} failed: IOError: {io_error}")
-                except Exception as e:
-                    if attempt == 4+1:
-                        print(f"Attempt {attempt + 1} failed: {e}")
-                if attempt < retry_attempts - 1:
-                    time.sleep(retry_delay)
+            snapshot = self.readFault.takeSnapshot(masch, category, overviewPath, None)
+            return snapshot.startedTests
         except Exception as e:
             print(e)
 
@@ -113,36 +91,22 @@ class ReadCountedTestcase:
         Returns:
             int: The last testcase number found in the file. Returns 0 if the file does not exist,
                  if no matching testcase is found, or if there is an error reading the file.
-        Raises:
-            FileNotFoundError: If the file is not found.
-            IOError: If there is an error reading the file.
         Notes:
-            The function looks for lines matching the pattern 'Start TF: .+ (X von Y)' where Y is
-            the maxNumberFromJson. It extracts the first number (X) in the parentheses and returns
-            the highest number found.
+            The function looks at the blocks whose "Start TF" line ends with '(X von Y)' where Y is
+            the maxNumberFromJson, and returns the highest X found.
+            Only the bytes appended since the last call are read (`OverviewTailReader`), the highest X is kept
+            by the ProgressTracker of the category. The read takes a slot of `NetworkShare.hostSlot`.
         """
-        # Pattern that only considers 'Start TF' and '(X of Y)'.
-        pattern = re.compile(r'Start TF: .+ \((\d+) von {}\)'.format(maxNumberFromJson))
-        last_number = None
         if not os.path.exists(file_path):
             # Return 0 here if no suitable test case was found
             return 0
+        # The category is the folder of its uebersicht.txt
+        category = os.path.basename(os.path.dirname(file_path))
         try:
-            with self.networkShare.openFileVMUser(file_path,masch, 'r') as file:
-                for line in file:
-                    match = pattern.search(line)
-                    if match:
-                        # Extract the first number in the parentheses
-                        first_number = int(match.group(1))
-                        if last_number is None or first_number > last_number:
-                            last_number = first_number
-
-            if last_number is not None:
-                return last_number
-            else:
-                print("No matching test cases found.")
-                return 0  # Return 0 here if no suitable test case was found
-
+            reader = self.readFault.getOverviewReader(masch, category)
+            # Within the limit of parallel remote operations on the machine, like the other readers
+            with self.networkShare.hostSlot(masch):
+                reader.refresh(file_path, masch)
         except FileNotFoundError:
             print(f"File not found: {file_path}")
             return 0
@@ -150,6 +114,11 @@ class ReadCountedTestcase:
             print(f"Error reading the file: {e}")
             return 0
 
+        last_number = reader.getLastTestCaseNumber(maxNumberFromJson)
+        if last_number == 0:
+            print("No matching test cases found.")
+        return last_number
+
     def allTestCasesCompleted(self, masch, overview_path, tcNumberReadOut):
         """
         Check if all test cases are completed for the given category by comparing the last number.
@@ -1,11 +1,28 @@
 import os
-import re
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from Configurations.networkshare import NetworkShare
 from Configurations.machines import Machines
+from Configurations.error_matcher import ErrorMatcher
+from Configurations.overview_stream import iterTestCaseBlocks
+from Configurations.overview_tail_reader import OverviewTailReader
+from Configurations.progress_tracker import ProgressTracker
+from Configurations.results_index import ResultsIndex
+from Configurations.system_log_header import SystemLogHeader
 
 class ReadFault:
+    # Shared by all instances, see getCategoryPool
+    categoryPool = None
+    categoryPoolLock = threading.Lock()
+    # Shared by all instances, see getProgressTracker
+    progressTrackers = {}
+    progressTrackersLock = threading.Lock()
+    # Shared by all instances, see getOverviewReader
+    overviewReaders = {}
+    overviewReadersLock = threading.Lock()
+
     def __init__(self):
         # Configurations
         self.networkShare = NetworkShare()
@@ -14,13 +31,82 @@ class ReadFault:
         
         # Fault-list
         self.errorList = os.getenv("ERROR_LIST")
+        self.errorMatcher = ErrorMatcher(self.errorList or [])
+        self.resultsIndex = ResultsIndex.shared()
         self.dictMachineErrors = {}
         self.lastModifiedTimes = {}
+        self.systemLogHeaders = {}
             
 
+    def getSystemLogHeader(self, masch):
+        """
+        Retrieves the parsed header (module, version, version date, version path) of a machine's system log.
+        Args:
+            masch (str): The machine identifier.
+        Returns:
+            SystemLogHeader: The parsed header.
+            None: If the header could not be retrieved or an error occurred.
+        Notes:
+            - The header is cached per machine and only parsed again when size or mtime of the system log changed.
+            - A header that could not be parsed is cached as well, until the system log changes.
+            - If the system log cannot be stat'ed, it is read without the cache.
+        """
+        systemLogPath = os.getenv("MACHINE_SYSTEMLOG_PATH")
+        fileStat = self.networkShare.statFileVMUser(systemLogPath, masch)
+        stamp = (fileStat.st_size, fileStat.st_mtime) if fileStat is not None else None
+
+        cached = self.systemLogHeaders.get(masch)
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        header = self.readSystemLogHeader(masch, systemLogPath)
+        if stamp is not None:
+            self.systemLogHeaders[masch] = (stamp, header)
+        return header
+
+
+    def readSystemLogHeader(self, masch, systemLogPath):
+        """
+        Reads and parses the header of the system log with retry logic.
+        Args:
+            masch (str): The machine identifier.
+            systemLogPath (str): The path to the system log.
+        Returns:
+            SystemLogHeader: The parsed header, None if it could not be read or parsed.
+        Notes:
+            - If the VM cannot be reached (or its circuit is open), None is returned at once. Opening the file
+              already retried within its deadline, only I/O errors while reading the log are retried here.
+        """
+        retry_attempts = 5
+        retry_delay = 1  # in seconds
+
+        for attempt in range(retry_attempts):
+            file = self.networkShare.openCachedFileVMUser(systemLogPath, masch)
+            if file is None:
+                return None
+            try:
+                with file:
+                    return SystemLogHeader.parse(file, masch, self.module)
+            except ValueError as value_error:
+                print(f"{masch}: {value_error}")
+                return None
+            except FileNotFoundError as fnf_error:
+                if attempt == retry_attempts - 1:
+                    print(f"Attempt {attempt + 1} failed: FileNotFoundError: {fnf_error}")
+            except IOError as io_error:
+                if attempt == retry_attempts - 1:
+                    print(f"Attempt {attempt + 1} failed: IOError: {io_error}")
+            except Exception as e:
+                print(f"{masch}: Error reading the system log header: {e}")
+                return None
+            if attempt < retry_attempts - 1:
+                time.sleep(retry_delay)
+        return None
+
+
     def getCurrentVersionMachine(self, masch, modulOption=None, versionOption=None, versionDateOption=None):
         """
-        Retrieves the current version, module, or version date of a machine from the system log.
+        Retrieves the current version, module, or version date of a machine from the cached system log header.
         Args:
             masch (str): The machine identifier.
             modulOption (bool, optional): If True, return the module name. Defaults to None.
@@ -29,71 +115,17 @@ class ReadFault:
         Returns:
             str: The requested information (module, version, or version date) based on the provided options.
             None: If the information could not be retrieved or an error occurred.
-        Raises:
-            ValueError: If neither version nor module string is found in the specified format.
-            FileNotFoundError: If the system log file is not found.
-            IOError: If an I/O error occurs while reading the file.
-            Exception: For any other exceptions that occur during execution.
         """
-
-        try:
-            readLine = 8
-            systemLogPath = os.getenv("MACHINE_SYSTEMLOG_PATH")
-            retry_attempts = 5
-            retry_delay = 1  # in seconds
-
-            # Create a regex pattern to match any of the module names
-            module_pattern = '|'.join(self.module)
-            regex_pattern = rf'ergebnis\\({module_pattern})\\(\d{{2}}-\d{{4}})\\'
-
-            for attempt in range(retry_attempts):
-                try:
-                    with self.networkShare.openFileVMUser(systemLogPath, masch, 'r') as file:
-                        for lineNum, line in enumerate(file, start=1):
-                            if lineNum == readLine:
-                                matchLF = re.search(r'\\(LF[^\\]*)\\', line)
-                                matchLT = re.search(r'\\(LT[^\\]*)\\', line)
-                                matchLFREF = re.search(r'\\(LFREF[^\\]*)\\', line)
-
-                                # Find the version based on priority: LF > LT > LFREF > None
-                                if matchLF:
-                                    version = matchLF.group(1)
-                                elif matchLT:
-                                    version = matchLT.group(1)
-                                elif matchLFREF:
-                                    version = matchLFREF.group(1)
-                                else:
-                                    version = None
-
-                                matchModul = re.search(regex_pattern, line)
-                                modul = matchModul.group(1).strip() if matchModul else None
-                                version_date = matchModul.group(2) if matchModul else None
-
-                                # Return the desired value based on option flags
-                                if version and modul and version_date:
-                                    if modulOption is not None:
-                                        return modul
-                                    elif versionOption is not None:
-                                        return version
-                                    elif versionDateOption is not None:
-                                        return version_date
-                                else:
-                                    raise ValueError("Neither version nor modul string found in the specified format.")
-                except FileNotFoundError as fnf_error:
-                    if attempt == retry_attempts - 1:
-                        print(f"Attempt {attempt + 1} failed: FileNotFoundError: {fnf_error}")
-                except IOError as io_error:
-                    if attempt == retry_attempts - 1:
-                        print(f"Attempt {attempt + 1} failed: IOError: {io_error}")
-                except Exception as e:
-                    if attempt == retry_attempts - 1:
-                        print(f"Attempt {attempt + 1} failed: {e}")
-                if attempt < retry_attempts - 1:
-                    time.sleep(retry_delay)
-                    return None
-        except Exception as e:
-            print(e)
+        header = self.getSystemLogHeader(masch)
+        if header is None:
             return None
+        if modulOption is not None:
+            return header.module
+        elif versionOption is not None:
+            return header.version
+        elif versionDateOption is not None:
+            return header.versionDate
+        return None
 
 
     def readOverview(self, masch):
@@ -104,84 +136,205 @@ class ReadFault:
         Returns:
             None
         This method performs the following steps:
-        1. Retrieves the current module version, software version, and version date of the specified machine.
-        2. Checks if the retrieved versions and date are valid.
+        1. Retrieves the system log header (module version, software version, and version date) of the specified machine.
+        2. Checks if the header could be parsed.
         3. Constructs the base path to the machine's error overview files.
         4. Checks if the base path exists.
         5. Iterates through the categories in the base path and processes the "uebersicht.txt" file in each category.
-        6. Reads the "uebersicht.txt" file and extracts error patterns for each test case.
+        6. Reads only the bytes appended to the "uebersicht.txt" since the last call (OverviewTailReader per machine and category)
+           and extracts error patterns for each test case.
         7. Updates the dictionary of machine errors with the extracted error patterns.
+        The categories are read concurrently on a shared worker pool (size from OVERVIEW_WORKERS), the
+        parallel reads per machine are limited by `NetworkShare.hostSlot`. The categories are merged in sorted order.
         Raises:
             Exception: If an error occurs while reading the overview, an exception is caught and an error message is printed.
         """
         try:
-            modulVersion = self.getCurrentVersionMachine(masch, modulOption=True)
-            softwareVersion = self.getCurrentVersionMachine(masch, versionOption=True)
-            versionDate = self.getCurrentVersionMachine(masch, versionDateOption=True)
-            
-            if not modulVersion or not softwareVersion or not versionDate:
+            # The errors read so far are kept while the machine is offline
+            if self.networkShare.vmAccessManager.isOffline(masch):
+                return
+            if self.getSystemLogHeader(masch) is None:
                 return
 
-            self.dictMachineErrors[masch] = {}
             base_path = os.getenv("BASEPATH")
             if not os.path.exists(base_path):
+                self.dictMachineErrors[masch] = {}
                 return
 
+            pool = self.getCategoryPool()
+            futures = [(category, pool.submit(self.readCategoryOverview, masch, base_path, category)) for category in sorted(os.listdir(base_path))]
 
-            for category in os.listdir(base_path):
-                category_path = os.path.join(base_path, category)
-                if os.path.isdir(category_path):
-                    self.dictMachineErrors[masch][category] = {pattern: [] for pattern in self.errorList}
-                    uebersicht_path = os.path.join(category_path, "uebersicht.txt")
-
-                    if os.path.exists(uebersicht_path):
-                        with self.networkShare.openFileVMUser(uebersicht_path,masch, 'r') as file:
-                            currentTestCase = None
-                            temp_errors = {pattern: [] for pattern in self.errorList}
-                            
-                            for line in file:
-                                cleanLine = line.strip() + "<br>"  # for html, break line
-                                if line.startswith("Start TF"):
-                                    currentTestCase = line.strip() + "<br>"
-                                elif line.startswith("Ende  TF"):
-                                    if currentTestCase:
-                                        for errorPattern in self.errorList:
-                                            if temp_errors[errorPattern]:
-                                                self.dictMachineErrors[masch][category][errorPattern].append(currentTestCase + ''.join(temp_errors[errorPattern]))
-                                    currentTestCase = None
-                                    temp_errors = {pattern: [] for pattern in self.errorList}
-                                elif currentTestCase:
-                                    for errorPattern in self.errorList:
-                                        if errorPattern in line:
-                                            temp_errors[errorPattern].append(cleanLine + "<br>")
-                    else:
-                        print(f"{uebersicht_path} does not exist")
+            machineErrors = {}
+            for category, future in futures:
+                errors = future.result()
+                if errors is not None:
+                    machineErrors[category] = errors
+            self.dictMachineErrors[masch] = machineErrors
         except Exception as e:
             print(f"{e}")
 
 
-    def getVersionPath(self, masch):
+    def readCategoryOverview(self, masch, base_path, category):
+        """
+        Reads the "uebersicht.txt" of one category, runs on the category worker pool.
+        Args:
+            masch (str): The machine identifier.
+            base_path (str): The directory holding the category folders.
+            category (str): The category folder.
+        Returns:
+            dict: The error records per pattern, None if the entry is not a category folder.
+        """
+        try:
+            category_path = os.path.join(base_path, category)
+            if not os.path.isdir(category_path):
+                return None
+
+            uebersicht_path = os.path.join(category_path, "uebersicht.txt")
+            if not os.path.exists(uebersicht_path):
+                with ReadFault.overviewReadersLock:
+                    reader = ReadFault.overviewReaders.pop((masch, category), None)
+                if reader is not None:
+                    # The file was removed, the next one starts without the progress of the old one
+                    reader.progress.reset()
+                print(f"{uebersicht_path} does not exist")
+                return {pattern: [] for pattern in self.errorList}
+
+            reader = self.getOverviewReader(masch, category)
+            with self.networkShare.hostSlot(masch):
+                return reader.refresh(uebersicht_path, masch)
+        except Exception as e:
+            print(f"Error reading {category} of {masch}: {e}")
+            reader = ReadFault.overviewReaders.get((masch, category))
+            return reader.errors if reader is not None else {pattern: [] for pattern in self.errorList}
+
+
+    def getOverviewReader(self, masch, category):
         """
-        Constructs and returns the file path for the specified machine's version information.
+        Returns the OverviewTailReader of a machine and category.
         Args:
             masch (str): The machine identifier.
+            category (str): The category.
         Returns:
-            str: The constructed file path in the format:
+            OverviewTailReader: The reader, a new version of the machine starts a new reader that continues from what
+            the results index stored.
         Notes:
-            - `modulVersion`, `softwareVersion`, and `versionDate` are obtained by calling 
-              `getCurrentVersionMachine` with different options.
+            - The readers are shared by all ReadFault instances (HTMLData, the main window, ...), so every category
+              is parsed and stored in the results index by one reader only.
+            - If the system log header cannot be read (no index key), the existing reader is kept.
         """
-        modulVersion = self.getCurrentVersionMachine(masch, modulOption=True)
-        softwareVersion = self.getCurrentVersionMachine(masch, versionOption=True)
-        versionDate = self.getCurrentVersionMachine(masch, versionDateOption=True)
+        indexKey = self.getIndexKey(masch, category)
+        with ReadFault.overviewReadersLock:
+            reader = ReadFault.overviewReaders.get((masch, category))
+            if reader is None or (indexKey is not None and reader.indexKey != indexKey):
+                if reader is not None and reader.indexKey is not None:
+                    # A new version of the machine, its progress starts again. A reader that started without the
+                    # header (no key) only gets its index now, the progress stays
+                    reader.progress.reset()
+                reader = OverviewTailReader(self.networkShare, self.errorList, self.errorMatcher, self.resultsIndex, indexKey,
+                                            self.getProgressTracker(masch, category))
+                ReadFault.overviewReaders[(masch, category)] = reader
+            return reader
 
-        if not modulVersion or not softwareVersion or not versionDate:
-            return None
 
-        basepath_template = os.getenv("BASEPATH_TEMPLATE")
+    @classmethod
+    def getProgressTracker(cls, masch, category):
+        """
+        Returns the progress of a machine and category, shared by all ReadFault instances. It is updated by every
+        refresh of an overview reader of the category, other threads can wait for it with `waitForChange`.
+        Args:
+            masch (str): The machine identifier.
+            category (str): The category.
+        Returns:
+            ProgressTracker: The tracker of the category.
+        """
+        with cls.progressTrackersLock:
+            tracker = cls.progressTrackers.get((masch, category))
+            if tracker is None:
+                tracker = ProgressTracker(masch, category)
+                cls.progressTrackers[(masch, category)] = tracker
+            return tracker
+
 
-        version_path = basepath_template.format(masch=masch, modulVersion=modulVersion, versionDate=versionDate, softwareVersion=softwareVersion)
-        return version_path
+    def takeSnapshot(self, masch, category, overviewPath, tcNumberReadOut):
+        """
+        Reads the changes of one "uebersicht.txt" and captures the result for the steps of one change event.
+        Args:
+            masch (str): The machine identifier.
+            category (str): The category.
+            overviewPath (str): The path to the uebersicht.txt of the category.
+            tcNumberReadOut (int): The number of test cases of the category.
+        Returns:
+            OverviewSnapshot: The last test case number, the completion, the error counts and the error records.
+        Notes:
+            - Only the bytes appended since the last refresh are read, the other categories are not touched.
+            - `dictMachineErrors` is updated for the category as well.
+        """
+        reader = self.getOverviewReader(masch, category)
+        with self.networkShare.hostSlot(masch):
+            snapshot = reader.takeSnapshot(overviewPath, masch, category, tcNumberReadOut)
+        machineErrors = dict(self.dictMachineErrors.get(masch, {}))
+        machineErrors[category] = reader.errors
+        self.dictMachineErrors[masch] = machineErrors
+        return snapshot
+
+
+    def iterOverviewBlocks(self, masch, overviewPath, errorMatcher=None):
+        """
+        Yields the test case blocks of an uebersicht.txt, reading it chunk by chunk over one open file.
+        Args:
+            masch (str): The machine identifier.
+            overviewPath (str): The path to the uebersicht.txt.
+            errorMatcher (ErrorMatcher, optional): Matches the error patterns of each line. Defaults to None.
+        Yields:
+            TestCaseBlock: The blocks in file order, the last one with `complete` False if it is still running.
+        Notes:
+            - Opening the file is retried up to 5 times with a delay of 10 seconds, a failed read is not retried,
+              because the blocks read so far have already been yielded.
+            - Nothing is yielded if the file could not be opened.
+        """
+        retry_attempts = 5
+        retry_delay = 10  # in seconds
+
+        for attempt in range(retry_attempts):
+            file = self.networkShare.openFileVMUser(overviewPath, masch, 'rb')
+            if file is not None:
+                with file:
+                    yield from iterTestCaseBlocks(file, errorMatcher)
+                return
+            if attempt == retry_attempts - 1:
+                print(f"Attempt {attempt + 1} failed: {overviewPath} could not be opened.")
+            else:
+                time.sleep(retry_delay)
+
+
+    @classmethod
+    def getCategoryPool(cls):
+        """
+        Returns the worker pool shared by all ReadFault instances for reading the category files.
+
+        Returns:
+            ThreadPoolExecutor: The pool, its size is taken from the OVERVIEW_WORKERS environment variable (default 8).
+        """
+        with cls.categoryPoolLock:
+            if cls.categoryPool is None:
+                cls.categoryPool = ThreadPoolExecutor(max_workers=int(os.getenv("OVERVIEW_WORKERS", 8)), thread_name_prefix="overview")
+            return cls.categoryPool
+
+
+    def getVersionPath(self, masch):
+        """
+        Returns the file path for the specified machine's version information.
+        Args:
+            masch (str): The machine identifier.
+        Returns:
+            str: The path built from BASEPATH_TEMPLATE, None if the system log header could not be parsed.
+        Notes:
+            - The path is part of the cached `SystemLogHeader`, the system log is not read again.
+        """
+        header = self.getSystemLogHeader(masch)
+        if header is None:
+            return None
+        return header.versionPath
 
 
     def getAllCategories(self, masch):
@@ -216,10 +369,89 @@ class ReadFault:
             pattern (str): The pattern of the error.
 
         Returns:
-            list: A list of errors matching the specified machine, category, and pattern.
+            list: A list of ErrorRecord matching the specified machine, category, and pattern.
                   Returns an empty list if no matching errors are found.
         """
         if masch in self.dictMachineErrors and category in self.dictMachineErrors[masch] and pattern in self.dictMachineErrors[masch][category]:
             return self.dictMachineErrors[masch][category][pattern]
         else:
             return []
+
+
+    def getErrorCounts(self, masch, category):
+        """
+        Retrieve the number of failed test cases per error pattern for a machine and category.
+
+        Args:
+            masch (str): The machine identifier.
+            category (str): The category of the error.
+
+        Returns:
+            dict: The count per error pattern, read from the counters of the overview reader or, before the
+                  category was read in this process, from the results index.
+                  Patterns without errors (or an unknown category) count 0.
+        """
+        reader = ReadFault.overviewReaders.get((masch, category))
+        if reader is not None:
+            return dict(reader.counts)
+
+        # Not read in this process yet, take the counts of the last run from the results index
+        counts = {pattern: 0 for pattern in self.errorList}
+        if self.resultsIndex is not None:
+            indexKey = self.getIndexKey(masch, category)
+            if indexKey is not None:
+                storedCounts = self.resultsIndex.getErrorCounts(indexKey)
+                counts.update({pattern: storedCounts.get(pattern, 0) for pattern in counts})
+        return counts
+
+
+    def getIndexKey(self, masch, category):
+        """
+        Builds the key of a category in the results index from the cached system log header.
+
+        Args:
+            masch (str): The machine identifier.
+            category (str): The category.
+
+        Returns:
+            tuple: (machine, (module, version, versionDate), category), None if the header could not be parsed.
+        """
+        header = self.getSystemLogHeader(masch)
+        if header is None:
+            return None
+        return (masch, (header.module, header.version, header.versionDate), category)
+
+
+    def renderErrorMessages(self, masch, category, pattern, snapshot=None, start=0, stop=None):
+        """
+        Renders the errors of a machine, category and pattern to HTML messages.
+
+        Args:
+            masch (str): The machine identifier.
+            category (str): The category of the error.
+            pattern (str): The pattern of the error.
+            snapshot (OverviewSnapshot, optional): Renders the records of the snapshot, once per pattern and range. Defaults to None.
+            start (int, optional): Index of the first record to render, e.g. of one error page. Defaults to 0.
+            stop (int, optional): Index behind the last record to render. Defaults to None (up to the last record).
+
+        Returns:
+            list: One HTML message ("Start TF" line followed by the matching lines) per failed test case.
+                  The messages are built from the overview file only now, they are not kept in memory.
+        """
+        if snapshot is not None and (pattern, start, stop) in snapshot.messages:
+            return snapshot.messages[(pattern, start, stop)]
+
+        reader = ReadFault.overviewReaders.get((masch, category))
+        if reader is None:
+            return []
+        if snapshot is not None:
+            records, filepath = snapshot.errors.get(pattern, []), snapshot.path
+        else:
+            # A refresh may reset the reader at the same time
+            with reader.lock:
+                records, filepath = list(reader.errors.get(pattern, [])), reader.filepath
+        with self.networkShare.hostSlot(masch):
+            messages = reader.renderErrors(masch, pattern, records[start:stop], filepath)
+        if snapshot is not None:
+            snapshot.messages[(pattern, start, stop)] = messages
+        return messages
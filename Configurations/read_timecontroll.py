@@ -1,10 +1,15 @@
 from dotenv import load_dotenv
 import os
 
+from Configurations.networkshare import NetworkShare
+
 
 class ReadTimecontroll():
     load_dotenv()
 
+    def __init__(self):
+        self.networkShare = NetworkShare()
+
     def getCurrentStatus(self, masch):
         """
         Get the current status of the machine. If it is free then return True, else False
@@ -14,7 +19,8 @@ class ReadTimecontroll():
         freeStatus = "n"
         timecontrollPath = os.getenv('TIMECONTROLL_PATH') + rf"\{masch}work.txt"
         try:
-            with open(timecontrollPath, "r") as f:
+            # Read through the file cache, only downloaded again when the status file changed
+            with self.networkShare.openCachedFile(timecontrollPath) as f:
                 status = f.read()
                 # Check if the status is free
                 if status.strip() == freeStatus:
@@ -0,0 +1,167 @@
+import io
+import locale
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class RemoteFileCache():
+    """
+    Read-through cache for the small remote files that are read again every few seconds (system log, category
+    files, Controlling.txt, <masch>work.txt, module JSONs). An entry is keyed by the path and validated with a stat
+    of size and mtime, the content is only downloaded again if one of them changed.
+
+    Within REMOTE_CACHE_TTL seconds (default 5) after the last validation an entry is returned without a stat.
+    The least recently used entries are evicted when the cached bytes exceed REMOTE_CACHE_MAX_BYTES (default 32 MB).
+    """
+
+    # Shared by all NetworkShare instances, see shared()
+    instance = None
+    instanceLock = threading.Lock()
+
+    def __init__(self, ttl=None, maxBytes=None):
+        self.ttl = ttl if ttl is not None else float(os.getenv("REMOTE_CACHE_TTL", 5))
+        self.maxBytes = maxBytes if maxBytes is not None else int(os.getenv("REMOTE_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+        self.entries = OrderedDict()  # path -> RemoteFileEntry, least recently used first
+        self.totalBytes = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Text mode on the share decodes with the locale encoding, the cached bytes are decoded the same way
+        self.encoding = locale.getpreferredencoding(False)
+
+
+    @classmethod
+    def shared(cls):
+        """
+        Returns:
+            RemoteFileCache: The process-wide file cache.
+        """
+        with cls.instanceLock:
+            if cls.instance is None:
+                cls.instance = cls()
+            return cls.instance
+
+
+    def read(self, path, statFile, openFile):
+        """
+        Returns the content of a file, from the cache if its size and mtime did not change.
+
+        Args:
+            path (str): The path of the file, the key of the entry.
+            statFile (callable): Returns the stat result of the file (st_size, st_mtime), None if it failed.
+            openFile (callable): Opens the file in binary mode, returns None if it failed.
+
+        Returns:
+            bytes: The content of the file, None if it could not be read.
+
+        Notes:
+            - If the file cannot be stat'ed, it is read without the cache.
+            - The stat is taken before the download, a change during the download is noticed on the next read.
+            - Exceptions of `statFile` and `openFile` are passed to the caller.
+        """
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None and time.monotonic() - entry.validated < self.ttl:
+                self.entries.move_to_end(path)
+                self.hits += 1
+                return entry.content
+
+        fileStat = statFile()
+        stamp = (fileStat.st_size, fileStat.st_mtime) if fileStat is not None else None
+
+        if stamp is not None:
+            with self.lock:
+                entry = self.entries.get(path)
+                if entry is not None and entry.stamp == stamp:
+                    entry.validated = time.monotonic()
+                    self.entries.move_to_end(path)
+                    self.hits += 1
+                    return entry.content
+
+        with self.lock:
+            self.misses += 1
+        file = openFile()
+        if file is None:
+            return None
+        with file:
+            content = file.read()
+
+        if stamp is not None:
+            self.store(path, stamp, content)
+        return content
+
+
+    def readText(self, path, statFile, openFile, encoding=None):
+        """
+        Like `read`, but returns the content as a text file, so it can be used in place of a file opened with 'r'.
+
+        Args:
+            encoding (str, optional): The encoding of the file. Defaults to the locale encoding, like text mode.
+
+        Returns:
+            io.StringIO: The decoded content with universal newlines, None if the file could not be read.
+        """
+        content = self.read(path, statFile, openFile)
+        if content is None:
+            return None
+        return io.StringIO(content.decode(encoding or self.encoding), newline=None)
+
+
+    def store(self, path, stamp, content):
+        """
+        Adds or replaces an entry and evicts the least recently used entries above `maxBytes`.
+        Files larger than `maxBytes` are not cached.
+        """
+        with self.lock:
+            self.remove(path)
+            if len(content) > self.maxBytes:
+                return
+            self.entries[path] = RemoteFileEntry(stamp, content)
+            self.totalBytes += len(content)
+            while self.totalBytes > self.maxBytes:
+                self.remove(next(iter(self.entries)))
+
+
+    def remove(self, path):
+        """Removes an entry, the caller holds `self.lock`."""
+        entry = self.entries.pop(path, None)
+        if entry is not None:
+            self.totalBytes -= len(entry.content)
+
+
+    def invalidate(self, path):
+        """
+        Forgets a file, e.g. before it is written.
+
+        Args:
+            path (str): The path of the file.
+        """
+        with self.lock:
+            self.remove(path)
+
+
+    def clear(self):
+        """Forgets all files."""
+        with self.lock:
+            self.entries.clear()
+            self.totalBytes = 0
+
+
+    def getStats(self):
+        """
+        Returns:
+            dict: The hits, the misses (downloads), the number of entries and the cached bytes.
+        """
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries), "bytes": self.totalBytes}
+
+
+class RemoteFileEntry():
+    """The content of one file and the size and mtime it was downloaded with."""
+
+    def __init__(self, stamp, content):
+        self.stamp = stamp
+        self.content = content
+        self.validated = time.monotonic()
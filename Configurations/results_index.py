@@ -0,0 +1,270 @@
+import os
+import sqlite3
+import threading
+from array import array
+
+
+class ResultsIndex():
+    """
+    Local SQLite store of the parsed overview files. It keeps the error records and the read position of every
+    uebersicht.txt, so after a restart only the bytes appended since then have to be fetched from the machines.
+    """
+
+    # Shared by all ReadFault instances, see shared()
+    instance = None
+    instanceLock = threading.Lock()
+
+    schema = """
+        CREATE TABLE IF NOT EXISTS machine (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS version (
+            id INTEGER PRIMARY KEY,
+            machine_id INTEGER NOT NULL REFERENCES machine(id),
+            module TEXT,
+            version TEXT,
+            version_date TEXT,
+            UNIQUE (machine_id, module, version, version_date)
+        );
+        CREATE TABLE IF NOT EXISTS category (
+            id INTEGER PRIMARY KEY,
+            version_id INTEGER NOT NULL REFERENCES version(id),
+            name TEXT NOT NULL,
+            path TEXT,
+            resume_offset INTEGER NOT NULL DEFAULT 0,
+            file_id INTEGER,
+            file_ctime REAL,
+            testcase_counter INTEGER NOT NULL DEFAULT 0,
+            UNIQUE (version_id, name)
+        );
+        CREATE TABLE IF NOT EXISTS testcase (
+            id INTEGER PRIMARY KEY,
+            category_id INTEGER NOT NULL REFERENCES category(id),
+            number INTEGER NOT NULL,
+            start INTEGER NOT NULL,
+            UNIQUE (category_id, number)
+        );
+        CREATE TABLE IF NOT EXISTS pattern (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS message (
+            id INTEGER PRIMARY KEY,
+            testcase_id INTEGER NOT NULL REFERENCES testcase(id),
+            pattern_id INTEGER NOT NULL REFERENCES pattern(id),
+            end INTEGER NOT NULL,
+            line_offsets BLOB NOT NULL,
+            UNIQUE (testcase_id, pattern_id)
+        );
+        CREATE TABLE IF NOT EXISTS progress (
+            category_id INTEGER NOT NULL REFERENCES category(id),
+            total INTEGER NOT NULL,
+            last_number INTEGER NOT NULL,
+            PRIMARY KEY (category_id, total)
+        );
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(self.schema)
+        self.migrate()
+        self.connection.commit()
+
+
+    def migrate(self):
+        """
+        Adds the unique key of `message` to an index created before it existed. Records that several readers
+        stored twice are removed first.
+        """
+        indexes = [row[1] for row in self.connection.execute("PRAGMA index_list(message)")]
+        if any(index.startswith("sqlite_autoindex_message") or index == "message_unique" for index in indexes):
+            return
+        self.connection.execute(
+            "DELETE FROM message WHERE id NOT IN (SELECT MIN(id) FROM message GROUP BY testcase_id, pattern_id)")
+        self.connection.execute("CREATE UNIQUE INDEX message_unique ON message(testcase_id, pattern_id)")
+
+
+    @classmethod
+    def shared(cls):
+        """
+        Returns the process-wide results index.
+
+        Returns:
+            ResultsIndex: The index stored at RESULTS_INDEX_PATH (default "results_index.db"), None if it cannot be opened.
+        """
+        with cls.instanceLock:
+            if cls.instance is None:
+                try:
+                    cls.instance = cls(os.getenv("RESULTS_INDEX_PATH", "results_index.db"))
+                except sqlite3.Error as e:
+                    print(f"Results index could not be opened: {e}")
+                    return None
+            return cls.instance
+
+
+    def getCategoryId(self, key, create=False):
+        """
+        Looks up the row id of a category. The caller holds `self.lock`.
+
+        Args:
+            key (tuple): (machine, (module, version, versionDate), category).
+            create (bool, optional): Inserts the missing machine, version and category rows. Defaults to False.
+
+        Returns:
+            int: The category id, None if it does not exist and `create` is False.
+        """
+        masch, (module, version, versionDate), category = key
+        cursor = self.connection.cursor()
+        if create:
+            cursor.execute("INSERT OR IGNORE INTO machine (name) VALUES (?)", (masch,))
+            cursor.execute(
+                "INSERT OR IGNORE INTO version (machine_id, module, version, version_date) "
+                "SELECT id, ?, ?, ? FROM machine WHERE name = ?", (module, version, versionDate, masch))
+            cursor.execute(
+                "INSERT OR IGNORE INTO category (version_id, name) "
+                "SELECT version.id, ? FROM version JOIN machine ON machine.id = version.machine_id "
+                "WHERE machine.name = ? AND version.module IS ? AND version.version IS ? AND version.version_date IS ?",
+                (category, masch, module, version, versionDate))
+        row = cursor.execute(
+            "SELECT category.id FROM category JOIN version ON version.id = category.version_id "
+            "JOIN machine ON machine.id = version.machine_id "
+            "WHERE machine.name = ? AND version.module IS ? AND version.version IS ? AND version.version_date IS ? AND category.name = ?",
+            (masch, module, version, versionDate, category)).fetchone()
+        return row[0] if row else None
+
+
+    def loadCategory(self, key):
+        """
+        Loads the stored read position and error records of one category.
+
+        Args:
+            key (tuple): (machine, (module, version, versionDate), category).
+
+        Returns:
+            tuple: (state, records) with state = (path, resumeOffset, identity, testCaseCounter) and records a list of
+                   (testCase, start, end, pattern, lineOffsets) ordered by position. None if nothing is stored.
+        """
+        with self.lock:
+            categoryId = self.getCategoryId(key)
+            if categoryId is None:
+                return None
+            path, resumeOffset, fileId, fileCtime, testCaseCounter = self.connection.execute(
+                "SELECT path, resume_offset, file_id, file_ctime, testcase_counter FROM category WHERE id = ?", (categoryId,)).fetchone()
+            rows = self.connection.execute(
+                "SELECT testcase.number, testcase.start, message.end, pattern.name, message.line_offsets FROM message "
+                "JOIN testcase ON testcase.id = message.testcase_id JOIN pattern ON pattern.id = message.pattern_id "
+                "WHERE testcase.category_id = ? ORDER BY testcase.start, message.id", (categoryId,)).fetchall()
+
+        identity = (fileId, fileCtime) if fileId is not None else None
+        records = []
+        for testCase, start, end, pattern, lineOffsets in rows:
+            offsets = array('I')
+            offsets.frombytes(lineOffsets)
+            records.append((testCase, start, end, pattern, offsets))
+        return (path, resumeOffset, identity, testCaseCounter), records
+
+
+    def loadProgress(self, key):
+        """
+        Loads the highest test case number read per announced total ("X von Y") of one category.
+
+        Args:
+            key (tuple): (machine, (module, version, versionDate), category).
+
+        Returns:
+            dict: The highest X per Y, empty if nothing is stored.
+        """
+        with self.lock:
+            categoryId = self.getCategoryId(key)
+            if categoryId is None:
+                return {}
+            rows = self.connection.execute(
+                "SELECT total, last_number FROM progress WHERE category_id = ?", (categoryId,)).fetchall()
+        return dict(rows)
+
+
+    def saveCategory(self, key, state, newRecords, patterns, progress=None):
+        """
+        Stores the read position of one category and appends the records parsed since the last save.
+
+        Args:
+            key (tuple): (machine, (module, version, versionDate), category).
+            state (tuple): (path, resumeOffset, identity, testCaseCounter), resumeOffset points before a half-finished block.
+            newRecords (list): The new ErrorRecord objects.
+            patterns (list): The patterns of the ErrorMatcher, `ErrorRecord.patternId` indexes into it.
+            progress (dict, optional): The highest test case number per total read so far. Defaults to None (unchanged).
+        """
+        path, resumeOffset, identity, testCaseCounter = state
+        fileId, fileCtime = identity if identity is not None else (None, None)
+        try:
+            with self.lock, self.connection:
+                categoryId = self.getCategoryId(key, create=True)
+                self.connection.execute(
+                    "UPDATE category SET path = ?, resume_offset = ?, file_id = ?, file_ctime = ?, testcase_counter = ? WHERE id = ?",
+                    (path, resumeOffset, fileId, fileCtime, testCaseCounter, categoryId))
+                for record in newRecords:
+                    pattern = patterns[record.patternId]
+                    self.connection.execute("INSERT OR IGNORE INTO pattern (name) VALUES (?)", (pattern,))
+                    self.connection.execute(
+                        "INSERT OR IGNORE INTO testcase (category_id, number, start) VALUES (?, ?, ?)",
+                        (categoryId, record.testCase, record.start))
+                    # A record that is already stored (e.g. read again after a restart) is kept once
+                    self.connection.execute(
+                        "INSERT OR IGNORE INTO message (testcase_id, pattern_id, end, line_offsets) "
+                        "SELECT testcase.id, pattern.id, ?, ? FROM testcase, pattern "
+                        "WHERE testcase.category_id = ? AND testcase.number = ? AND pattern.name = ?",
+                        (record.end, record.lineOffsets.tobytes(), categoryId, record.testCase, pattern))
+                for total, lastNumber in (progress or {}).items():
+                    self.connection.execute(
+                        "INSERT OR REPLACE INTO progress (category_id, total, last_number) VALUES (?, ?, ?)",
+                        (categoryId, total, lastNumber))
+        except sqlite3.Error as e:
+            print(f"Results index could not be written: {e}")
+
+
+    def clearCategory(self, key):
+        """
+        Removes the stored records and read position of one category, e.g. after the overview file was replaced.
+
+        Args:
+            key (tuple): (machine, (module, version, versionDate), category).
+        """
+        try:
+            with self.lock, self.connection:
+                categoryId = self.getCategoryId(key)
+                if categoryId is None:
+                    return
+                self.connection.execute(
+                    "DELETE FROM message WHERE testcase_id IN (SELECT id FROM testcase WHERE category_id = ?)", (categoryId,))
+                self.connection.execute("DELETE FROM testcase WHERE category_id = ?", (categoryId,))
+                self.connection.execute("DELETE FROM progress WHERE category_id = ?", (categoryId,))
+                self.connection.execute(
+                    "UPDATE category SET resume_offset = 0, file_id = NULL, file_ctime = NULL, testcase_counter = 0 WHERE id = ?",
+                    (categoryId,))
+        except sqlite3.Error as e:
+            print(f"Results index could not be cleared: {e}")
+
+
+    def getErrorCounts(self, key):
+        """
+        Counts the stored failed test cases per pattern of one category.
+
+        Args:
+            key (tuple): (machine, (module, version, versionDate), category).
+
+        Returns:
+            dict: The count per pattern name, empty if the category is not stored.
+        """
+        with self.lock:
+            categoryId = self.getCategoryId(key)
+            if categoryId is None:
+                return {}
+            rows = self.connection.execute(
+                "SELECT pattern.name, COUNT(*) FROM message JOIN testcase ON testcase.id = message.testcase_id "
+                "JOIN pattern ON pattern.id = message.pattern_id WHERE testcase.category_id = ? GROUP BY pattern.name",
+                (categoryId,)).fetchall()
+        return dict(rows)
@@ -0,0 +1,243 @@
+import os
+import threading
+import time
+import smbclient
+from smbprotocol.exceptions import SMBConnectionClosed
+
+
+class SMBSessionManager():
+    """
+    Keeps one authenticated SMB session per (server, user) and opens the files over it. Each pair gets its own
+    connection cache, so the VM user and the network user never replace each other's credentials and the global
+    `smbclient.ClientConfig` is not touched. An open on a registered session only sends the create request
+    instead of negotiating and authenticating again.
+
+    Idle sessions are kept alive with an SMB echo every SMB_KEEPALIVE_INTERVAL seconds (default 60), a session
+    whose connection was closed is registered again on the next open.
+    """
+
+    # Shared by all NetworkShare instances, see shared()
+    instance = None
+    instanceLock = threading.Lock()
+
+    def __init__(self, keepaliveInterval=None):
+        self.keepaliveInterval = keepaliveInterval or float(os.getenv("SMB_KEEPALIVE_INTERVAL", 60))
+        self.sessions = {}  # (server, user) -> SMBSessionEntry
+        self.lock = threading.Lock()
+        self.stopEvent = threading.Event()
+        self.keepaliveThread = None
+        self.opens = 0
+        self.registrations = 0
+
+
+    @classmethod
+    def shared(cls):
+        """
+        Returns:
+            SMBSessionManager: The process-wide session manager.
+        """
+        with cls.instanceLock:
+            if cls.instance is None:
+                cls.instance = cls()
+            return cls.instance
+
+
+    @staticmethod
+    def getServer(path):
+        """
+        Args:
+            path (str): A UNC path, e.g. "\\\\server\\share\\dir\\file.txt".
+
+        Returns:
+            str: The server of the path in lower case.
+
+        Raises:
+            ValueError: If the path is not a UNC path.
+        """
+        parts = path.replace("/", "\\").lstrip("\\").split("\\")
+        if not path.replace("/", "\\").startswith("\\\\") or not parts[0]:
+            raise ValueError(f"{path} is not a UNC path.")
+        return parts[0].lower()
+
+
+    def getSession(self, server, username, password):
+        """
+        Returns the session of a server and user, it is registered on first use.
+
+        Args:
+            server (str): The server name.
+            username (str): The user name.
+            password (str): The password of the user.
+
+        Returns:
+            SMBSessionEntry: The session and its connection cache.
+
+        Raises:
+            SMBAuthenticationError: If the credentials are rejected.
+            SMBException: If the server cannot be reached.
+        """
+        key = (server.lower(), username)
+        with self.lock:
+            entry = self.sessions.get(key)
+            if entry is None:
+                entry = SMBSessionEntry(server, username)
+                self.sessions[key] = entry
+
+        # Registered outside the manager lock, a slow server does not block the other servers
+        with entry.lock:
+            if entry.session is None:
+                entry.session = smbclient.register_session(server, username=username, password=password,
+                                                           connection_cache=entry.connectionCache)
+                with self.lock:
+                    self.registrations += 1
+            entry.lastUsed = time.monotonic()
+        self.startKeepalive()
+        return entry
+
+
+    def invalidate(self, server, username):
+        """
+        Closes the session of a server and user, the next access registers it again.
+
+        Args:
+            server (str): The server name.
+            username (str): The user name.
+        """
+        with self.lock:
+            entry = self.sessions.pop((server.lower(), username), None)
+        if entry is not None:
+            entry.close()
+
+
+    def call(self, path, username, password, function, *args, **kwargs):
+        """
+        Calls an smbclient function for a path over the pooled session of its server. If the connection was
+        closed in the meantime, the session is registered again and the call is repeated once.
+
+        Args:
+            path (str): The UNC path.
+            username (str): The user name.
+            password (str): The password of the user.
+            function (callable): The smbclient function, e.g. `smbclient.open_file` or `smbclient.stat`.
+            *args, **kwargs: Further arguments of the function.
+
+        Returns:
+            The return value of the function.
+        """
+        server = self.getServer(path)
+        for attempt in range(2):
+            entry = self.getSession(server, username, password)
+            try:
+                return function(path, *args, username=username, password=password,
+                                connection_cache=entry.connectionCache, **kwargs)
+            except (SMBConnectionClosed, ConnectionError):
+                self.invalidate(server, username)
+                if attempt == 1:
+                    raise
+
+
+    def openFile(self, path, mode, username, password, **kwargs):
+        """
+        Opens a remote file over the pooled session of its server.
+
+        Args:
+            path (str): The UNC path.
+            mode (str): The mode in which to open the file (e.g., 'r' for read, 'rb' for binary read).
+            username (str): The user name.
+            password (str): The password of the user.
+            **kwargs: Further arguments of `smbclient.open_file`.
+
+        Returns:
+            file: The opened file.
+        """
+        file = self.call(path, username, password, smbclient.open_file, mode=mode, **kwargs)
+        with self.lock:
+            self.opens += 1
+        return file
+
+
+    def stat(self, path, username, password):
+        """
+        Returns:
+            SMBStatResult: The metadata of a remote file, see `openFile` for the arguments.
+        """
+        return self.call(path, username, password, smbclient.stat)
+
+
+    def listdir(self, path, username, password):
+        """
+        Returns:
+            list: The names of the entries of a remote directory, see `openFile` for the arguments.
+        """
+        return self.call(path, username, password, smbclient.listdir)
+
+
+    def startKeepalive(self):
+        with self.lock:
+            if self.keepaliveThread is not None:
+                return
+            self.stopEvent.clear()
+            self.keepaliveThread = threading.Thread(target=self.keepaliveLoop, name="SMBKeepalive", daemon=True)
+            self.keepaliveThread.start()
+
+
+    def keepaliveLoop(self):
+        """
+        Sends an echo over every session that was idle for a keepalive interval, sessions whose connection
+        does not answer are closed.
+        """
+        while not self.stopEvent.wait(self.keepaliveInterval):
+            with self.lock:
+                entries = list(self.sessions.values())
+            for entry in entries:
+                if time.monotonic() - entry.lastUsed < self.keepaliveInterval:
+                    continue
+                try:
+                    entry.echo()
+                except Exception as e:
+                    print(f"SMB session {entry.username}@{entry.server} lost: {e}")
+                    self.invalidate(entry.server, entry.username)
+
+
+    def close(self):
+        """
+        Stops the keepalive thread and closes all sessions.
+        """
+        self.stopEvent.set()
+        with self.lock:
+            entries = list(self.sessions.values())
+            self.sessions = {}
+            self.keepaliveThread = None
+        for entry in entries:
+            entry.close()
+
+
+class SMBSessionEntry():
+    """One registered session of SMBSessionManager, with its own connection cache."""
+
+    def __init__(self, server, username):
+        self.server = server
+        self.username = username
+        self.connectionCache = {}
+        self.session = None
+        self.lastUsed = time.monotonic()
+        # Only one thread registers the session
+        self.lock = threading.Lock()
+
+
+    def echo(self):
+        """Sends an SMB echo over the connection of the session."""
+        with self.lock:
+            if self.session is not None:
+                self.session.connection.echo()
+                self.lastUsed = time.monotonic()
+
+
+    def close(self):
+        """Closes the connection of the session."""
+        with self.lock:
+            self.session = None
+            try:
+                smbclient.reset_connection_cache(fail_on_error=False, connection_cache=self.connectionCache)
+            except Exception as e:
+                print(f"SMB session {self.username}@{self.server} could not be closed: {e}")
@@ -0,0 +1,73 @@
+import os
+import re
+
+
+class SystemLogHeader():
+    """Module, version, version date and result path of a machine, parsed from one line of the system log."""
+
+    # Line of the system log holding the result path of the current run
+    readLine = 8
+
+    def __init__(self, module, version, versionDate, versionPath):
+        self.module = module
+        self.version = version
+        self.versionDate = versionDate
+        self.versionPath = versionPath
+
+
+    @classmethod
+    def parse(cls, file, masch, modules):
+        """
+        Parses the header of an opened system log in one pass.
+        Args:
+            file (file): The opened system log.
+            masch (str): The machine identifier, used to build the version path.
+            modules (iterable): The module names that may appear in the result path.
+        Returns:
+            SystemLogHeader: The parsed header.
+        Raises:
+            ValueError: If neither version nor module string is found in the specified format.
+        """
+        # Create a regex pattern to match any of the module names
+        module_pattern = '|'.join(modules)
+        regex_pattern = rf'ergebnis\\({module_pattern})\\(\d{{2}}-\d{{4}})\\'
+
+        for lineNum, line in enumerate(file, start=1):
+            if lineNum == cls.readLine:
+                matchLF = re.search(r'\\(LF[^\\]*)\\', line)
+                matchLT = re.search(r'\\(LT[^\\]*)\\', line)
+                matchLFREF = re.search(r'\\(LFREF[^\\]*)\\', line)
+
+                # Find the version based on priority: LF > LT > LFREF > None
+                if matchLF:
+                    version = matchLF.group(1)
+                elif matchLT:
+                    version = matchLT.group(1)
+                elif matchLFREF:
+                    version = matchLFREF.group(1)
+                else:
+                    version = None
+
+                matchModul = re.search(regex_pattern, line)
+                modul = matchModul.group(1).strip() if matchModul else None
+                version_date = matchModul.group(2) if matchModul else None
+
+                if version and modul and version_date:
+                    return cls(modul, version, version_date, cls.buildVersionPath(masch, modul, version_date, version))
+                break
+
+        raise ValueError("Neither version nor modul string found in the specified format.")
+
+
+    @staticmethod
+    def buildVersionPath(masch, modulVersion, versionDate, softwareVersion):
+        """
+        Builds the result path of a run from the BASEPATH_TEMPLATE environment variable.
+
+        Returns:
+            str: The formatted path, None if BASEPATH_TEMPLATE is not set.
+        """
+        basepath_template = os.getenv("BASEPATH_TEMPLATE")
+        if basepath_template is None:
+            return None
+        return basepath_template.format(masch=masch, modulVersion=modulVersion, versionDate=versionDate, softwareVersion=softwareVersion)
@@ -4,8 +4,6 @@ import pyodbc
 import glob
 import json
 
-from PyQt5.QtWidgets import QMessageBox
-
 from Configurations.machines import Machines
 from Configurations.networkshare import NetworkShare
 from Configurations.read_fault import ReadFault
@@ -121,6 +119,8 @@ class AccessDBReader:
         if all_successful:
             self.informationWindow()
         else:
+            # Imported here, the reports are also generated without GUI (Logic.report_batch)
+            from PyQt5.QtWidgets import QMessageBox
             QMessageBox.warning(None, "Warnung", "Einige Module konnten nicht erfolgreich verarbeitet werden.")
 
 
@@ -131,5 +131,6 @@ class AccessDBReader:
         Returns:
             QMessageBox.StandardButton: The button that was clicked to dismiss the message box.
         """
+        from PyQt5.QtWidgets import QMessageBox
         return QMessageBox.information(None, "Information", "Datenbank Inhalte wurden aktualisiert.")
     
\ No newline at end of file
@@ -1,48 +1,100 @@
 from Configurations.read_timecontroll import ReadTimecontroll
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 import datetime as dt
+import heapq
+import itertools
 import time
 import os
 
 class FileWatcher:
+    # Runs the functions of all watchers, the observer threads only note the events
+    executor = None
+    executorLock = threading.Lock()
+    # One observer thread watches the directories of all watchers
+    observer = None
+    observerLock = threading.Lock()
+    watchCounts = {}  # watch -> number of watchers with a handler on it, see run and stop
+    # One thread runs the debounce timers of all watchers, see startTimer
+    timers = []  # heap of (due, token, watcher)
+    timersCondition = threading.Condition()
+    timerThread = None
+    timerTokens = itertools.count(1)
+
     def __init__(self, file_path, function=None, *args):
         self.file_path = file_path
         self.function = function
         self.args = args
-        self.observer = None
+        self.eventHandler = None
+        self.watch = None
         self._stop_flag = False
         self.readTimeControll = ReadTimecontroll()
+        # Events within the debounce window are coalesced into one call of the function,
+        # during a longer burst the function is still called every maxDelay seconds
+        self.debounce = float(os.getenv("FILE_WATCHER_DEBOUNCE", 2))
+        self.maxDelay = float(os.getenv("FILE_WATCHER_MAX_DELAY", 10))
+        self.lock = threading.Lock()
+        self.timer = None        # token of the pending debounce timer, None if no timer is pending
+        self.firstEvent = None   # time of the first event not processed yet
+        self.lastEvent = None    # time of the last event not processed yet
+        self.pendingEvents = 0
+        self.running = False     # the function runs on the worker pool
+
+    @classmethod
+    def getExecutor(cls):
+        """
+        Returns:
+            ThreadPoolExecutor: The worker pool shared by all watchers (FILE_WATCHER_WORKERS threads, default 4).
+        """
+        with cls.executorLock:
+            if cls.executor is None:
+                cls.executor = ThreadPoolExecutor(max_workers=int(os.getenv("FILE_WATCHER_WORKERS", 4)),
+                                                  thread_name_prefix="FileWatcher")
+            return cls.executor
+
+    @classmethod
+    def getObserver(cls):
+        """
+        Returns:
+            Observer: The started observer shared by all watchers.
+        """
+        with cls.observerLock:
+            if cls.observer is None:
+                cls.observer = Observer()
+                cls.observer.daemon = True
+                cls.observer.start()
+            return cls.observer
 
     def start(self):
         """
         Starts the file watcher.
 
         This method prints a message indicating the file path being watched,
-        sets the stop flag to False, and starts a new daemon thread that runs
-        the `run` method.
+        sets the stop flag to False, and registers the `run` handler on the shared observer.
         """
         print(f"Überwache {self.file_path}")
         self._stop_flag = False
-        threading.Thread(target=self.run, daemon=True).start()
+        self.run()
 
     def run(self):
         """
         Monitors a specified file for changes and triggers a function when the file is modified.
 
         This method sets up a file system event handler that watches for modifications to a specific file.
-        When the file is modified, it checks the current status of a machine and, if the machine is free,
-        executes a specified function with given arguments.
+        The modifications are debounced (`notify`), a burst of writes triggers the function once. If the machine
+        is free then, the function is executed with the given arguments on the shared worker pool (`process`).
 
-        The method runs an infinite loop that periodically checks for a stop flag to terminate the observer.
+        The handler is scheduled on the observer shared by all watchers, no thread is started per file.
+        `stop` removes the handler again, and the watch of the directory once no watcher uses it.
 
         Attributes:
             file_path (str): The path of the file to be monitored.
             readTimeControll (object): An object that provides the current status of the machine.
             args (list): A list of arguments to be passed to the function.
             function (callable): The function to be executed when the file is modified.
-            _stop_flag (bool): A flag to stop the observer loop.
+            _stop_flag (bool): A flag to ignore further events.
 
         Classes:
             FileChangeHandler: A nested class that handles file modification events.
@@ -64,33 +116,138 @@ class FileWatcher:
 
                 Behavior:
                     - Checks if the modified file is the one being watched.
-                    - Retrieves the current status of the machine associated with the file.
-                    - If the machine is free, logs the modification time and executes the associated function.
-                    - If the machine is not free, logs a waiting message.
-                    - Sleeps for 1 second before the next check.
+                    - Only notes the event (`notify`), the function runs later on the worker pool.
                 """
                 if event.src_path == self.outer_instance.file_path:
-                    now = dt.datetime.now()
-                    status = self.outer_instance.readTimeControll.getCurrentStatus(self.outer_instance.args[0])
-                    print(f"Status: {status}")
-                    if status:
-                        print("\033[32m" + f"[{now.strftime('%d.%m.%y - %H:%M')}] - Datei {self.outer_instance.file_path} wurde geändert." + "\033[0m")
-                        self.outer_instance.function(*self.outer_instance.args)
-                    else:
-                        print(f"Machine {self.outer_instance.args[0]} is not free. Waiting..."),
-                time.sleep(1)  # Check every second
-
-        event_handler = FileChangeHandler(self)
-        observer = Observer()
-        observer.schedule(event_handler, path=os.path.dirname(self.file_path), recursive=False)
-        observer.start()
-
-        while not self._stop_flag:
-            time.sleep(10)  # Überprüfung in regelmäßigen Abständen
-        observer.stop()
-        observer.join()
+                    self.outer_instance.notify()
+
+        self.eventHandler = FileChangeHandler(self)
+        observer = self.getObserver()
+        # Watchers of the same directory share one watch of the observer
+        with FileWatcher.observerLock:
+            self.watch = observer.schedule(self.eventHandler, path=os.path.dirname(self.file_path), recursive=False)
+            FileWatcher.watchCounts[self.watch] = FileWatcher.watchCounts.get(self.watch, 0) + 1
+
+    def notify(self):
+        """
+        Notes a modification of the file and starts the debounce timer, if it is not running yet.
+        Called on the observer thread, it never blocks.
+        """
+        now = time.monotonic()
+        with self.lock:
+            if self._stop_flag:
+                return
+            if self.firstEvent is None:
+                self.firstEvent = now
+            self.lastEvent = now
+            self.pendingEvents += 1
+            if self.timer is None and not self.running:
+                self.startTimer(self.debounce)
+
+
+    def startTimer(self, delay):
+        """
+        Schedules `flush` on the timer thread shared by all watchers, no thread is started per debounce window.
+        A timer replaced or cancelled (`stop`) is skipped when it is due, its token is no longer `self.timer`.
+
+        Args:
+            delay (float): Seconds until `flush` checks the pending events. Called with `self.lock` held.
+        """
+        token = next(FileWatcher.timerTokens)
+        self.timer = token
+        with FileWatcher.timersCondition:
+            heapq.heappush(FileWatcher.timers, (time.monotonic() + delay, token, self))
+            if FileWatcher.timerThread is None:
+                FileWatcher.timerThread = threading.Thread(target=FileWatcher.runTimers, name="FileWatcherTimer", daemon=True)
+                FileWatcher.timerThread.start()
+            FileWatcher.timersCondition.notify()
+
+
+    @classmethod
+    def runTimers(cls):
+        """
+        Loop of the timer thread: calls `flush` of each watcher whose timer is due.
+        """
+        while True:
+            with cls.timersCondition:
+                while not cls.timers or cls.timers[0][0] > time.monotonic():
+                    cls.timersCondition.wait(cls.timers[0][0] - time.monotonic() if cls.timers else None)
+                due, token, watcher = heapq.heappop(cls.timers)
+            try:
+                watcher.flush(token)
+            except Exception as e:
+                print(f"Error flushing the changes of {watcher.file_path}: {e}")
+
+
+    def flush(self, token):
+        """
+        Hands the pending events to the worker pool once the file was quiet for the debounce window,
+        or the first of them is maxDelay seconds old.
+
+        Args:
+            token (int): The token of the timer that is due, see `startTimer`.
+        """
+        with self.lock:
+            if token != self.timer:
+                return
+            self.timer = None
+            if self._stop_flag or self.firstEvent is None:
+                return
+            now = time.monotonic()
+            wait = min(self.lastEvent + self.debounce, self.firstEvent + self.maxDelay) - now
+            if wait > 0:
+                self.startTimer(wait)
+                return
+            events = self.pendingEvents
+            self.firstEvent = None
+            self.lastEvent = None
+            self.pendingEvents = 0
+            self.running = True
+        self.getExecutor().submit(self.process, events)
+
+
+    def process(self, events):
+        """
+        Executes the function once for all coalesced events, if the machine is free. Events arriving meanwhile
+        are processed in the next run, never two runs of the same file at the same time.
+
+        Args:
+            events (int): The number of modifications coalesced into this run.
+        """
+        try:
+            now = dt.datetime.now()
+            status = self.readTimeControll.getCurrentStatus(self.args[0])
+            print(f"Status: {status}")
+            if status:
+                print("\033[32m" + f"[{now.strftime('%d.%m.%y - %H:%M')}] - Datei {self.file_path} wurde geändert ({events} Änderungen)." + "\033[0m")
+                self.function(*self.args)
+            else:
+                print(f"Machine {self.args[0]} is not free. Waiting...")
+        except Exception as e:
+            print(f"Error processing changes of {self.file_path}: {e}")
+        finally:
+            with self.lock:
+                self.running = False
+                if self.firstEvent is not None and not self._stop_flag:
+                    self.startTimer(max(0, self.lastEvent + self.debounce - time.monotonic()))
+
 
     def stop(self):
         """stops the file watcher"""
-        self._stop_flag = True
+        with self.lock:
+            self._stop_flag = True
+            # The pending timer is skipped when it is due
+            self.timer = None
+            eventHandler, self.eventHandler = self.eventHandler, None
+        if eventHandler is not None:
+            observer = self.getObserver()
+            with FileWatcher.observerLock:
+                observer.remove_handler_for_watch(eventHandler, self.watch)
+                count = FileWatcher.watchCounts.get(self.watch, 1) - 1
+                if count > 0:
+                    FileWatcher.watchCounts[self.watch] = count
+                else:
+                    # No watcher left on the directory, its emitter thread is stopped
+                    FileWatcher.watchCounts.pop(self.watch, None)
+                    observer.unschedule(self.watch)
         print(f"Beobachtung von {self.file_path} gestoppt.")
\ No newline at end of file
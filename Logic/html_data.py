@@ -1,9 +1,8 @@
-import re
 import os
 import sys
 import random
 import string
-import threading
+import asyncio
 import webbrowser
 import time
 import datetime as dt
@@ -19,9 +18,14 @@ from Configurations.read_timecontroll import ReadTimecontroll
 
 from Logic.tc_analyzer import TestCaseAnalyzer
 from Logic.file_watcher import FileWatcher
+from Logic.monitor_scheduler import MonitorScheduler
+from Logic.render_tracker import RenderTracker
 from Logic.access_db_reader import AccessDBReader
-
-from bs4 import BeautifulSoup # HTML div id parsen
+from Logic.reporter_data import ReporterData
+from Logic.report_server import ReportServer
+from Logic.html_template import HTMLTemplate
+from Logic.report_writer import ReportWriter
+from Logic.svg_chart import renderPieChart, renderProgressBar
 
 class HTMLData:
 
@@ -30,6 +34,14 @@ class HTMLData:
         self.reportTemplatePath = "./Resources/Logfiles_Template/html_reportertemplate.html"
         self.logfileTemplatePath = "./Resources/Logfiles_Template/html_logfiletemplate.html"
         self.reporterHTML = "_reporter.html"
+        # Split once at the placeholders, read again only when the file changed
+        self.reportTemplate = HTMLTemplate(self.reportTemplatePath, [
+            "[!!INFOPFAD!!]", "[!!TABLEHERE!!]", "[!!NameOfMasch!!]", "[!!DATAFILE!!]"])
+        self.logfileTemplate = HTMLTemplate(self.logfileTemplatePath, [
+            "[!!LOGS-HERE!!]", "[!!NameOfMasch!!]", "[!!Error!!]", "[[!!Category!!]]"])
+        # Failed test cases per error page, larger categories get an index and numbered pages
+        self.errorPageSize = int(os.getenv("ERROR_PAGE_SIZE", 500))
+        self.errorPageKeys = {}
       
         # Configurations
         self.machines = Machines()
@@ -42,6 +54,14 @@ class HTMLData:
         self.readFault = ReadFault()
         self.accesDBReader = AccessDBReader()
         self.tcAnalyzer = TestCaseAnalyzer()
+        # Writes the report files only if they changed, atomically
+        self.reportWriter = ReportWriter()
+        self.reporterData = ReporterData(self.reportWriter)
+        # Patterns whose chart and error pages are up to date, see modifyHTMLFile
+        self.renderTracker = RenderTracker()
+        self.reportServer = None
+        # One loop drives the monitoring of all machines, see monitorSystemLog
+        self.scheduler = MonitorScheduler()
         self.machineErrorStar = self.readFault.errorList[0] # .*. 
         self.machineErrorPlus = self.readFault.errorList[1] # .+.
         self.machineErrorF = self.readFault.errorList[2] # .F.
@@ -55,12 +75,13 @@ class HTMLData:
         self.current_file_watcher = None
 
 
-    def getProgressBar(self,progress_bar_id):
+    def getProgressBar(self,progress_bar_id, progress=0):
         """
-        Generates HTML for a progress bar with the specified ID.
+        Generates HTML for a progress bar with the specified ID, the bar itself is an inline SVG.
 
         Args:
             progress_bar_id (str): The ID to assign to the progress bar element.
+            progress (int, optional): The progress in percent shown initially. Defaults to 0.
 
         Returns:
             str: A string containing the HTML for the progress bar.
@@ -69,12 +90,31 @@ class HTMLData:
             "<div class='progress-container'>\n"
             "<span class='progress-bar-digit'>0%</span>\n"
             "<div class='progress-bar-container'>\n"
-            f"<div class='progress-bar' id={progress_bar_id} style='width: 0%;'>0%</div></div>\n"
+            f"{renderProgressBar(progress_bar_id, progress)}</div>\n"
             "<span class='progress-bar-digit'>100%</span></div>\n"
         )
         return progress_bar_html_body
 
 
+    def getPieChart(self, machine, category, data_dict):
+        """
+        Renders the pie chart of a category as inline SVG. Each slice links to the error page of its pattern.
+
+        Args:
+            machine (str): The machine identifier.
+            category (str): The category.
+            data_dict (dict): The number of failed test cases per pattern, see `collectDataForHTML`.
+
+        Returns:
+            str: The <svg> element of the chart.
+        """
+        slices = [
+            (label, data_dict.get(label, 0), f"./Logfiles_Errors/{self.getErrorPageName(machine, category, fileKey)}")
+            for label, fileKey in ((".*.", "star"), (".+.", "plus"), (".F.", "f"), (".H.", "h"))
+        ]
+        return renderPieChart(f"{machine} - {category} Auszug", slices)
+
+
     def generateHTMLFilesforMachine(self, machine, category=None, currentStateTC=None):
         """
         Generates HTML files for a given machine, including error charts and progress bars.
@@ -89,18 +129,19 @@ class HTMLData:
             4. Fetches categories and errors for the machine.
             5. Collects data and creates HTML error files for each category.
             6. Reads the HTML template content.
-            7. Generates JavaScript code for Google Charts based on the collected data.
+            7. Renders the pie charts and progress bars as inline SVG from the collected data.
             8. Constructs HTML table rows for each category.
             9. Replaces placeholders in the template with generated content.
-            10. Writes the final HTML content to a file.
-        The generated HTML files include interactive pie charts for error visualization and progress bars indicating the current state.
+            10. Writes the final HTML content to a file and the initial data file (`ReporterData`) next to it.
+        The generated HTML files include pie charts for error visualization, whose slices link to the error pages, and progress
+        bars indicating the current state. The page loads no scripts or styles from the network.
+        Later changes only rewrite the data file, the page loads it and replaces the charts whose numbers changed.
         """
         
         self.readFault.readOverview(machine)
         self.dictOfMachines = {machine: {}}
-        all_internal_script = ""
+        self.reporterData.reset(machine)
         all_internal_table = "<tr>"
-        all_internal_script_prozessbar = ""
         internal_counter = 0
         if currentStateTC is None:
             currentStateTC = 0
@@ -108,14 +149,11 @@ class HTMLData:
         modul = self.readFault.getCurrentVersionMachine(machine, modulOption=True)
         self.readCategoriesQTP.getCategories(machine, modul)
         print(self.readCategoriesQTP.getCategories(machine, modul))
+        # Everything is rendered from the overview just read, not from a snapshot
+        self.renderTracker.reset(machine)
         for category in self.readCategoriesQTP.categories[machine][modul]:
-            for pattern in self.readFault.errorList:
-                self.readFault.getErrorsForPattern(machine, category, pattern)
-                self.collectDataForHTML(machine, category)
-                self.createHTMLErrorFiles(machine, category)
-
-        with open(self.reportTemplatePath, "r") as f:
-            template_content = f.read()
+            self.collectDataForHTML(machine, category)
+            self.createHTMLErrorFiles(machine, category)
 
         for category in self.dictOfMachines[machine]:
             data_dict = self.dictOfMachines[machine][category]
@@ -125,59 +163,17 @@ class HTMLData:
             internal_hdata = data_dict.get(".H.", 0)
 
             if category not in self.randomStrings or not self.randomStrings[category]:
-                randomStringFunction = "XYZ" + self.getRandom(10)
                 randomStringChartdiagram = self.getRandom(10)
                 randomStringProgressbar = self.getRandom(10)
                 self.randomStrings[category] = {
-                    "randomStringFunction": randomStringFunction,
                     "randomStringChartdiagram": randomStringChartdiagram,
                     "randomStringProgressbar": randomStringProgressbar,
                 }
             else:
-                randomStringFunction = self.getRandomStringForCategory(category, "randomStringFunction")
                 randomStringChartdiagram = self.getRandomStringForCategory(category, "randomStringChartdiagram")
                 randomStringProgressbar = self.getRandomStringForCategory(category, "randomStringProgressbar")
 
-            internal_script = (
-                f"<!-- START DATA BLOCK FOR: {machine}_{category}-->\n"
-                f"google.charts.setOnLoadCallback({randomStringFunction});\n"
-                f"function {randomStringFunction}() {{\n"
-                "var data = new google.visualization.DataTable();\n"
-                "data.addColumn('string', 'Fehlercode');\n"
-                "data.addColumn('number', 'Anzahl');\n"
-                "data.addRows([\n"
-                f"['.*.', {internal_stardata}],\n"
-                f"['.+.', {internal_plusdata}],\n"
-                f"['.F.', {internal_fdata}],\n"
-                f"['.H.', {internal_hdata}],\n"
-                "]);\n"
-                "var options = {\n"
-                f"title: '{machine} - {category} Auszug',\n"
-                "colors: ['#FF0000', '#0000FF', '#DA70D6', '#32CD32'],\n"
-                "titleTextStyle: { fontSize: 18, bold: true },\n"
-                "legend: { position: 'right', textStyle: { fontSize: 16, bold: true } },\n"
-                "chartArea: { width: '80%', height: '70%' },\n"
-                "pieSliceTextStyle: { fontSize: 14 },\n"
-                "};\n"
-                f"var chart = new google.visualization.PieChart(document.getElementById('{randomStringChartdiagram}'));\n"
-                "chart.draw(data, options);\n"
-                "google.visualization.events.addListener(chart, 'select', function() {\n"
-                "var selectedItem = chart.getSelection()[0];\n"
-                "if (selectedItem) {\n"
-                "var topping = data.getValue(selectedItem.row, 0);\n"
-                "var url;\n"
-                f"if (topping === '.*.') {{ url = './Logfiles_Errors/{machine}_{category}_star.html'; }}\n"
-                f"else if (topping === '.+.') {{ url = './Logfiles_Errors/{machine}_{category}_plus.html'; }}\n"
-                f"else if (topping === '.F.') {{ url = './Logfiles_Errors/{machine}_{category}_f.html'; }}\n"
-                f"else if (topping === '.H.') {{ url = './Logfiles_Errors/{machine}_{category}_h.html'; }}\n"
-                "window.open(url, '_blank');\n"
-                "}\n"
-                "});\n"
-                "}\n"
-                f"<!-- END DATA BLOCK FOR: {machine}_{category}-->\n"
-            )
-            all_internal_script += internal_script
-            all_internal_script_prozessbar += "{id:"+f"'{randomStringProgressbar}'"+", progress: "f"{currentStateTC}"" },\n"
+            chart = self.getPieChart(machine, category, data_dict)
         
             if internal_counter == 4:
                 all_internal_table += "</tr>\n<tr>"
@@ -188,24 +184,28 @@ class HTMLData:
             all_internal_table += (
                 f"\n<!-- START DATA SPAN CLASS: {machine}_{category}-->\n"
                 "<td style='border: 1px solid #00772c;'>\n"
-                f"<div id={randomStringChartdiagram} style='width: 400px; height: 300px;'></div>\n"
+                f"<div id={randomStringChartdiagram} class='chart'>{chart}</div>\n"
                 f"<div class='current-state'>\n"
-                f"<span class = 'current-state-digit'>Testfall: </span>\n"
+                f"<span class = 'current-state-digit' id='{randomStringChartdiagram}_state'>Testfall: </span>\n"
                 f"</div>\n"
-                f"{self.getProgressBar(randomStringProgressbar)}</td>\n"
+                f"{self.getProgressBar(randomStringProgressbar, currentStateTC)}</td>\n"
                 f"<!-- END DATA SPAN CLASS: {machine}_{category}-->\n"
             )
+            self.reporterData.updateCategory(machine, category, randomStringChartdiagram, randomStringProgressbar,
+                                             f"{randomStringChartdiagram}_state", data_dict, "Testfall: ", currentStateTC,
+                                             chart=chart)
 
         all_internal_table += "</tr>"
 
-        template_content = template_content.replace("[!!SCRIPTHERE!!]", all_internal_script)
-        template_content = template_content.replace("[!!INFOPFAD!!]", self.readFault.getVersionPath(machine))
-        template_content = template_content.replace("[!!TABLEHERE!!]", all_internal_table)
-        template_content = template_content.replace("[!!NameOfMasch!!]", machine)
-        template_content = template_content.replace("[!!PROGRESSBARDATA!!]", all_internal_script_prozessbar)
+        template_content = self.reportTemplate.render({
+            "[!!INFOPFAD!!]": self.readFault.getVersionPath(machine),
+            "[!!TABLEHERE!!]": all_internal_table,
+            "[!!NameOfMasch!!]": machine,
+            "[!!DATAFILE!!]": self.reporterData.getDataFileName(machine),
+        })
 
-        with open(f"{os.getenv("REPORTER_PATH")}" + "\\" + f"{machine + self.reporterHTML}", "w") as f:
-            f.write(template_content)
+        self.reportWriter.write(f"{os.getenv("REPORTER_PATH")}" + "\\" + f"{machine + self.reporterHTML}", template_content)
+        self.reporterData.write(machine)
 
 
     def getRandomStringForCategory(self, category, key):
@@ -221,15 +221,17 @@ class HTMLData:
         return self.randomStrings.get(category, {}).get(key, None)
 
 
-    def collectDataForHTML(self, machine, category):
+    def collectDataForHTML(self, machine, category, snapshot=None):
         """
         Collects error data for a specified machine and category and stores it in the dictOfMachines attribute.
 
         Args:
             machine (str): The name or identifier of the machine.
             category (str): The category of errors to collect data for.
+            snapshot (OverviewSnapshot, optional): Takes the counts of the snapshot. Defaults to None.
 
-        The method updates the dictOfMachines attribute with the count of errors for different patterns:
+        The method updates the dictOfMachines attribute with the count of errors for different patterns,
+        read from the per-pattern counters of ReadFault:
             - ".*.": Errors matching the machineErrorStar pattern.
             - ".+.": Errors matching the machineErrorPlus pattern.
             - ".F.": Errors matching the machineErrorF pattern.
@@ -239,23 +241,27 @@ class HTMLData:
         """
         if machine not in self.dictOfMachines:
             self.dictOfMachines[machine] = {}
+        counts = snapshot.counts if snapshot is not None else self.readFault.getErrorCounts(machine, category)
         self.dictOfMachines[machine][category] = {
-            ".*.": len(self.readFault.getErrorsForPattern(machine, category, pattern=self.machineErrorStar)),
-            ".+.": len(self.readFault.getErrorsForPattern(machine, category, pattern=self.machineErrorPlus)),
-            ".F.": len(self.readFault.getErrorsForPattern(machine, category, pattern=self.machineErrorF)),
-            ".H.": len(self.readFault.getErrorsForPattern(machine, category, pattern=self.machineRightH))
+            ".*.": counts.get(self.machineErrorStar, 0),
+            ".+.": counts.get(self.machineErrorPlus, 0),
+            ".F.": counts.get(self.machineErrorF, 0),
+            ".H.": counts.get(self.machineRightH, 0)
         }
 
 
-    def createHTMLErrorFiles(self, machine, category):
+    def createHTMLErrorFiles(self, machine, category, snapshot=None, patterns=None):
         """
         Generates HTML error files for a specified machine and error category.
-        This method reads error messages from a predefined dictionary and uses a template
-        to create HTML files for different types of errors (star, plus, f, h). The generated
-        HTML files are saved in the specified error reporter path.
+        This method renders the error records of ReadFault to HTML only now and uses the pre-split logfile
+        template (`HTMLTemplate`, read again only when the file changed) to create HTML files for different
+        types of errors (star, plus, f, h). The generated HTML files are saved in the specified error reporter path.
+        Large categories are split into pages of `errorPageSize` test cases, see `writeErrorPages`.
         Args:
             machine (str): The name of the machine for which the error files are being created.
             category (str): The category of errors to be processed.
+            snapshot (OverviewSnapshot, optional): Renders the records of the snapshot. Defaults to None.
+            patterns (list, optional): Only the pages of these error patterns are written. Defaults to None (all).
         Raises:
             FileNotFoundError: If the template file specified by `self.logfileTemplatePath` does not exist.
             IOError: If there is an error reading the template file or writing the HTML files.
@@ -264,174 +270,229 @@ class HTMLData:
         path = "./Resources/Logfiles_Errors/"
         os.makedirs(path, exist_ok=True)
 
-        machine_errors = self.readFault.dictMachineErrors.get(machine, {})
-        starFilePath = f"{os.getenv("ERROR_REPORTER_PATH")}\\{machine.lower()}_{category}_star.html"
-        plusFilePath = f"{os.getenv("ERROR_REPORTER_PATH")}\\{machine.lower()}_{category}_plus.html"
-        fFilePath = f"{os.getenv("ERROR_REPORTER_PATH")}\\{machine.lower()}_{category}_f.html"
-        hFilePath = f"{os.getenv("ERROR_REPORTER_PATH")}\\{machine.lower()}_{category}_h.html"
-
-        
-        with open(self.logfileTemplatePath, "r") as f:
-            template_content = f.read()
-
-        logsHereScript = "[!!LOGS-HERE!!]"
-        nameOfMaschScript = "[!!NameOfMasch!!]"
-        errorScript = "[!!Error!!]"
-        categoryScript = "[[!!Category!!]]"
-        content_star = template_content
-        content_plus = template_content
-        content_f = template_content
-        content_h = template_content
+        if snapshot is not None:
+            machine_errors = {category: snapshot.errors}
+        else:
+            machine_errors = self.readFault.dictMachineErrors.get(machine, {})
 
         if category in machine_errors:
             category_errors = machine_errors[category]
 
-            if self.machineErrorStar in category_errors:
-                error_messages = category_errors[self.machineErrorStar]
-                cleaned_messages = [msg.replace("'", "").replace("[", "").replace("]", "") for msg in error_messages]
-                internal_skript_star = f"{''.join(cleaned_messages)}"
-                content_star = template_content.replace(logsHereScript, internal_skript_star)
-                content_star = content_star.replace(nameOfMaschScript, machine)
-                content_star = content_star.replace(errorScript, self.machineErrorStar)
-                content_star = content_star.replace(categoryScript, category)
-
-            if self.machineErrorPlus in category_errors:
-                error_messages = category_errors[self.machineErrorPlus]
-                cleaned_messages = [msg.replace("'", "").replace("[", "").replace("]", "") for msg in error_messages]
-                internal_skript_plus = f"{''.join(cleaned_messages)}"
-                content_plus = template_content.replace(logsHereScript, internal_skript_plus)
-                content_plus = content_plus.replace(nameOfMaschScript, machine)
-                content_plus = content_plus.replace(errorScript, self.machineErrorPlus)
-                content_plus = content_plus.replace(categoryScript, category)
-
-            if self.machineErrorF in category_errors:
-                error_messages = category_errors[self.machineErrorF]
-                cleaned_messages = [msg.replace("'", "").replace("[", "").replace("]", "") for msg in error_messages]
-                internal_skript_f = f"{''.join(cleaned_messages)}"
-                content_f = template_content.replace(logsHereScript, internal_skript_f)
-                content_f = content_f.replace(nameOfMaschScript, machine)
-                content_f = content_f.replace(errorScript, self.machineErrorF)
-                content_f = content_f.replace(categoryScript, category)
-
-            if self.machineRightH in category_errors:
-                error_messages = category_errors[self.machineRightH]
-                cleaned_messages = [msg.replace("'", "").replace("[", "").replace("]", "") for msg in error_messages]
-                internal_skript_h = f"{''.join(cleaned_messages)}"
-                content_h = template_content.replace(logsHereScript, internal_skript_h)
-                content_h = content_h.replace(nameOfMaschScript, machine)
-                content_h = content_h.replace(errorScript, self.machineRightH)
-                content_h = content_h.replace(categoryScript, category)
-
-            # Write the content to the respective files
-            with open(starFilePath, "w") as f:
-                f.write(content_star)
-
-            with open(plusFilePath, "w") as f:
-                f.write(content_plus)
-
-            with open(fFilePath, "w") as f:
-                f.write(content_f)
-
-            with open(hFilePath, "w") as f:
-                f.write(content_h)
-
-
-    def overwriteHTMLErrorFiles(self, machine, category):
+            for fileKey, errorPattern in (("star", self.machineErrorStar), ("plus", self.machineErrorPlus),
+                                          ("f", self.machineErrorF), ("h", self.machineRightH)):
+                if patterns is not None and errorPattern not in patterns:
+                    continue
+                if errorPattern in category_errors:
+                    self.writeErrorPages(machine, category, fileKey, errorPattern, category_errors[errorPattern], snapshot)
+                else:
+                    # Patterns without entry get the unchanged template
+                    self.reportWriter.write(self.getErrorPagePath(machine, category, fileKey), self.logfileTemplate.getSource())
+
+
+    def getErrorPageName(self, machine, category, fileKey, page=None):
+        """
+        Args:
+            machine (str): The machine identifier.
+            category (str): The category.
+            fileKey (str): "star", "plus", "f" or "h".
+            page (int, optional): The number of the page, None for the first page / index the pie chart links to.
+
+        Returns:
+            str: The file name of the error page.
+        """
+        suffix = f"_{page}" if page is not None else ""
+        return f"{machine.lower()}_{category}_{fileKey}{suffix}.html"
+
+
+    def getErrorPagePath(self, machine, category, fileKey, page=None):
+        """
+        Returns:
+            str: The path of the error page in ERROR_REPORTER_PATH, see `getErrorPageName` for the arguments.
+        """
+        return f"{os.getenv("ERROR_REPORTER_PATH")}\\{self.getErrorPageName(machine, category, fileKey, page)}"
+
+
+    def getErrorPageNavigation(self, machine, category, fileKey, page, hasNext):
+        """
+        Builds the navigation line of a numbered error page. It does not contain the number of pages,
+        so a full page stays unchanged when further pages are added.
+
+        Args:
+            machine (str): The machine identifier.
+            category (str): The category.
+            fileKey (str): "star", "plus", "f" or "h".
+            page (int): The number of the page.
+            hasNext (bool): True if a following page exists.
+
+        Returns:
+            str: The HTML of the navigation.
+        """
+        def link(linkPage, text):
+            return f"<a href='./{self.getErrorPageName(machine, category, fileKey, linkPage)}'>{text}</a>"
+
+        parts = [link(None, "Übersicht")]
+        if page > 1:
+            parts.append(link(page - 1, f"&lsaquo; Seite {page - 1}"))
+        parts.append(f"<b>Seite {page}</b>")
+        if hasNext:
+            parts.append(link(page + 1, f"Seite {page + 1} &rsaquo;"))
+        return "<p class='page-navigation'>" + " | ".join(parts) + "</p>\n"
+
+
+    def writeErrorPages(self, machine, category, fileKey, errorPattern, records, snapshot=None, splice=False):
+        """
+        Writes the error pages of one pattern.
+        Args:
+            machine (str): The machine identifier.
+            category (str): The category.
+            fileKey (str): "star", "plus", "f" or "h".
+            errorPattern (str): The error pattern.
+            records (list): The ErrorRecord list of the pattern.
+            snapshot (OverviewSnapshot, optional): The snapshot the records belong to. Defaults to None.
+            splice (bool, optional): If True, existing pages only get their logs region replaced
+                (`ReportWriter.splice`) instead of being written from the template. Defaults to False.
+        Notes:
+            - Up to `errorPageSize` failed test cases the messages are shown on the page the pie chart links to.
+            - Above that the page becomes an index and the messages go to numbered pages of `errorPageSize`
+              test cases each, with a navigation to the neighbouring pages.
+            - A numbered page is only rendered and written if its records changed. Errors are appended,
+              so normally only the last page (and the small index) is written per update.
+        """
+        def store(path, logs):
+            if splice and os.path.exists(path):
+                self.reportWriter.splice(path, "<!-- START LOGS -->", "<!-- END LOGS -->", logs)
+            else:
+                content = self.logfileTemplate.render({
+                    "[!!LOGS-HERE!!]": ''.join(logs),
+                    "[!!NameOfMasch!!]": machine,
+                    "[!!Error!!]": errorPattern,
+                    "[[!!Category!!]]": category,
+                })
+                self.reportWriter.write(path, content, logs)
+
+        indexPath = self.getErrorPagePath(machine, category, fileKey)
+        if len(records) <= self.errorPageSize:
+            store(indexPath, self.readFault.renderErrorMessages(machine, category, errorPattern, snapshot) if records else [])
+            return
+
+        pageCount = (len(records) + self.errorPageSize - 1) // self.errorPageSize
+        index = []
+        for page in range(1, pageCount + 1):
+            start = (page - 1) * self.errorPageSize
+            stop = min(start + self.errorPageSize, len(records))
+            pageRecords = records[start:stop]
+            index.append(f"<p><a href='./{self.getErrorPageName(machine, category, fileKey, page)}'>Seite {page}</a>: "
+                         f"Testfall {pageRecords[0].testCase} - {pageRecords[-1].testCase} ({len(pageRecords)} Fehler)</p>\n")
+
+            # Same records and navigation as written last time: nothing to do
+            pagePath = self.getErrorPagePath(machine, category, fileKey, page)
+            hasNext = page < pageCount
+            pageKey = (len(pageRecords), pageRecords[0].start, pageRecords[-1].end, hasNext)
+            if self.errorPageKeys.get(pagePath) == pageKey and os.path.exists(pagePath):
+                continue
+
+            navigation = self.getErrorPageNavigation(machine, category, fileKey, page, hasNext)
+            messages = self.readFault.renderErrorMessages(machine, category, errorPattern, snapshot, start, stop)
+            store(pagePath, [navigation] + messages + [navigation])
+            self.errorPageKeys[pagePath] = pageKey
+
+        store(indexPath, [f"<p>{len(records)} Fehler auf {pageCount} Seiten</p>\n"] + index)
+
+
+    def overwriteHTMLErrorFiles(self, machine, category, snapshot=None, patterns=None):
         """
         Overwrites specific HTML error files for a given machine and category with updated error logs.
         Args:
             machine (str): The name of the machine for which the error files are being overwritten.
             category (str): The category of errors to be updated in the HTML files.
+            snapshot (OverviewSnapshot, optional): Uses the records of the snapshot instead of reading the overview. Defaults to None.
+            patterns (list, optional): Only the pages of these error patterns are written. Defaults to the patterns of the
+                snapshot that got new records since they were last rendered (`RenderTracker`), without snapshot to all.
         Raises:
             IOError: If the HTML file cannot be opened after multiple attempts due to being used by another process.
         This method performs the following steps:
         1. Creates the directory for error log files if it does not exist.
-        2. Reads the overview of faults for the specified machine.
-        3. Constructs file paths for different error categories (star, plus, f, h).
-        4. For each file path, attempts to open and read the file content, retrying if the file is locked.
-        5. Parses the HTML content and finds the div element with id "logs".
-        6. Clears the old content in the "logs" div and inserts new error messages from the machine_errors dictionary.
-        7. Saves the updated HTML content back to the file.
+        2. Reads the overview of faults for the specified machine, unless a snapshot of the change is given.
+        3. Constructs file paths for different error categories (star, plus, f, h), numbered pages for large categories.
+        4. For each file path, copies the file line by line up to the "<!-- START LOGS -->" marker, retrying if the file is locked.
+        5. Writes the new error messages from the machine_errors dictionary instead of the old ones.
+        6. Copies the rest of the file from the "<!-- END LOGS -->" marker and replaces the file with the copy.
         Note:
-            The method assumes that the error messages are stored in a dictionary structure within the readFault attribute.
+            The error records are stored in a dictionary structure within the readFault attribute and rendered on demand.
         """
         
+        if snapshot is not None and patterns is None:
+            patterns = self.renderTracker.getDirtyPatterns(machine, category, snapshot.versions)
+            if not patterns:
+                return
+
         path = "./Resources/Logfiles_Errors/"
         os.makedirs(path, exist_ok=True)
-        self.readFault.readOverview(machine)
-        machine_errors = self.readFault.dictMachineErrors.get(machine, {})
-        file_paths = {
-            "star": f"{os.getenv("ERROR_REPORTER_PATH")}\\{machine.lower()}_{category}_star.html",
-            "plus": f"{os.getenv("ERROR_REPORTER_PATH")}\\{machine.lower()}_{category}_plus.html",
-            "f": f"{os.getenv("ERROR_REPORTER_PATH")}\\{machine.lower()}_{category}_f.html",
-            "h": f"{os.getenv("ERROR_REPORTER_PATH")}\\{machine.lower()}_{category}_h.html",
-        }
+        if snapshot is not None:
+            machine_errors = {category: snapshot.errors}
+        else:
+            self.readFault.readOverview(machine)
+            machine_errors = self.readFault.dictMachineErrors.get(machine, {})
 
-        def insert_new_content(file_path, error_key):
+        def insert_new_content(file_key, error_key):
             """
-            Inserts new content into an HTML file by replacing the content of a <div> element with id "logs".
+            Inserts new content into the error pages of a pattern by replacing the lines between the markers of the logs region.
             Args:
-                file_path (str): The path to the HTML file.
+                file_key (str): "star", "plus", "f" or "h", the suffix of the HTML files.
                 error_key (str): The key to retrieve error messages from the machine_errors dictionary.
             Raises:
                 IOError: If the file cannot be opened after the maximum number of retries.
             Notes:
-                - The function attempts to open the file up to 5 times if it is being used by another process.
-                - The function parses the HTML content using BeautifulSoup.
-                - The function clears the existing content of the <div> element with id "logs" and inserts new content.
+                - The function attempts to open the file up to 5 times if it is being used by another process
+                  or cannot be replaced (access denied).
+                - The document is not parsed, only the region between "<!-- START LOGS -->" and "<!-- END LOGS -->"
+                  in the div with id "logs" is replaced (see `ReportWriter.splice`), and only if it changed.
+                - Large categories are split into numbered pages, only the pages whose records changed are
+                  written (see `writeErrorPages`).
                 - The new content is retrieved from the machine_errors dictionary based on the provided error_key.
             """
             max_retries = 5
             retry_delay = 1  # Sekunden
-            file_content = ""
+            file_path = self.getErrorPagePath(machine, category, file_key)
             if not os.path.exists(file_path):
                 print(f"{file_path} existiert nicht.")
                 return
 
+            # Neuen Inhalt aus dem machine_errors Dictionary einfügen
+            records = machine_errors.get(category, {}).get(error_key) or []
+
             for attempt in range(max_retries):
                 try:
-                    with open(file_path, "r") as file:
-                        file_content = file.read()
-                    break
+                    self.writeErrorPages(machine, category, file_key, error_key, records, snapshot, splice=True)
+                    return
+                except ValueError:
+                    print(f"{file_path} enthält keine Markierungen für die Logs.")
+                    return
                 except IOError as e:
-                    if "being used by another process" in str(e):
+                    # WinError 32 while reading, WinError 5 (PermissionError) while replacing a page the browser has open
+                    if isinstance(e, PermissionError) or "being used by another process" in str(e):
                         print(f"Datei {file_path} ist gesperrt, Versuch {attempt + 1} von {max_retries}. Warte {retry_delay} Sekunden...")
                         time.sleep(retry_delay)
                     else:
                         raise
-            else:
-                raise IOError(f"Konnte die Datei {file_path} nach {max_retries} Versuchen nicht öffnen.")
-
-            # HTML parsen
-            soup = BeautifulSoup(file_content, 'html.parser')
-            
-            # Div-Element mit id "logs" finden
-            logs_div = soup.find("div", {"id": "logs"})
-            if logs_div:
-                # Alten Inhalt entfernen
-                logs_div.clear()
-
-                # Neuen Inhalt aus dem machine_errors Dictionary einfügen
-                error_messages = machine_errors.get(category, {}).get(error_key, [])
-                if error_messages:
-                    cleaned_messages = [msg.replace("'", "").replace("[", "").replace("]", "") for msg in error_messages]
-                    logs_div.append(BeautifulSoup("".join(cleaned_messages), 'html.parser'))
-                # Änderungen speichern
-                with open(file_path, "w") as file:
-                    file.write(str(soup))
-
-        # Dateien überschreiben
-        insert_new_content(file_paths["star"], '.*.')
-        insert_new_content(file_paths["plus"], '.+.')
-        insert_new_content(file_paths["f"], '.F.')
-        insert_new_content(file_paths["h"], '.H.')
+            raise IOError(f"Konnte die Datei {file_path} nach {max_retries} Versuchen nicht öffnen.")
+
+        # Dateien überschreiben, nur die Muster mit neuen Einträgen
+        for file_key, error_key in (("star", '.*.'), ("plus", '.+.'), ("f", '.F.'), ("h", '.H.')):
+            if patterns is None or error_key in patterns:
+                insert_new_content(file_key, error_key)
 
+        if snapshot is not None:
+            self.renderTracker.markRendered(machine, category, snapshot.versions, patterns)
         print("Files overridden")
                 
                 
-    def modifyHTMLFile(self, machine, category, getCurrentTCNumber, tcNumberReadOut, new_progress=None, error=None):
+    def modifyHTMLFile(self, machine, category, getCurrentTCNumber, tcNumberReadOut, new_progress=None, error=None, snapshot=None):
         """
-        Modifies an HTML file to update progress, error information, and other data visualizations for a given machine and category.
+        Updates progress, error information, and the chart of a given machine and category on the reporter page.
+        Only the data file of the page (`ReporterData`) is rewritten, it carries the new SVG chart of the category.
+        With a snapshot, the chart and the error pages are only rendered for the error patterns that got new records
+        since they were last rendered (`RenderTracker`), a change of the progress alone only updates the data file.
         Args:
             machine (str): The name of the machine for which the HTML file is being modified.
             category (str): The category of data being processed.
@@ -439,6 +500,8 @@ class HTMLData:
             tcNumberReadOut (int): The total number of test cases read out.
             new_progress (float, optional): The new progress value to be updated in the HTML file. Defaults to None.
             error (str, optional): Error message to be displayed in the HTML file. Defaults to None.
+            snapshot (OverviewSnapshot, optional): The overview of the change event, without it the overview
+                of all categories is read again. Defaults to None.
         Returns:
             None
         """
@@ -450,125 +513,36 @@ class HTMLData:
         print(f"Current TC Number: {getCurrentTCNumber}, TC Number Read Out: {tcNumberReadOut}")
         print(f"New Progress: {new_progress}, Error: {error}")
 
-        # Auslesen der Übersicht
-        self.readFault.readOverview(machine)
-        
-        modul = self.readFault.getCurrentVersionMachine(machine, modulOption=True)
-
-        # Auslesen der Kategorien in je modul / qtp_test.ini
-        self.readCategoriesQTP.getCategories(machine, modul)
+        # Auslesen der Übersicht, mit Snapshot nur die Muster mit neuen Einträgen neu rendern
+        if snapshot is None:
+            self.readFault.readOverview(machine)
+            patterns = None
+        else:
+            patterns = self.renderTracker.getDirtyPatterns(machine, category, snapshot.versions)
 
         # Sammeln aller Fehler und absichern in self.dictOFMachines
-        for pattern in self.readFault.errorList:
-            self.readFault.getErrorsForPattern(machine, category, pattern)
-            self.collectDataForHTML(machine, category)
-            self.createHTMLErrorFiles(machine, category)
-
+        self.collectDataForHTML(machine, category, snapshot)
         data_dict = self.dictOfMachines.get(machine, {}).get(category, {})
-        
-        internal_stardata = data_dict.get(".*.", 0)
-        internal_plusdata = data_dict.get(".+.", 0)
-        internal_fdata = data_dict.get(".F.", 0)
-        internal_hdata = data_dict.get(".H.", 0)
+        chart = None
+        if patterns is None or patterns:
+            self.createHTMLErrorFiles(machine, category, snapshot, patterns)
+            chart = self.getPieChart(machine, category, data_dict)
+            if snapshot is not None:
+                self.renderTracker.markRendered(machine, category, snapshot.versions, patterns)
 
-        # Öffne die Datei zum Lesen
-        with open(f"{os.getenv("REPORTER_PATH")}" + "\\" + f"{machine + self.reporterHTML}", "r") as f:
-            template_content = f.read()
-
-        # Muster für die zu ersetzenden Zeilen
-        patternProgress = re.compile(rf"{{id:'{re.escape(randomStringProgressbar)}',\s*progress:\s*\d+(\.\d+)?\s*}}")
-
-        anchorPattern = rf"<!-- START DATA BLOCK FOR: {machine}_{category}-->\s*.*?\s*<!-- END DATA BLOCK FOR: {machine}_{category}-->"
-        spanPattern = rf"<!-- START DATA SPAN CLASS: {machine}_{category}-->\s*.*?\s*<!-- END DATA SPAN CLASS: {machine}_{category}-->"
-        infoLastChange = rf"<!-- Start infoLastChange -->s*.*?\s*<!-- End infoLastChange -->"
-
-        dataAddRowsPattern = re.compile(anchorPattern, re.DOTALL)
-        dataSpanRowsPattern = re.compile(spanPattern, re.DOTALL)
-        dataInfoLastChangePattern = re.compile(infoLastChange, re.DOTALL)
+        if error != None:
+            state = f"{error}"
+        else:
+            state = f"Testfall: {getCurrentTCNumber} von {tcNumberReadOut} "
 
-        # Neue Zeilen, die eingefügt werden sollen
-        newProgressbarLine = f"{{id:'{randomStringProgressbar}', progress: {new_progress}}}"
-        
-        colors = "['#FF0000', '#0000FF', '#DA70D6', '#32CD32']" if data_dict else "['#D3D3D3']"  # Grau wenn keine Daten
-        
         now = dt.datetime.now()
-        newInfoLastChange = (
-            "<!-- Start infoLastChange -->\n"
-            f"<p id = 'infoLastChange'>Letzte Änderung: {now.strftime('%d.%m.%y - %H:%M')} - {category}</p>\n"
-            "<!-- End infoLastChange -->\n")
-
-        newDataAddRows = (
-            f"<!-- START DATA BLOCK FOR: {machine}_{category}-->\n"
-            "//I WAS CHANGED\n"
-            f"google.charts.setOnLoadCallback({self.getRandomStringForCategory(category, 'randomStringFunction')});\n"
-            f"function {self.getRandomStringForCategory(category, 'randomStringFunction')}() {{\n"
-            "var data = new google.visualization.DataTable();\n"
-            "data.addColumn('string', 'Fehlercode');\n"
-            "data.addColumn('number', 'Anzahl');\n"
-            "data.addRows([\n"
-            f"['.*.', {internal_stardata}],\n"
-            f"['.+.', {internal_plusdata}],\n"
-            f"['.F.', {internal_fdata}],\n"
-            f"['.H.', {internal_hdata}],\n"
-            "]);\n"
-            "var settings = {\n"
-            f"title: '{machine} - {category} Überblick',\n"
-            f"colors: {colors},\n"
-            "titleTextStyle: { fontSize: 18, bold: true },\n"
-            "legend: { position: 'right', textStyle: { fontSize: 16, bold: true } },\n"
-            "chartArea: { width: '80%', height: '70%' },\n"
-            "pieSliceTextStyle: { fontSize: 14 },\n"
-            "};\n"
-            f"var chart = new google.visualization.PieChart(document.getElementById('{self.getRandomStringForCategory(category, 'randomStringChartdiagram')}'));\n"
-            "chart.draw(data, settings);\n"
-            "google.visualization.events.addListener(chart, 'select', function() {\n"
-            "var selectedItem = chart.getSelection()[0];\n"
-            "if (selectedItem) {\n"
-            "var topping = data.getValue(selectedItem.row, 0);\n"
-            "var url;\n"
-            f"if (topping === '.*.') {{ url = './Logfiles_Errors/{machine}_{category}_star.html'; }}\n"
-            f"else if (topping === '.+.') {{ url = './Logfiles_Errors/{machine}_{category}_plus.html'; }}\n"
-            f"else if (topping === '.F.') {{ url = './Logfiles_Errors/{machine}_{category}_f.html'; }}\n"
-            f"else if (topping === '.H.') {{ url = './Logfiles_Errors/{machine}_{category}_h.html'; }}\n"
-            "window.open(url, '_blank');\n"
-            "}\n"
-            "});\n"
-            "}\n"
-            f"<!-- END DATA BLOCK FOR: {machine}_{category}-->\n"
-        )
-        
-        newSpanAddRow = (
-            f"<!-- START DATA SPAN CLASS: {machine}_{category}-->\n"
-            "<td style='border: 1px solid #00772c;'>\n"
-            f"<div id={randomStringChartdiagram} style='width: 400px; height: 300px;'></div>\n"
-            "<div class='current-state'>\n"
-            f"<span class='current-state-digit'>Testfall: {getCurrentTCNumber} von {tcNumberReadOut} </span>\n"
-            "</div>\n"
-            f"{self.getProgressBar(randomStringProgressbar)}</td>\n"
-            f"<!-- END DATA SPAN CLASS: {machine}_{category}-->\n"
-        )
-        newError = (
-            f"<!-- START DATA SPAN CLASS: {machine}_{category}-->\n"
-            "<td style='border: 1px solid #00772c;'>\n"
-            f"<div id={randomStringChartdiagram} style='width: 400px; height: 300px;'></div>\n"
-            "<div class='current-state'>\n"
-            f"<span class='current-state-digit'>{error}</span>\n"
-            "</div>\n"
-            f"{self.getProgressBar(randomStringProgressbar)}</td>\n"
-            f"<!-- END DATA SPAN CLASS: {machine}_{category}-->\n"
-        )
+        lastChange = f"Letzte Änderung: {now.strftime('%d.%m.%y - %H:%M')} - {category}"
 
-        # Führe die Ersetzungen durch
-        modified_content = patternProgress.sub(newProgressbarLine, template_content)
-        modified_content = dataAddRowsPattern.sub(newDataAddRows, modified_content)
-        modified_content = dataSpanRowsPattern.sub(newSpanAddRow, modified_content)
-        modified_content = dataInfoLastChangePattern.sub(newInfoLastChange, modified_content)
-
-        if error != None:
-            modified_content = dataSpanRowsPattern.sub(newError,modified_content)
-        # Schreibe den geänderten Inhalt zurück zur Datei
-        with open(f"{os.getenv("REPORTER_PATH")}" + "\\" + f"{machine + self.reporterHTML}", "w") as f:
-            f.write(modified_content)
+        # Nur die Datendatei neu schreiben, die Seite ersetzt das Diagramm der geänderten Kategorie
+        self.reporterData.updateCategory(machine, category, randomStringChartdiagram, randomStringProgressbar,
+                                         f"{randomStringChartdiagram}_state", data_dict, state, new_progress, lastChange,
+                                         chart=chart)
+        self.reporterData.write(machine)
 
 
     def overrideFiles(self, masch, category, overviewPath, tcNumberReadOut):
@@ -580,43 +554,41 @@ class HTMLData:
             overviewPath (str): The path to the overview file.
             tcNumberReadOut (int): The read-out test case number.
         Returns:
-            None
+            OverviewSnapshot: The snapshot of the overview file all files were updated from.
+        Notes:
+            - The overview file is read once per call (`ReadFault.takeSnapshot`), the current test case number,
+              the error counts and the error pages are all taken from that snapshot.
         """
         print(f"Override files for machine: {masch}, category: {category},\noverviewPath: {overviewPath}, tcNumberReadOut: {tcNumberReadOut}")
 
-        getCurrentTCNumber = self.readCountedTestcase.extractLastTestcaseNumber(overviewPath, masch,tcNumberReadOut)
-        if getCurrentTCNumber == None:
-            while True:
-                getCurrentTCNumber = self.readCountedTestcase.extractLastTestcaseNumber(overviewPath, masch, tcNumberReadOut)
-                if getCurrentTCNumber != None:
-                    break
-
+        snapshot = self.readFault.takeSnapshot(masch, category, overviewPath, tcNumberReadOut)
+        getCurrentTCNumber = snapshot.lastTestCaseNumber
 
         if tcNumberReadOut != 0 and getCurrentTCNumber != 0:
             difference = getCurrentTCNumber / tcNumberReadOut * 100
             rounded_difference = round(difference)
-            self.modifyHTMLFile(masch, category, getCurrentTCNumber, tcNumberReadOut,new_progress=rounded_difference)
 
         elif tcNumberReadOut != 0 and getCurrentTCNumber == 0:
             difference = "Noch nicht gestartet"
             progress = 0
-            self.modifyHTMLFile(masch, category, getCurrentTCNumber, tcNumberReadOut,new_progress=progress, error=difference)
-            self.overwriteHTMLErrorFiles(masch, category)
-            return
+            self.modifyHTMLFile(masch, category, getCurrentTCNumber, tcNumberReadOut,new_progress=progress, error=difference, snapshot=snapshot)
+            self.overwriteHTMLErrorFiles(masch, category, snapshot)
+            return snapshot
 
         elif tcNumberReadOut == 0 and getCurrentTCNumber == 0:
             difference = "Fehler beim lesen der Datenbank/QTP_Test.ini"
-            self.modifyHTMLFile(masch, category, getCurrentTCNumber, tcNumberReadOut,error=difference)
-            self.overwriteHTMLErrorFiles(masch, category)
-            return
+            self.modifyHTMLFile(masch, category, getCurrentTCNumber, tcNumberReadOut,error=difference, snapshot=snapshot)
+            self.overwriteHTMLErrorFiles(masch, category, snapshot)
+            return snapshot
         else:
             difference = "Irgendwas ist schief gelaufen"
-            self.modifyHTMLFile(masch, category, getCurrentTCNumber, tcNumberReadOut,error=difference)
-            self.overwriteHTMLErrorFiles(masch, category)
-            return
+            self.modifyHTMLFile(masch, category, getCurrentTCNumber, tcNumberReadOut,error=difference, snapshot=snapshot)
+            self.overwriteHTMLErrorFiles(masch, category, snapshot)
+            return snapshot
 
-        self.modifyHTMLFile(masch, category, getCurrentTCNumber, tcNumberReadOut,new_progress=rounded_difference)
-        self.overwriteHTMLErrorFiles(masch, category)
+        self.modifyHTMLFile(masch, category, getCurrentTCNumber, tcNumberReadOut,new_progress=rounded_difference, snapshot=snapshot)
+        self.overwriteHTMLErrorFiles(masch, category, snapshot)
+        return snapshot
 
 
     def getRandom(self, N):
@@ -637,14 +609,15 @@ class HTMLData:
 
 
 
-    ##################################################################
-    # Monitoring each category in a separate thread, which is choice #
-    ##################################################################
+    #####################################################################
+    # Monitoring each machine as a task of the scheduler, which is choice #
+    #####################################################################
     def monitorSystemLog(self, masch):
         """
         Monitors the system log for a given machine.
         This method retrieves the current version of the machine module and its categories,
-        then starts a separate thread to continuously monitor the system log.
+        then submits `monitorLoop` to the scheduler, which drives all machines from one thread.
+        A machine that is already monitored is monitored again from the first category.
         Args:
             masch (str): The identifier for the machine to monitor.
         """
@@ -652,14 +625,11 @@ class HTMLData:
             modul = self.readFault.getCurrentVersionMachine(masch, modulOption=True)
             categories = self.readCategoriesQTP.categories[masch][modul]
 
-
-            # Start the loop in a separate thread
-            monitor_thread = threading.Thread(target=self.monitorLoop, args=(masch, modul, categories), daemon=True)
-            monitor_thread.start()
+            self.scheduler.submit(masch, self.monitorLoop(masch, modul, categories))
         except Exception as e:
             print(f"Error monitoring system log for machine {masch}: {e}")
 
-    def monitorLoop(self, masch, modul, categories):
+    async def monitorLoop(self, masch, modul, categories):
         """
         Monitors the status of a machine and processes test cases for given categories.
         Args:
@@ -675,32 +645,50 @@ class HTMLData:
             - It checks if all test cases for the current category are completed.
             - If all test cases are completed, it breaks out of the loop for the current category.
             - If not, it waits for a short period before checking again.
-            - If the machine is not free, it waits for a longer period before checking again.
+            - If the machine is not free or marked "Offline", it waits for a longer period before checking again.
+            The waits are timers of the scheduler loop, the reading and writing runs on its worker pool.
         Note:
             The method relies on several instance methods and attributes:
             - `self.stop_event.is_set()`: Checks if the stop event is set.
             - `self.readTimeControll.getCurrentStatus(masch)`: Checks the current status of the machine.
-            - `self.readFault.getVersionPath(masch)`: Retrieves the version path for the machine.
-            - `self.tcAnalyzer.getTestCaseNumberCategory(modul, category)`: Retrieves the test case number for the module and category.
-            - `self.overrideFiles(masch, category, overview_path, tcNumberReadOut)`: Overrides the necessary files.
-            - `self.readCountedTestcase.allTestCasesCompleted(masch, overview_path, tcNumberReadOut)`: Checks if all test cases are completed.
+            - `self.refreshCategory(masch, modul, category)`: Reads the test case number of the category, overrides
+              the necessary files and returns the OverviewSnapshot, whose `completed` flag tells if all test cases
+              are completed.
         """
         for category in categories:
             while not self.stop_event.is_set():
-                if self.readTimeControll.getCurrentStatus(masch):
+                if self.networkShare.vmAccessManager.isOffline(masch):
+                    # Marked offline in the shared registry (e.g. by the StatusWorker), checked again when it expires
+                    await asyncio.sleep(5)
+                elif await self.scheduler.run(self.readTimeControll.getCurrentStatus, masch):
                     print(f"{masch} is free. Overriding files for category: {category}...")
-                    overview_path = os.path.join(self.readFault.getVersionPath(masch), category, "uebersicht.txt")
-                    tcNumberReadOut = self.tcAnalyzer.getTestCaseNumberCategory(modul, category)
-                    self.overrideFiles(masch, category, overview_path, tcNumberReadOut)
+                    snapshot = await self.scheduler.run(self.refreshCategory, masch, modul, category)
 
                     # Check if all test cases are completed
-                    if self.readCountedTestcase.allTestCasesCompleted(masch, overview_path, tcNumberReadOut):
+                    if snapshot.completed:
                         break  # Exit the loop once all test cases for the current category are completed
                     else:
-                        time.sleep(2)  # Wait for 5 seconds before checking again
+                        await asyncio.sleep(2)  # Wait for 2 seconds before checking again
                 else:
                     print(f"{masch} is not free. Waiting...")
-                    time.sleep(5)  # Wait for 2 second before checking again
+                    await asyncio.sleep(5)  # Wait for 5 seconds before checking again
+
+    def refreshCategory(self, masch, modul, category):
+        """
+        Reads the overview of a category and overrides its files, one check of `monitorLoop`. Blocking,
+        runs on the worker pool of the scheduler.
+
+        Args:
+            masch (str): The machine identifier.
+            modul (str): The module identifier.
+            category (str): The category to refresh.
+
+        Returns:
+            OverviewSnapshot: The snapshot returned by `overrideFiles`.
+        """
+        overview_path = os.path.join(self.readFault.getVersionPath(masch), category, "uebersicht.txt")
+        tcNumberReadOut = self.tcAnalyzer.getTestCaseNumberCategory(modul, category)
+        return self.overrideFiles(masch, category, overview_path, tcNumberReadOut)
 
     def setupInitialWatcher(self, masch, modul, categories):
         """
@@ -732,14 +720,14 @@ class HTMLData:
         Raises:
             Exception: If there is an error accessing or reading the system log file.
         Notes:
-            - This method uses `self.networkShare.openFileVMUser` to open the file on the remote machine.
+            - This method reads the file through the file cache with `self.networkShare.openCachedFileVMUser`.
         """
         systemlogPath = os.getenv("MACHINE_SYSTEMLOG_PATH")
         if not os.path.isfile(systemlogPath):
             print(f"System log file {systemlogPath} does not exist.")
             return False
         try:
-            with self.networkShare.openFileVMUser(systemlogPath,masch,"r") as file:
+            with self.networkShare.openCachedFileVMUser(systemlogPath, masch) as file:
                 for line in file:
                     if category in line:
                         print(f"Found category {category} in system log.")
@@ -788,9 +776,10 @@ class HTMLData:
             self.file_watchers[category] = file_watcher
             file_watcher.start()
 
-    def continuousMonitor(self, masch, modul, categories):
+    async def continuousMonitor(self, masch, modul, categories):
         """
         Continuously monitors the log for new categories and starts a new watch if a new category is found.
+        Runs as a task of the scheduler, e.g. `self.scheduler.submit((masch, "log"), self.continuousMonitor(...))`.
 
         Args:
             masch (str): The machine identifier.
@@ -802,10 +791,10 @@ class HTMLData:
         """
         while True:
             for category in categories:
-                if category not in self.found_categories and self.doesLogContainCategory(masch, category):
-                    self.startNewWatch(masch, modul, category)
+                if category not in self.found_categories and await self.scheduler.run(self.doesLogContainCategory, masch, category):
+                    await self.scheduler.run(self.startNewWatch, masch, modul, category)
                     self.found_categories.add(category)  # Add category to found_categories
-            time.sleep(30)  # Check every 30 seconds for new categories
+            await asyncio.sleep(30)  # Check every 30 seconds for new categories
 
     def openHTMLDataWithWatchdog(self, machine):
         """
@@ -817,21 +806,46 @@ class HTMLData:
 
         Returns:
             None
+
+        Notes:
+            - If REPORT_SERVER_PORT is set, the report is opened from the local ReportServer, which pushes
+              every change to the page at once. Otherwise the file is opened and the page polls its data file.
         """
         self.generateHTMLFilesforMachine(machine)
         cwd = os.path.dirname(os.path.abspath(sys.argv[0]))
         drivePath = f"{os.getenv("REPORTER_PATH")}" + "\\" + f"{machine + self.reporterHTML}"
-        webbrowser.open(f"{os.getenv("REPORTER_PATH")}" + "\\" + f"{machine + self.reporterHTML}")
+        if self.startReportServer():
+            webbrowser.open(self.reportServer.getUrl(machine + self.reporterHTML))
+        else:
+            webbrowser.open(drivePath)
         self.monitorSystemLog(machine)
 
 
+    def startReportServer(self):
+        """
+        Starts the local report server once, if REPORT_SERVER_PORT is set (0 picks a free port).
+
+        Returns:
+            bool: True if the server is running, False if it is disabled or could not be started.
+        """
+        port = os.getenv("REPORT_SERVER_PORT")
+        if not port:
+            return False
+        if self.reportServer is None:
+            self.reportServer = ReportServer(self.reporterData, os.getenv("REPORTER_PATH"), int(port))
+        return self.reportServer.start()
+
+
     def close(self):
         """
-        Closes the current file watcher if it is active.
+        Closes the current file watcher, the monitoring tasks and the report server if they are active.
 
         This method stops the file watcher associated with the current instance,
         if it exists, and prints a message indicating that the monitoring has stopped.
         """
         if self.current_file_watcher:
             self.current_file_watcher.stop()
+        self.scheduler.stop()
+        if self.reportServer is not None:
+            self.reportServer.stop()
         print("Überwachung gestoppt.")
\ No newline at end of file
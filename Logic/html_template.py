@@ -0,0 +1,119 @@
+import os
+import re
+import threading
+
+
+class HTMLTemplate:
+    """
+    An HTML template split once at its placeholders, e.g. "[!!NameOfMasch!!]". Rendering joins the pieces with the
+    values instead of copying the whole document for every `str.replace`. The file is read again only when its
+    modification time changed.
+    """
+
+    def __init__(self, path, placeholders):
+        self.path = path
+        # Longer placeholders first, "[[!!Category!!]]" must not be split at a shorter one
+        self.placeholders = sorted(placeholders, key=len, reverse=True)
+        self.regex = re.compile("(" + "|".join(re.escape(placeholder) for placeholder in self.placeholders) + ")")
+        self.mtime = None
+        self.source = None
+        self.pieces = []
+        self.lock = threading.Lock()
+
+
+    def load(self):
+        """
+        Reads and splits the template if it was not loaded yet or its modification time changed.
+
+        Raises:
+            FileNotFoundError: If the template file does not exist.
+        """
+        mtime = os.stat(self.path).st_mtime
+        with self.lock:
+            if mtime == self.mtime:
+                return
+            with open(self.path, "r") as f:
+                source = f.read()
+            # Even indices are text, odd indices are placeholders
+            self.pieces = self.regex.split(source)
+            self.source = source
+            self.mtime = mtime
+
+
+    def getSource(self):
+        """
+        Returns:
+            str: The unchanged template.
+        """
+        self.load()
+        return self.source
+
+
+    def render(self, values):
+        """
+        Fills the placeholders of the template.
+
+        Args:
+            values (dict): The text per placeholder. Placeholders without a value stay in the output.
+
+        Returns:
+            str: The rendered document.
+        """
+        self.load()
+        pieces = self.pieces
+        parts = pieces[:]
+        for index in range(1, len(pieces), 2):
+            parts[index] = values.get(pieces[index], pieces[index])
+        return "".join(parts)
+
+
+def spliceFile(filePath, startMarker, endMarker, parts, tempPath=None, replace=os.replace):
+    """
+    Replaces the lines between two marker lines of a file, without parsing the document. The file is copied line by
+    line into a temporary file, the new parts are written between the markers, then the temporary file replaces it.
+
+    Args:
+        filePath (str): The file to change.
+        startMarker (str): Text of the line that starts the region, e.g. "<!-- START LOGS -->".
+        endMarker (str): Text of the line that ends the region.
+        parts (iterable): The new content of the region, written one after the other.
+        tempPath (str, optional): The temporary file. Defaults to a file next to the target, unique per process and
+            thread, so pages spliced at the same time do not share it.
+        replace (callable, optional): Moves the temporary file over the target, e.g. `ReportWriter.replace`.
+            Defaults to os.replace.
+
+    Returns:
+        bool: True if the region was replaced, False if the markers were not found (the file is left unchanged).
+
+    Raises:
+        IOError: If the file cannot be read or written. The temporary file is removed.
+    """
+    if tempPath is None:
+        tempPath = f"{filePath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    # 0: before the region, 1: inside the region, 2: after the region
+    state = 0
+    try:
+        with open(filePath, "r") as source, open(tempPath, "w") as target:
+            for line in source:
+                if state == 0:
+                    target.write(line)
+                    if startMarker in line:
+                        for part in parts:
+                            target.write(part)
+                        target.write("\n")
+                        state = 1
+                elif state == 1:
+                    if endMarker in line:
+                        target.write(line)
+                        state = 2
+                else:
+                    target.write(line)
+
+        if state != 2:
+            return False
+        replace(tempPath, filePath)
+        return True
+    finally:
+        # Left over if the markers were missing or the copy or replace failed
+        if os.path.exists(tempPath):
+            os.remove(tempPath)
@@ -0,0 +1,138 @@
+import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class MonitorScheduler:
+    """
+    Drives the monitoring of all machines from one asyncio loop in one thread. The waits between two checks are
+    timers of the loop instead of sleeping threads, the blocking steps (status file, file share, report files) run
+    on a fixed pool of MONITOR_WORKERS threads (default 4). The number of threads does not grow with the machines.
+
+    Each monitored machine is a task of the loop, registered under a key. Submitting a task under a key that is
+    already running replaces the old task.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or int(os.getenv("MONITOR_WORKERS", 4))
+        self.loop = None
+        self.thread = None
+        self.executor = None
+        self.tasks = {}  # key -> asyncio.Task, only used on the loop thread
+        self.lock = threading.Lock()
+
+
+    def start(self):
+        """
+        Starts the loop thread and the worker pool, if they are not running yet.
+        """
+        with self.lock:
+            if self.loop is not None:
+                return
+            self.loop = asyncio.new_event_loop()
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="Monitor")
+            self.loop.set_default_executor(self.executor)
+            self.thread = threading.Thread(target=self.loop.run_forever, name="MonitorScheduler", daemon=True)
+            self.thread.start()
+
+
+    def stop(self):
+        """
+        Cancels all tasks and stops the loop thread and the worker pool. Steps already running on the pool finish
+        in the background.
+        """
+        with self.lock:
+            loop, thread, executor = self.loop, self.thread, self.executor
+            if loop is None:
+                return
+            self.loop = None
+
+        try:
+            asyncio.run_coroutine_threadsafe(self.cancelAll(), loop).result(timeout=5)
+        except Exception as e:
+            print(f"Monitoring tasks could not be cancelled: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+    def submit(self, key, coroutine):
+        """
+        Runs a coroutine as task of the loop.
+
+        Args:
+            key (hashable): The key of the task, e.g. the machine. A running task with the same key is cancelled.
+            coroutine (coroutine): The coroutine to run.
+
+        Returns:
+            concurrent.futures.Future: Done when the task is registered.
+        """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(self.replaceTask(key, coroutine), self.loop)
+
+
+    def cancel(self, key):
+        """
+        Args:
+            key (hashable): The key of the task to cancel. Nothing happens if no such task runs.
+        """
+        with self.lock:
+            loop = self.loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self.cancelTask, key)
+
+
+    def isRunning(self, key):
+        """
+        Args:
+            key (hashable): The key of a task.
+
+        Returns:
+            bool: True if a task with the key is registered and not finished.
+        """
+        task = self.tasks.get(key)
+        return task is not None and not task.done()
+
+
+    async def run(self, function, *args):
+        """
+        Runs a blocking function on the worker pool, so the loop keeps driving the other machines meanwhile.
+
+        Args:
+            function (callable): The blocking function.
+            *args: Its arguments.
+
+        Returns:
+            The return value of the function.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+
+    async def replaceTask(self, key, coroutine):
+        self.cancelTask(key)
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self.tasks[key] = task
+        task.add_done_callback(lambda finished: self.taskDone(key, finished))
+
+
+    def cancelTask(self, key):
+        task = self.tasks.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+
+    def taskDone(self, key, task):
+        if self.tasks.get(key) is task:
+            del self.tasks[key]
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Monitoring of {key} failed: {task.exception()}")
+
+
+    async def cancelAll(self):
+        tasks = list(self.tasks.values())
+        self.tasks = {}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
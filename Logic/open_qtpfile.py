@@ -1,4 +1,3 @@
-import smbclient
 import subprocess
 import tempfile
 import os
@@ -27,7 +26,7 @@ class OpenQTPFile():
 
         Notes:
             - The method checks if the provided filePath is a valid string.
-            - It uses the smbclient library to read the file from the network share.
+            - It reads the file over the pooled SMB session of the VM user.
             - A temporary file is created to hold the content of the remote file.
             - The temporary file is opened with Notepad.
             - The temporary file is deleted after Notepad is closed.
@@ -37,8 +36,8 @@ class OpenQTPFile():
             return
 
         try:
-            smbclient.ClientConfig(username=self.networkShare.usernameVM, password=self.networkShare.passwordVM)
-            with smbclient.open_file(filePath, mode='r') as remote_file:
+            with self.networkShare.sessionManager.openFile(filePath, 'r', self.networkShare.usernameVM,
+                                                           self.networkShare.passwordVM) as remote_file:
                 content = remote_file.read()  
 
             # Create a temporary file
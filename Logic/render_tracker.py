@@ -0,0 +1,64 @@
+import threading
+
+
+class RenderTracker:
+    """
+    Remembers per machine, category and error pattern which version of the errors (`OverviewSnapshot.versions`)
+    the report files were last rendered from. A change event then only renders the chart and the error pages of
+    the patterns that got new records since.
+    """
+
+    def __init__(self):
+        self.rendered = {}  # (machine, category) -> {error pattern: version}
+        self.lock = threading.Lock()
+
+
+    def getDirtyPatterns(self, machine, category, versions):
+        """
+        Args:
+            machine (str): The machine identifier.
+            category (str): The category.
+            versions (dict): The version per error pattern of the current snapshot.
+
+        Returns:
+            list: The error patterns whose version differs from the last rendered one, in the order of `versions`.
+        """
+        with self.lock:
+            rendered = self.rendered.get((machine, category), {})
+            return [pattern for pattern, version in versions.items() if rendered.get(pattern) != version]
+
+
+    def isDirty(self, machine, category, versions):
+        """
+        Returns:
+            bool: True if at least one pattern of the category got new records, see `getDirtyPatterns`.
+        """
+        return bool(self.getDirtyPatterns(machine, category, versions))
+
+
+    def markRendered(self, machine, category, versions, patterns=None):
+        """
+        Args:
+            machine (str): The machine identifier.
+            category (str): The category.
+            versions (dict): The version per error pattern the files were rendered from.
+            patterns (iterable, optional): Only these patterns were rendered. Defaults to all of `versions`.
+        """
+        with self.lock:
+            rendered = self.rendered.setdefault((machine, category), {})
+            for pattern in (patterns if patterns is not None else versions):
+                rendered[pattern] = versions[pattern]
+
+
+    def reset(self, machine, category=None):
+        """
+        Forgets what was rendered, e.g. after all files of the machine were generated from scratch.
+
+        Args:
+            machine (str): The machine identifier.
+            category (str, optional): Only this category. Defaults to None (all categories of the machine).
+        """
+        with self.lock:
+            for key in list(self.rendered):
+                if key[0] == machine and (category is None or key[1] == category):
+                    del self.rendered[key]
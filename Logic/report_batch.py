@@ -0,0 +1,139 @@
+import io
+import os
+import sys
+import asyncio
+import time
+import argparse
+import traceback
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from dotenv import load_dotenv
+
+from Configurations.machines import Machines
+
+
+def generateMachineReport(machine, verbose=False):
+    """
+    Generates the reporter page and the error pages of one machine, like `HTMLData.openHTMLDataWithWatchdog`
+    but without opening the browser and without watching the files afterwards. Runs in a worker process.
+
+    Args:
+        machine (str): The machine identifier.
+        verbose (bool, optional): Prints the output of the report generation. Defaults to False.
+
+    Returns:
+        dict: The machine, the number of categories, the durations in seconds ("report", "progress", "total")
+              and the error text, None if the report was generated.
+    """
+    result = {"machine": machine, "categories": 0, "report": 0.0, "progress": 0.0, "total": 0.0, "error": None}
+    output = sys.stdout if verbose else io.StringIO()
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(output):
+            # Imported in the worker, the process pool pickles only the machine name
+            from Logic.html_data import HTMLData
+            htmlData = HTMLData()
+
+            htmlData.generateHTMLFilesforMachine(machine)
+            reportDone = time.perf_counter()
+            result["report"] = reportDone - start
+
+            # Progress and state per category, one pass of `HTMLData.monitorLoop`
+            modul = htmlData.readFault.getCurrentVersionMachine(machine, modulOption=True)
+            categories = htmlData.readCategoriesQTP.categories[machine][modul]
+            overviewPaths = {category: os.path.join(htmlData.readFault.getVersionPath(machine), category, "uebersicht.txt")
+                             for category in categories}
+            for category, fileStat in zip(categories, asyncio.run(statOverviews(htmlData, machine, overviewPaths))):
+                if fileStat is not None:
+                    tcNumberReadOut = htmlData.tcAnalyzer.getTestCaseNumberCategory(modul, category)
+                    htmlData.overrideFiles(machine, category, overviewPaths[category], tcNumberReadOut)
+            result["categories"] = len(categories)
+            result["progress"] = time.perf_counter() - reportDone
+            htmlData.close()
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        if verbose:
+            traceback.print_exc()
+    result["total"] = time.perf_counter() - start
+    return result
+
+
+async def statOverviews(htmlData, machine, overviewPaths):
+    """
+    Retrieves the metadata of the overview files of all categories at once, instead of one after the other.
+
+    Args:
+        htmlData (HTMLData): The report generator of the machine.
+        machine (str): The machine identifier.
+        overviewPaths (dict): The path of the uebersicht.txt per category.
+
+    Returns:
+        list: The stat result per category in the order of `overviewPaths`, None if the file does not exist (yet).
+    """
+    # Imported in the worker like HTMLData
+    from Configurations.async_networkshare import AsyncNetworkShare
+    share = AsyncNetworkShare(htmlData.networkShare)
+    return await asyncio.gather(*(share.stat(path, machine) for path in overviewPaths.values()))
+
+
+def printSummary(results, duration):
+    """
+    Prints the durations per machine.
+
+    Args:
+        results (list): The results of `generateMachineReport`.
+        duration (float): The wall time of the whole run in seconds.
+    """
+    print(f"{'Maschine':<20} {'Kategorien':>10} {'Bericht':>9} {'Fortschritt':>11} {'Gesamt':>9}  Status")
+    for result in sorted(results, key=lambda r: r["machine"]):
+        status = "OK" if result["error"] is None else f"Fehler - {result['error']}"
+        print(f"{result['machine']:<20} {result['categories']:>10} {result['report']:>8.2f}s "
+              f"{result['progress']:>10.2f}s {result['total']:>8.2f}s  {status}")
+    cpuTime = sum(result["total"] for result in results)
+    print(f"{len(results)} Maschinen in {duration:.2f}s (Summe der Maschinen {cpuTime:.2f}s)")
+
+
+def main(argv=None):
+    """
+    Generates the reports of all machines in machines.json (or of the given machines) in parallel processes,
+    e.g. from a scheduled task before the reports are opened:
+
+        python -m Logic.report_batch [--workers N] [--verbose] [MACHINE ...]
+
+    Must be started in the project directory, the templates and machines.json are read relative to it.
+
+    Returns:
+        int: 0 if all reports were generated, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(prog="python -m Logic.report_batch",
+                                     description="Generates the reporter and error pages of all machines.")
+    parser.add_argument("machines", nargs="*", help="Only these machines (default: all in machines.json).")
+    parser.add_argument("--workers", type=int, default=None, help="Number of processes (default: one per CPU).")
+    parser.add_argument("--verbose", action="store_true", help="Print the output of the report generation.")
+    args = parser.parse_args(argv)
+
+    # The workers inherit the environment
+    load_dotenv()
+    machines = args.machines or Machines().getMachineNameOfAll()
+    if not machines:
+        print("Please note a machine in your machines.json!")
+        return 1
+
+    workers = min(args.workers or os.cpu_count() or 1, len(machines))
+    print(f"Generating reports for {len(machines)} machines with {workers} processes...")
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(generateMachineReport, machine, args.verbose): machine for machine in machines}
+        for future in as_completed(futures):
+            result = future.result()
+            print(f"{result['machine']}: {'fertig' if result['error'] is None else 'Fehler'} nach {result['total']:.2f}s")
+            results.append(result)
+
+    printSummary(results, time.perf_counter() - start)
+    return 0 if all(result["error"] is None for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
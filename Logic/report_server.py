@@ -0,0 +1,190 @@
+import json
+import queue
+import threading
+from functools import partial
+from urllib.parse import unquote
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+
+class ReportServer:
+    """
+    Optional local HTTP server for the reporter pages. It serves the files of REPORTER_PATH and pushes the
+    changed categories of a machine to the open pages with Server-Sent Events (`/events/<machine>`),
+    as soon as `ReporterData` wrote them. The pages then no longer have to poll the data file.
+    """
+
+    def __init__(self, reporterData, directory, port, host="127.0.0.1"):
+        self.reporterData = reporterData
+        self.directory = directory
+        self.host = host
+        self.port = port
+        self.httpServer = None
+        self.thread = None
+        self.clients = {}
+        self.clientsLock = threading.Lock()
+        # Comment line sent to idle clients, so closed connections are noticed
+        self.keepaliveInterval = 15  # Sekunden
+
+
+    def start(self):
+        """
+        Starts the server in a daemon thread and registers it as listener of the reporter data.
+
+        Returns:
+            bool: True if the server is running, False if it could not be started (e.g. the port is in use).
+        """
+        if self.httpServer is not None:
+            return True
+        try:
+            handler = partial(ReportRequestHandler, self, directory=self.directory)
+            self.httpServer = ThreadingHTTPServer((self.host, self.port), handler)
+            self.httpServer.daemon_threads = True
+        except OSError as e:
+            print(f"Report server could not be started on port {self.port}: {e}")
+            self.httpServer = None
+            return False
+
+        self.port = self.httpServer.server_address[1]
+        self.reporterData.addListener(self.publish)
+        self.thread = threading.Thread(target=self.httpServer.serve_forever, daemon=True)
+        self.thread.start()
+        print(f"Report server running on {self.getUrl('')}")
+        return True
+
+
+    def stop(self):
+        """
+        Stops the server and closes the event streams of all clients.
+        """
+        if self.httpServer is None:
+            return
+        self.reporterData.removeListener(self.publish)
+        with self.clientsLock:
+            for clientQueues in self.clients.values():
+                for clientQueue in clientQueues:
+                    clientQueue.put(None)
+            self.clients = {}
+        self.httpServer.shutdown()
+        self.httpServer.server_close()
+        self.httpServer = None
+
+
+    def getUrl(self, fileName):
+        """
+        Args:
+            fileName (str): A file in the served directory, e.g. "<machine>_reporter.html".
+
+        Returns:
+            str: The URL of the file on this server.
+        """
+        return f"http://{self.host}:{self.port}/{fileName}"
+
+
+    def publish(self, machine, delta):
+        """
+        Pushes the changed categories of a machine to all of its open pages (ReporterData listener).
+
+        Args:
+            machine (str): The machine identifier.
+            delta (dict): The changed categories, in the form of the data file.
+        """
+        if not delta["categories"]:
+            return
+        message = json.dumps(delta)
+        with self.clientsLock:
+            for clientQueue in self.clients.get(machine, []):
+                clientQueue.put(message)
+
+
+    def addClient(self, machine):
+        """
+        Args:
+            machine (str): The machine whose page connected.
+
+        Returns:
+            queue.Queue: The queue the messages for the new client are put into.
+        """
+        clientQueue = queue.Queue()
+        with self.clientsLock:
+            self.clients.setdefault(machine, []).append(clientQueue)
+        return clientQueue
+
+
+    def removeClient(self, machine, clientQueue):
+        """
+        Args:
+            machine (str): The machine whose page disconnected.
+            clientQueue (queue.Queue): The queue returned by addClient.
+        """
+        with self.clientsLock:
+            clientQueues = self.clients.get(machine, [])
+            if clientQueue in clientQueues:
+                clientQueues.remove(clientQueue)
+
+
+class ReportRequestHandler(SimpleHTTPRequestHandler):
+    """Serves the report files and the event streams of one ReportServer."""
+
+    def __init__(self, reportServer, *args, **kwargs):
+        self.reportServer = reportServer
+        super().__init__(*args, **kwargs)
+
+
+    def do_GET(self):
+        if self.path.startswith("/events/"):
+            self.streamEvents(unquote(self.path[len("/events/"):].split("?")[0]))
+        else:
+            super().do_GET()
+
+
+    def end_headers(self):
+        # The data files change all the time, the browser must not cache them
+        self.send_header("Cache-Control", "no-store")
+        super().end_headers()
+
+
+    def streamEvents(self, machine):
+        """
+        Sends the complete data of the machine once and then every change, until the page is closed.
+
+        Args:
+            machine (str): The machine identifier from the URL.
+        """
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "keep-alive")
+        self.end_headers()
+
+        clientQueue = self.reportServer.addClient(machine)
+        try:
+            data = self.reportServer.reporterData.getData(machine)
+            if data is not None:
+                self.sendEvent(json.dumps(data))
+            while True:
+                try:
+                    message = clientQueue.get(timeout=self.reportServer.keepaliveInterval)
+                except queue.Empty:
+                    self.wfile.write(b": keepalive\n\n")
+                    self.wfile.flush()
+                    continue
+                if message is None:
+                    break
+                self.sendEvent(message)
+        except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+            pass
+        finally:
+            self.reportServer.removeClient(machine, clientQueue)
+
+
+    def sendEvent(self, message):
+        """
+        Args:
+            message (str): The JSON text of one event.
+        """
+        self.wfile.write(f"data: {message}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+
+    def log_message(self, format, *args):
+        # Every poll and event stream would be printed otherwise
+        pass
@@ -0,0 +1,155 @@
+import os
+import time
+import hashlib
+import threading
+
+from Logic.html_template import spliceFile
+
+
+class ReportWriter:
+    """
+    Writes the generated report files only if their content changed, and atomically: the content goes to a temporary
+    file next to the target, which then replaces it. Browsers reading the share never see a half-written file.
+
+    The hash of the last content written per path is kept in memory. For the error pages the hash of the logs region
+    is kept as well, so a page that `createHTMLErrorFiles` just wrote is not spliced again with the same messages.
+    """
+
+    def __init__(self):
+        self.hashes = {}
+        self.regionHashes = {}
+        self.lock = threading.Lock()
+        self.written = 0
+        self.skipped = 0
+
+
+    @staticmethod
+    def getHash(parts):
+        """
+        Args:
+            parts (iterable): The strings of the content.
+
+        Returns:
+            str: The hash of the joined strings.
+        """
+        digest = hashlib.sha1()
+        for part in parts:
+            digest.update(part.encode("utf-8", errors="surrogatepass"))
+        return digest.hexdigest()
+
+
+    def getTempPath(self, path):
+        """
+        Args:
+            path (str): The target file.
+
+        Returns:
+            str: A temporary file next to the target, unique per thread.
+        """
+        return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+    def isUnchanged(self, path, contentHash, hashes):
+        """
+        Args:
+            path (str): The target file.
+            contentHash (str): The hash of the new content.
+            hashes (dict): `self.hashes` or `self.regionHashes`.
+
+        Returns:
+            bool: True if the same content was written last and the file still exists.
+        """
+        with self.lock:
+            unchanged = hashes.get(path) == contentHash and os.path.exists(path)
+            if unchanged:
+                self.skipped += 1
+            return unchanged
+
+
+    def write(self, path, content, region=None):
+        """
+        Writes a file if its content changed since the last write.
+
+        Args:
+            path (str): The target file.
+            content (str): The complete content.
+            region (iterable, optional): The parts between the log markers of an error page, see `splice`. Defaults to None.
+
+        Returns:
+            bool: True if the file was written, False if the content was unchanged.
+
+        Raises:
+            IOError: If the file is still locked after several attempts.
+        """
+        contentHash = self.getHash([content])
+        if self.isUnchanged(path, contentHash, self.hashes):
+            return False
+
+        tempPath = self.getTempPath(path)
+        with open(tempPath, "w") as f:
+            f.write(content)
+        self.replace(tempPath, path)
+
+        with self.lock:
+            self.hashes[path] = contentHash
+            self.regionHashes[path] = self.getHash(region) if region is not None else None
+            self.written += 1
+        return True
+
+
+    def splice(self, path, startMarker, endMarker, parts):
+        """
+        Replaces the region between two marker lines of a file (`spliceFile`) if its content changed. Like `write`,
+        the file is built in a temporary file of this thread and moved over the target with `replace`.
+
+        Args:
+            path (str): The target file.
+            startMarker (str): Text of the line that starts the region.
+            endMarker (str): Text of the line that ends the region.
+            parts (list): The new content of the region.
+
+        Returns:
+            bool: True if the file was written, False if the region was unchanged.
+
+        Raises:
+            ValueError: If the markers were not found, the file is left unchanged.
+            IOError: If the file cannot be read or written.
+        """
+        regionHash = self.getHash(parts)
+        if self.isUnchanged(path, regionHash, self.regionHashes):
+            return False
+
+        if not spliceFile(path, startMarker, endMarker, parts, self.getTempPath(path), self.replace):
+            raise ValueError(f"{path} has no {startMarker} / {endMarker} markers.")
+
+        with self.lock:
+            self.regionHashes[path] = regionHash
+            # The rest of the page was not looked at, the next write compares against nothing
+            self.hashes.pop(path, None)
+            self.written += 1
+        return True
+
+
+    def replace(self, tempPath, path):
+        """
+        Moves the temporary file over the target.
+
+        Args:
+            tempPath (str): The temporary file.
+            path (str): The target file.
+
+        Raises:
+            PermissionError: If the target is still locked (e.g. read by the browser) after several attempts.
+        """
+        max_retries = 5
+        retry_delay = 0.2  # Sekunden
+        for attempt in range(max_retries):
+            try:
+                os.replace(tempPath, path)
+                return
+            except PermissionError:
+                # On Windows the target cannot be replaced while another process reads it
+                time.sleep(retry_delay)
+        os.remove(tempPath)
+        # Still a lock, the callers retrying locked pages (see HTMLData.overwriteHTMLErrorFiles) try again later
+        raise PermissionError(f"Konnte die Datei {path} nach {max_retries} Versuchen nicht ersetzen.")
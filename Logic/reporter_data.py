@@ -0,0 +1,167 @@
+import os
+import json
+import threading
+
+
+class ReporterData:
+    """
+    Per-machine data file of the reporter page. The page loads it every few seconds and replaces only the
+    charts of the categories whose numbers changed, so a change of one category does not rewrite the page.
+
+    The file is JSON wrapped in a call of `updateReporter(...)`: the reporter is opened over file://,
+    where the browser does not allow fetching a plain JSON file, but still loads a script.
+    Listeners (e.g. the ReportServer) get the changed categories of every write pushed to them.
+    """
+
+    def __init__(self, reportWriter):
+        self.reportWriter = reportWriter
+        self.machines = {}
+        self.changedCategories = {}
+        self.listeners = []
+        self.lock = threading.Lock()
+
+
+    def addListener(self, listener):
+        """
+        Registers a function that is called after each write with the changes since the last write.
+
+        Args:
+            listener (callable): Called as listener(machine, delta), delta has the same form as the data file
+                but only holds the changed categories.
+        """
+        with self.lock:
+            if listener not in self.listeners:
+                self.listeners.append(listener)
+
+
+    def removeListener(self, listener):
+        """
+        Args:
+            listener (callable): A function registered with addListener.
+        """
+        with self.lock:
+            if listener in self.listeners:
+                self.listeners.remove(listener)
+
+
+    def getData(self, machine):
+        """
+        Args:
+            machine (str): The machine identifier.
+
+        Returns:
+            dict: A copy of the complete data of the machine, None if the machine has no data yet.
+        """
+        with self.lock:
+            data = self.machines.get(machine)
+            if data is None:
+                return None
+            return json.loads(json.dumps(data))
+
+
+    def getDataFileName(self, machine):
+        """
+        Args:
+            machine (str): The machine identifier.
+
+        Returns:
+            str: The file name of the data file, relative to the reporter page.
+        """
+        return f"{machine}_reporter_data.js"
+
+
+    def getDataPath(self, machine):
+        """
+        Args:
+            machine (str): The machine identifier.
+
+        Returns:
+            str: The path of the data file next to `<machine>_reporter.html` in REPORTER_PATH.
+        """
+        return f"{os.getenv("REPORTER_PATH")}" + "\\" + self.getDataFileName(machine)
+
+
+    def reset(self, machine):
+        """
+        Forgets the data of a machine, e.g. when its reporter page is generated again with new element ids.
+
+        Args:
+            machine (str): The machine identifier.
+        """
+        with self.lock:
+            self.machines[machine] = {"machine": machine, "lastChange": None, "categories": {}}
+            self.changedCategories[machine] = set()
+
+
+    def updateCategory(self, machine, category, chartId, progressId, stateId, counts, state, progress=None, lastChange=None,
+                       chart=None):
+        """
+        Sets the numbers of one category.
+
+        Args:
+            machine (str): The machine identifier.
+            category (str): The category.
+            chartId (str): The id of the chart element of the category.
+            progressId (str): The id of the progress bar.
+            stateId (str): The id of the span showing the current test case or an error.
+            counts (dict): The number of failed test cases per error pattern (".*.", ".+.", ".F.", ".H.").
+            state (str): The text of the span, e.g. "Testfall: 3 von 10".
+            progress (int, optional): The progress in percent, None leaves the progress bar as it is. Defaults to None.
+            lastChange (str, optional): The "Letzte Änderung" text of the page. Defaults to None (unchanged).
+            chart (str, optional): The SVG markup of the pie chart (`renderPieChart`), replaces the content of the
+                chart element. Defaults to None (unchanged).
+        """
+        with self.lock:
+            data = self.machines.setdefault(machine, {"machine": machine, "lastChange": None, "categories": {}})
+            if chart is None:
+                chart = data["categories"].get(category, {}).get("chart")
+            entry = {
+                "chartId": chartId,
+                "progressId": progressId,
+                "stateId": stateId,
+                "counts": dict(counts),
+                "state": state,
+                "progress": progress,
+                "chart": chart,
+            }
+            if lastChange is not None:
+                data["lastChange"] = lastChange
+            if data["categories"].get(category) != entry:
+                data["categories"][category] = entry
+                self.changedCategories.setdefault(machine, set()).add(category)
+
+
+    def write(self, machine):
+        """
+        Writes the data file of a machine with the ReportWriter: atomically, so the page never loads a
+        half-written file, and only if the content changed.
+
+        Args:
+            machine (str): The machine identifier.
+
+        Raises:
+            IOError: If the data file is still locked (e.g. read by the browser) after several attempts.
+        """
+        with self.lock:
+            data = self.machines.get(machine)
+            if data is None:
+                return
+            changed = self.changedCategories.get(machine, set())
+            delta = {
+                "machine": machine,
+                "lastChange": data["lastChange"],
+                "categories": {category: dict(data["categories"][category]) for category in changed},
+            }
+            self.changedCategories[machine] = set()
+            listeners = list(self.listeners)
+            # ASCII only, the script is decoded with the encoding of the page
+            content = "updateReporter(" + json.dumps(data) + ");\n"
+
+            self.reportWriter.write(self.getDataPath(machine), content)
+
+        # Outside the lock, a listener may read the data again
+        for listener in listeners:
+            try:
+                listener(machine, delta)
+            except Exception as e:
+                print(f"Error notifying listener of {machine}: {e}")
@@ -40,6 +40,9 @@ class RunTestExecution(QObject):
             4. Writes the modified content back to the VBScript file on the remote machine.
         """
         path = os.getenv("MACHINE_VBS_SCRIPT_PATH")
+        if self.networkShare.vmAccessManager.isOffline(masch):
+            print(f"VM {masch} is offline.")
+            return
 
         try:
             with self.networkShare.openFileVMUser(path,masch, 'r') as file:
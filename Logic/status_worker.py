@@ -1,9 +1,13 @@
 from PyQt5.QtCore import  pyqtSignal, QObject
+from Configurations.async_networkshare import AsyncNetworkShare
 from Logic.vm_access_manager import VMAccessManager
+import asyncio
 import time
 
 class StatusWorker(QObject):
     update_status = pyqtSignal(str, str)
+    # Traffic light -> status in the shared VMHealthRegistry
+    registryStatus = {"green": "Running", "red": "Error", "orange": "Online"}
 
     def __init__(self, component):
         super().__init__()
@@ -15,11 +19,11 @@ class StatusWorker(QObject):
         """
         Continuously monitors the status of virtual machine components and updates their status.
 
-        This method runs in a loop while the `running` attribute is True. It iterates over a copy of 
-        the `vmComponentList` to check the status of each virtual machine component. If a component 
+        This method runs in a loop while the `running` attribute is True. Every 10 seconds the status of all
+        components in a copy of the `vmComponentList` is checked at once (see `checkMachines`). If a component
         is found to be "Offline", it is removed from the list. The status of each machine is retrieved 
         using the `getMachineStatusWithRetry` method, and the status is emitted using the `update_status` 
-        signal.
+        signal as soon as it is known.
 
         Raises:
             Exception: If there is an error retrieving the status of a machine.
@@ -29,19 +33,38 @@ class StatusWorker(QObject):
             - Removes offline components from the `vmComponentList`.
             - Prints status updates and error messages to the console.
         """
-        while self.running:
-            for vmComponent in self.component.vmComponentList[:]:  # Iterate over a copy of the list
-                if self.running:
-                    machine = vmComponent.hostname[vmComponent.number]
-                    try:
-                        status = self.getMachineStatusWithRetry(machine)
-                        self.update_status.emit(machine, status)
-                        if status == "Offline":
-                            self.component.vmComponentList.remove(vmComponent)
-                            print(f"Removed {machine} from the list")
-                    except Exception as e:
-                        print(f"Failed to get status for {machine}: {e}")
-            time.sleep(10)
+        loop = asyncio.new_event_loop()
+        # The semaphores of the share belong to the loop of this worker
+        share = AsyncNetworkShare()
+        try:
+            while self.running:
+                loop.run_until_complete(self.checkMachines(share, self.component.vmComponentList[:]))  # Iterate over a copy of the list
+                time.sleep(10)
+        finally:
+            loop.close()
+
+    async def checkMachines(self, share, vmComponents):
+        """
+        Checks the status of all components at once, a slow machine only delays its own status.
+
+        Args:
+            share (AsyncNetworkShare): Runs the checks within the limits per machine.
+            vmComponents (list): The components to check.
+        """
+        async def check(vmComponent):
+            machine = vmComponent.hostname[vmComponent.number]
+            try:
+                status = await share.run(machine, self.getMachineStatusWithRetry, machine)
+                if not self.running:
+                    return
+                self.update_status.emit(machine, status)
+                if status == "Offline" and vmComponent in self.component.vmComponentList:
+                    self.component.vmComponentList.remove(vmComponent)
+                    print(f"Removed {machine} from the list")
+            except Exception as e:
+                print(f"Failed to get status for {machine}: {e}")
+
+        await asyncio.gather(*(check(vmComponent) for vmComponent in vmComponents))
 
     def stop(self):
         """ stops the worker """
@@ -56,7 +79,8 @@ class StatusWorker(QObject):
         This method will try to get the machine status up to `retry_attempts` times, waiting 
         `retry_delay` seconds between each attempt. If the machine status is "black", it is 
         considered not accessible and will be marked as "Offline". If all attempts fail, the 
-        machine will also be marked as "Offline".
+        machine will also be marked as "Offline". The status is stored in the shared VMHealthRegistry,
+        so every component skips an offline machine.
 
         Args:
             machine (str): The identifier of the machine whose status is to be retrieved.
@@ -74,6 +98,8 @@ class StatusWorker(QObject):
                 if status == "black":  # Assuming "black" means the machine is not accessible
                     self.vmAccessManager.setStatus(machine, "Offline")
                     return "Offline"
+                # The other components see the status as well
+                self.vmAccessManager.setStatus(machine, self.registryStatus.get(status, "Online"))
                 return status
             except Exception as e:
                 print(f"Attempt {attempt + 1} failed: {e}")
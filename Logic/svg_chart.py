@@ -0,0 +1,103 @@
+import math
+from html import escape
+
+
+# Colors of the error patterns, as in the former Google charts
+PIE_COLORS = {".*.": "#FF0000", ".+.": "#0000FF", ".F.": "#DA70D6", ".H.": "#32CD32"}
+
+
+def formatNumber(value):
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+def renderPieChart(title, slices, width=400, height=300):
+    """
+    Renders a pie chart with legend as inline SVG, so the reporter page needs no chart library.
+
+    Args:
+        title (str): The title above the chart.
+        slices (list): (label, count, href) per slice, e.g. (".*.", 3, "./Logfiles_Errors/x_star.html").
+            Slice and legend entry link to href.
+        width (int, optional): Width of the chart in pixels. Defaults to 400.
+        height (int, optional): Height of the chart in pixels. Defaults to 300.
+
+    Returns:
+        str: The <svg> element.
+    """
+    radius = min(width * 0.6, height - 60) / 2
+    cx = 20 + radius
+    cy = 40 + (height - 40) / 2
+    total = sum(count for _, count, _ in slices)
+
+    parts = [
+        f"<svg xmlns='http://www.w3.org/2000/svg' width='{width}' height='{height}' viewBox='0 0 {width} {height}' "
+        f"font-family='Arial, sans-serif'>",
+        f"<rect width='{width}' height='{height}' fill='#fff'/>",
+        f"<text x='{width / 2}' y='24' text-anchor='middle' font-size='18' font-weight='bold'>{escape(title)}</text>",
+    ]
+
+    if total == 0:
+        parts.append(f"<circle cx='{formatNumber(cx)}' cy='{formatNumber(cy)}' r='{formatNumber(radius)}' fill='#e0e0e0'/>")
+        parts.append(f"<text x='{formatNumber(cx)}' y='{formatNumber(cy + 5)}' text-anchor='middle' font-size='14'>Keine Fehler</text>")
+
+    angle = -math.pi / 2  # the first slice starts at the top, clockwise
+    for label, count, href in slices:
+        if total == 0 or count == 0:
+            continue
+        share = count / total
+        color = PIE_COLORS.get(label, "#999999")
+        parts.append(f"<a href='{escape(href)}' target='_blank'><title>{escape(label)}: {count}</title>")
+        if share == 1:
+            parts.append(f"<circle cx='{formatNumber(cx)}' cy='{formatNumber(cy)}' r='{formatNumber(radius)}' fill='{color}'/>")
+        else:
+            end = angle + share * 2 * math.pi
+            x1, y1 = cx + radius * math.cos(angle), cy + radius * math.sin(angle)
+            x2, y2 = cx + radius * math.cos(end), cy + radius * math.sin(end)
+            largeArc = 1 if share > 0.5 else 0
+            parts.append(
+                f"<path d='M{formatNumber(cx)},{formatNumber(cy)} L{formatNumber(x1)},{formatNumber(y1)} "
+                f"A{formatNumber(radius)},{formatNumber(radius)} 0 {largeArc} 1 {formatNumber(x2)},{formatNumber(y2)} Z' "
+                f"fill='{color}' stroke='#fff' stroke-width='1'/>")
+        if share >= 0.05:
+            middle = angle + share * math.pi
+            tx, ty = cx + radius * 0.6 * math.cos(middle), cy + radius * 0.6 * math.sin(middle)
+            parts.append(f"<text x='{formatNumber(tx)}' y='{formatNumber(ty + 5)}' text-anchor='middle' font-size='14' "
+                         f"fill='#fff'>{round(share * 100, 1):g}%</text>")
+        parts.append("</a>")
+        angle += share * 2 * math.pi
+
+    legendX = cx + radius + 30
+    for row, (label, count, href) in enumerate(slices):
+        y = cy - len(slices) * 12 + row * 24
+        color = PIE_COLORS.get(label, "#999999")
+        parts.append(
+            f"<a href='{escape(href)}' target='_blank'>"
+            f"<rect x='{formatNumber(legendX)}' y='{formatNumber(y)}' width='14' height='14' fill='{color}'/>"
+            f"<text x='{formatNumber(legendX + 20)}' y='{formatNumber(y + 12)}' font-size='16' font-weight='bold'>"
+            f"{escape(label)} ({count})</text></a>")
+
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def renderProgressBar(progressId, progress=0):
+    """
+    Renders a progress bar as inline SVG. The page changes the width of `<progressId>_bar` and the text of
+    `<progressId>_text` when the progress changes.
+
+    Args:
+        progressId (str): The id of the progress bar.
+        progress (int, optional): The progress in percent. Defaults to 0.
+
+    Returns:
+        str: The <svg> element.
+    """
+    progress = max(0, min(100, progress or 0))
+    return (
+        f"<svg id='{progressId}' class='progress-bar' xmlns='http://www.w3.org/2000/svg' width='100%' height='30' "
+        f"font-family='Arial, sans-serif'>"
+        "<rect width='100%' height='30' rx='15' fill='#e0e0e0'/>"
+        f"<rect id='{progressId}_bar' width='{progress}%' height='30' rx='15' fill='#76c7c0'/>"
+        f"<text id='{progressId}_text' x='50%' y='20' text-anchor='middle' font-size='14'>{progress}%</text>"
+        "</svg>"
+    )
@@ -1,7 +1,6 @@
 import os
 import re
 import json
-import time
 from Configurations.networkshare import NetworkShare
 from Configurations.read_fault import ReadFault
 
@@ -21,44 +20,26 @@ class TestCaseAnalyzer:
         Returns:
             tuple: A tuple containing the number of starting tests and total tests.
                    Returns (None, None) if the file is not found or an error occurs.
-        Raises:
-            FileNotFoundError: If the overview file is not found after all retry attempts.
-            IOError: If an I/O error occurs after all retry attempts.
-            Exception: If any other exception occurs after all retry attempts.
+        Notes:
+            - The file is streamed block by block with `ReadFault.iterOverviewBlocks`, which also retries opening it.
+              The scan stops at the first matching block, usually within the first chunk. The shared reader of the
+              category only keeps the highest number per total, not the first one.
         """
         try:
             overview_path = os.path.join(self.readFault.getVersionPath(masch), category, "uebersicht.txt")
-            retry_attempts = 5
-            retry_delay = 10  # in seconds
-
-            for attempt in range(retry_attempts):
-                try:
-                    with self.networkShare.openFileVMUser(overview_path, masch,'r') as file:
-                        for line in file:
-                            match = re.search(rf"Start TF:.*?\((\d+) von ({countedTCNumbergetByJson})\)", line)
-                            if match:
-                                starting_tests = int(match.group(1))
-                                total_tests = int(match.group(2))
-                                print(f"Starting Tests: {starting_tests}, Total Tests: {total_tests}")
-                                return starting_tests, total_tests
-                except FileNotFoundError as fnf_error:
-                    if attempt == (retry_attempts - 1):
-                        print(f"Attempt {attempt + 1} failed: FileNotFoundError: {fnf_error}")
-                except IOError as io_error:
-                    if attempt == (retry_attempts - 1):
-                        print(f"Attempt {attempt + 1} failed: IOError: {io_error}")
-                except Exception as e:
-                    if attempt == (retry_attempts - 1):
-                        print(f"Attempt {attempt + 1} failed: {e}")
-                if attempt < retry_attempts - 1:
-                    time.sleep(retry_delay)
+            for block in self.readFault.iterOverviewBlocks(masch, overview_path):
+                if block.total is not None and str(block.total) == str(countedTCNumbergetByJson):
+                    starting_tests = block.number
+                    total_tests = block.total
+                    print(f"Starting Tests: {starting_tests}, Total Tests: {total_tests}")
+                    return starting_tests, total_tests
         except Exception as e:
             print(e)
         return None, None
 
 
     def extractDataFromJson(self, json_path):
-        with open(json_path, 'r', encoding='utf-8') as file:
+        with self.networkShare.openCachedFile(json_path, 'utf-8') as file:
             data = json.load(file)
         return data
         
@@ -100,7 +81,7 @@ class TestCaseAnalyzer:
         :return: Ein Dictionary mit den Kategorienamen als Schlüssel und der Anzahl der Testfälle als Werte.
         """
         try:
-            with open(self.getJsonFile(jsonPattern), 'r', encoding='utf-8') as file:
+            with self.networkShare.openCachedFile(self.getJsonFile(jsonPattern), 'utf-8') as file:
                 data = json.load(file)
             
             test_cases = data.get("TestfaelleJeKategorien", [])
@@ -1,9 +1,23 @@
 from typing import Literal
 
+from Logic.vm_health_registry import VMHealthRegistry
+
 class VMAccessManager():
+    """
+    Access to the status of the virtual machines. All instances share the VMHealthRegistry of the process,
+    a status set by one component is seen by all others.
+    """
 
     def __init__(self):
-        self.machineList = {}
+        self.registry = VMHealthRegistry.shared()
+
+    @property
+    def machineList(self):
+        """
+        Returns:
+            dict: The current status per machine (a copy, expired statuses are left out).
+        """
+        return self.registry.getStatuses()
 
     def getStatus(self, machine):
         """
@@ -13,10 +27,18 @@ class VMAccessManager():
             machine (str): The identifier of the machine whose status is to be retrieved.
 
         Returns:
-            str: The status of the specified machine, or None if the machine is not found.
+            str: The status of the specified machine, or None if the machine is not found or its status expired.
         """
-        return self.machineList.get(machine)
-    
+        return self.registry.getStatus(machine)
+
+
+    def isOffline(self, machine):
+        """
+        Returns:
+            bool: True if the machine is marked "Offline", remote I/O to it is skipped.
+        """
+        return self.registry.getStatus(machine) == "Offline"
+
 
     def setStatus(self, machine: str, status: Literal["Offline", "Online", "Error", "Running"]):
         """
@@ -29,8 +51,8 @@ class VMAccessManager():
         Returns:
             None
         """
-        self.machineList[machine] = status
-        print(f"setStatus {machine} - {status}")
+        if self.registry.setStatus(machine, status):
+            print(f"setStatus {machine} - {status}")
 
 
     def delMachine(self, machine):
@@ -43,5 +65,12 @@ class VMAccessManager():
         Prints:
             str: A message indicating that the machine has been deleted in the StatusWorkerLoop.
         """
-        print(machine+" deleted in the StatusWorkerLoop") 
-        del self.machineList[machine]
\ No newline at end of file
+        print(machine+" deleted in the StatusWorkerLoop")
+        self.registry.delMachine(machine)
+
+
+    def recordCall(self, machine, latency=None, failed=False):
+        """
+        Adds a remote call to the latency and error rate of a machine, see `VMHealthRegistry.recordCall`.
+        """
+        self.registry.recordCall(machine, latency, failed)
@@ -0,0 +1,179 @@
+import os
+import time
+import threading
+
+
+class VMHealth:
+    """
+    Health of one virtual machine at one point in time. Never changed after it was created, the registry
+    replaces it, so a reader always sees a consistent state without a lock.
+    """
+    __slots__ = ("machine", "status", "updated", "lastSeen", "latency", "errorRate", "calls")
+
+    def __init__(self, machine, status=None, updated=0.0, lastSeen=None, latency=None, errorRate=0.0, calls=0):
+        self.machine = machine
+        self.status = status        # "Offline", "Online", "Error", "Running" or None (unknown)
+        self.updated = updated      # time.monotonic() of the last status
+        self.lastSeen = lastSeen    # time.time() of the last successful remote call
+        self.latency = latency      # rolling average of the successful calls in seconds
+        self.errorRate = errorRate  # rolling share of the calls that could not reach the machine
+        self.calls = calls
+
+
+    def replace(self, **changes):
+        values = {name: getattr(self, name) for name in VMHealth.__slots__}
+        values.update(changes)
+        return VMHealth(**values)
+
+
+class VMHealthRegistry:
+    """
+    Process-wide health of the virtual machines, see `shared`. All VMAccessManager instances read and write it,
+    so a machine the StatusWorker marked "Offline" is skipped by HTMLData, ReadFault, Change and NetworkShare too.
+
+    Per machine it holds the status, the time the machine was last reached and the rolling latency and error
+    rate of the remote calls (weight VM_HEALTH_SMOOTHING of the newest call, default 0.2). A status expires
+    VM_HEALTH_TTL seconds (default 60) after it was set, the machine is then tried again.
+
+    Reads take no lock. Listeners are told about every change of a status by `setStatus` and `delMachine`,
+    an expiry is noticed by the next read and not announced.
+    """
+
+    # Shared by all VMAccessManager instances, see shared()
+    instance = None
+    instanceLock = threading.Lock()
+
+    def __init__(self, ttl=None, smoothing=None):
+        self.ttl = ttl if ttl is not None else float(os.getenv("VM_HEALTH_TTL", 60))
+        self.smoothing = smoothing if smoothing is not None else float(os.getenv("VM_HEALTH_SMOOTHING", 0.2))
+        self.machines = {}  # machine -> VMHealth, entries are replaced, never changed
+        self.listeners = []
+        self.lock = threading.Lock()
+
+
+    @classmethod
+    def shared(cls):
+        """
+        Returns:
+            VMHealthRegistry: The process-wide registry.
+        """
+        with cls.instanceLock:
+            if cls.instance is None:
+                cls.instance = cls()
+            return cls.instance
+
+
+    def addListener(self, listener):
+        """
+        Registers a function that is called after the status of a machine changed.
+
+        Args:
+            listener (callable): Called as listener(machine, oldStatus, newStatus), outside the lock of the registry.
+        """
+        with self.lock:
+            if listener not in self.listeners:
+                self.listeners.append(listener)
+
+
+    def removeListener(self, listener):
+        """
+        Args:
+            listener (callable): A function registered with addListener.
+        """
+        with self.lock:
+            if listener in self.listeners:
+                self.listeners.remove(listener)
+
+
+    def getHealth(self, machine):
+        """
+        Args:
+            machine (str): The machine identifier.
+
+        Returns:
+            VMHealth: The health of the machine, None if nothing was recorded for it. The status of an expired
+            entry is None.
+        """
+        health = self.machines.get(machine)
+        if health is not None and health.status is not None and self.isExpired(health):
+            return health.replace(status=None)
+        return health
+
+
+    def getStatus(self, machine):
+        """
+        Returns:
+            str: The status of the machine, None if it is unknown or expired.
+        """
+        health = self.machines.get(machine)
+        if health is None or self.isExpired(health):
+            return None
+        return health.status
+
+
+    def isExpired(self, health):
+        return time.monotonic() - health.updated > self.ttl
+
+
+    def getStatuses(self):
+        """
+        Returns:
+            dict: The status per machine that is not expired.
+        """
+        return {machine: health.status for machine, health in list(self.machines.items())
+                if health.status is not None and not self.isExpired(health)}
+
+
+    def setStatus(self, machine, status):
+        """
+        Sets the status of a machine, which expires after `ttl` seconds.
+
+        Returns:
+            bool: True if the status changed (an expired status counts as unknown).
+        """
+        with self.lock:
+            health = self.machines.get(machine) or VMHealth(machine)
+            oldStatus = None if self.isExpired(health) else health.status
+            self.machines[machine] = health.replace(status=status, updated=time.monotonic())
+            listeners = list(self.listeners) if oldStatus != status else []
+        self.notify(listeners, machine, oldStatus, status)
+        return oldStatus != status
+
+
+    def delMachine(self, machine):
+        """
+        Forgets a machine.
+        """
+        with self.lock:
+            health = self.machines.pop(machine, None)
+            oldStatus = health.status if health is not None and not self.isExpired(health) else None
+            listeners = list(self.listeners) if oldStatus is not None else []
+        self.notify(listeners, machine, oldStatus, None)
+
+
+    def recordCall(self, machine, latency=None, failed=False):
+        """
+        Adds a remote call to the rolling latency and error rate of a machine.
+
+        Args:
+            machine (str): The machine identifier.
+            latency (float, optional): The duration of a successful call in seconds. Defaults to None.
+            failed (bool, optional): True if the call could not reach the machine. Defaults to False.
+        """
+        with self.lock:
+            health = self.machines.get(machine) or VMHealth(machine)
+            changes = {"calls": health.calls + 1,
+                       "errorRate": health.errorRate + self.smoothing * ((1.0 if failed else 0.0) - health.errorRate)}
+            if not failed:
+                changes["lastSeen"] = time.time()
+                if latency is not None:
+                    changes["latency"] = latency if health.latency is None else health.latency + self.smoothing * (latency - health.latency)
+            self.machines[machine] = health.replace(**changes)
+
+
+    def notify(self, listeners, machine, oldStatus, newStatus):
+        for listener in listeners:
+            try:
+                listener(machine, oldStatus, newStatus)
+            except Exception as e:
+                print(f"Error notifying listener of {machine}: {e}")
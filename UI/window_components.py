@@ -431,12 +431,12 @@ class WindowComponents(QWidget):
 
         for category in self.readFault.dictMachineErrors[machine]:
 
+            counts = self.readFault.getErrorCounts(machine, category)
             for pattern in self.readFault.errorList:
                 if self.vmAccessManager.getStatus(machine) == "Offline":
                     break
                 if pattern != ".H.":
-                    count = self.readFault.getErrorsForPattern(machine, category, pattern)
-                    error_count += len(count)
+                    error_count += counts.get(pattern, 0)
         return error_count
 
     def isMachineRunningWithError(self, machine, error_count):
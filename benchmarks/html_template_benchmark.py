@@ -0,0 +1,62 @@
+"""
+Per-render cost of the report templates: reading the file and chaining `str.replace` (before HTMLTemplate)
+against `HTMLTemplate.render` (including the mtime check):
+
+    python benchmarks/html_template_benchmark.py
+
+Prints the best of 5 runs per case in microseconds and checks that both ways give the same output.
+"""
+import os
+import sys
+import timeit
+
+# The template paths are relative to the repository root, like in HTMLData
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from Logic.html_template import HTMLTemplate
+
+REPORT_TEMPLATE_PATH = "./Resources/Logfiles_Template/html_reportertemplate.html"
+LOGFILE_TEMPLATE_PATH = "./Resources/Logfiles_Template/html_logfiletemplate.html"
+REPORT_PLACEHOLDERS = ["[!!INFOPFAD!!]", "[!!TABLEHERE!!]", "[!!NameOfMasch!!]", "[!!DATAFILE!!]"]
+LOGFILE_PLACEHOLDERS = ["[!!LOGS-HERE!!]", "[!!NameOfMasch!!]", "[!!Error!!]", "[[!!Category!!]]"]
+
+
+def renderWithReplace(path, values):
+    """The former way: read the template for every page and replace one placeholder after the other."""
+    with open(path, "r") as f:
+        content = f.read()
+    for placeholder, value in values.items():
+        content = content.replace(placeholder, value)
+    return content
+
+
+def logfileValues(messages):
+    # One rendered record is about 70 bytes, like the messages of ReadFault.renderErrorMessages
+    logs = "".join(f"Start TF: Testfall_{i} ({i} von {messages})<br>.*. Fehler in Zeile {i}<br><br>\n"
+                   for i in range(1, messages + 1))
+    return {"[!!LOGS-HERE!!]": logs, "[!!NameOfMasch!!]": "VM01", "[!!Error!!]": ".*.", "[[!!Category!!]]": "Kategorie_1"}
+
+
+def reportValues(tableSize):
+    row = "<tr><td>Kategorie_1</td><td>120</td><td>3</td><td>0</td><td>1</td><td>0</td></tr>\n"
+    return {"[!!INFOPFAD!!]": "\\\\VM01\\ergebnis\\Modul_1\\05-2024\\LT123", "[!!TABLEHERE!!]": row * (tableSize // len(row)),
+            "[!!NameOfMasch!!]": "VM01", "[!!DATAFILE!!]": "VM01_reporter_data.js"}
+
+
+def measure(label, path, placeholders, values, number=200):
+    template = HTMLTemplate(path, placeholders)
+    if template.render(values) != renderWithReplace(path, values):
+        raise AssertionError(f"{label}: output differs")
+    before = min(timeit.repeat(lambda: renderWithReplace(path, values), number=number, repeat=5)) / number
+    after = min(timeit.repeat(lambda: template.render(values), number=number, repeat=5)) / number
+    size = sum(len(value) for value in values.values()) // 1024
+    print(f"{label:28} {size:5} KiB   before {before * 1e6:9.1f} us   after {after * 1e6:7.1f} us")
+
+
+if __name__ == "__main__":
+    print(f"Python {sys.version.split()[0]}, per render, best of 5")
+    for messages in (10, 1000, 10000):
+        measure(f"logfile page, {messages} messages", LOGFILE_TEMPLATE_PATH, LOGFILE_PLACEHOLDERS, logfileValues(messages))
+    measure("reporter page", REPORT_TEMPLATE_PATH, REPORT_PLACEHOLDERS, reportValues(60 * 1024))